@@ -14,8 +14,9 @@ import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
 from libraries import *
+import sources
 
-INPUT_FILE = os.path.join("data_extraction", "APC_dataverse.txt.gz")
+INPUT_FILE = sources.DATAVERSE_FILE
 OUTPUT_DIR = "data"
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -42,7 +43,8 @@ def map_oa_status(status: str) -> str:
 
 def process_apc_data():
     print(f"Loading {INPUT_FILE}...")
-    df = load_csv(INPUT_FILE, separator='\t', encoding="utf8-lossy")
+    df = sources.scan_source("dataverse").select(
+        ["Journal", "Publisher", "OA_status", "APC_EUR", "APC_year", "APC_provided"]).collect()
 
     print(f"  Raw rows: {df.height}")
 
@@ -51,18 +53,14 @@ def process_apc_data():
     print(f"  After filtering APC_provided=='yes': {df.height}")
 
     # Clean journal names
-    df = df.with_columns(
-        pl.col("Journal").map_elements(clean_journal_name, return_dtype=pl.Utf8).alias("Journal")
-    )
+    df = map_unique(df, "Journal", clean_journal_name)
 
     # Map OA_status to Business model
-    df = df.with_columns(
-        pl.col("OA_status").map_elements(map_oa_status, return_dtype=pl.Utf8).alias("Business model")
-    )
+    df = map_unique(df, "OA_status", map_oa_status, alias="Business model")
 
     # Format APC_EUR as integer
-    df = df.with_columns(
-        pl.col("APC_EUR").cast(pl.Utf8).map_elements(format_APC, return_dtype=pl.Utf8).cast(pl.Int64, strict=False).alias("APC_EUR")
+    df = map_unique(df.with_columns(pl.col("APC_EUR").cast(pl.Utf8)), "APC_EUR", format_APC).with_columns(
+        pl.col("APC_EUR").cast(pl.Int64, strict=False)
     )
 
     # Drop rows with no valid APC
@@ -102,10 +100,7 @@ def process_apc_data():
 
     # Compute last recorded APC: the value from the most recent year that has data
     pivoted = pivoted.with_columns(
-        pl.struct(year_cols).map_elements(
-            lambda s: next((s[col] for col in reversed(year_cols) if s[col] is not None), None),
-            return_dtype=pl.Int64
-        ).alias("APC (€)")
+        pl.coalesce([pl.col(c) for c in reversed(year_cols)]).cast(pl.Int64).alias("APC (€)")
     )
 
     # Sort by Journal name
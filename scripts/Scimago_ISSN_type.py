@@ -23,10 +23,11 @@ import time
 import urllib.error
 import urllib.request
 import polars as pl
-from libraries import format_issn, load_csv
+from libraries import format_issn_expr
+import sources
 
 
-SCIMAGO_FILE = os.path.join("data_extraction", "scimagojr.csv.gz")
+SCIMAGO_FILE = sources.SCIMAGO_FILE
 ISSN_TYPE_FILE = os.path.join("config", "ISSN_type.csv")
 ISSN_PORTAL_BASE = "https://portal.issn.org/resource/ISSN"
 RATE_LIMIT_DELAY = 0.0  # seconds between API calls
@@ -180,18 +181,17 @@ def save_issn_cache(new_rows: list[dict]) -> None:
 
 
 def extract_scimago_issns() -> set[str]:
-    """Extract and normalise all unique ISSNs from the Scimago dataset."""
-    df = load_csv(SCIMAGO_FILE, separator=";")
-    assert "Issn" in df.columns, f"'Issn' column not found in {SCIMAGO_FILE}"
-
-    issns: set[str] = set()
-    for raw_cell in df["Issn"].to_list():
-        if raw_cell is None:
-            continue
-        for part in str(raw_cell).split(","):
-            formatted = format_issn(part.strip())
-            if formatted is not None:
-                issns.add(formatted)
+    """Extract and normalise all unique ISSNs from the Scimago dataset.
+    ISSNs with a wrong check digit are skipped (the ISSN Portal has no record for them).
+    """
+    lf = sources.scan_source("scimago")
+    assert "Issn" in lf.collect_schema().names(), f"'Issn' column not found in {SCIMAGO_FILE}"
+    df = lf.select("Issn").collect()
+
+    parts = df.select(pl.col("Issn").cast(pl.Utf8).str.split(",").explode().alias("ISSN"))
+    issns = set(
+        parts.select(format_issn_expr("ISSN", validate_check_digit=True)).to_series().drop_nulls().to_list()
+    )
 
     assert len(issns) > 0, f"No valid ISSNs extracted from {SCIMAGO_FILE}"
     return issns
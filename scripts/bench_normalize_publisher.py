@@ -0,0 +1,164 @@
+"""bench_normalize_publisher.py — Time publisher normalization on the DOAJ Publisher column.
+
+Usage:
+    python3 ./scripts/bench_normalize_publisher.py [--repeat N]
+
+Times, on the same distinct names of the DOAJ Publisher column (the memo only ever sends
+distinct names to the normalizer), the elif chain that PUBLISHER_RULES replaced (copied
+below), the scalar normalize_publisher and the vectorized normalize_publisher_series. Each
+is timed on growing subsets of the names, to check MEMO_BATCH_MIN_MISSES, and all three
+must give the same names. The normalizer memo is bypassed.
+"""
+
+import argparse
+import time
+import polars as pl
+import sources
+from libraries import MEMO_BATCH_MIN_MISSES, clean_string, normalize_publisher, normalize_publisher_series
+
+# Subset sizes timed, besides all the distinct names
+SUBSET_SIZES = [50, 250, 1000, MEMO_BATCH_MIN_MISSES]
+
+
+# Reference: normalize_publisher before PUBLISHER_RULES, unchanged
+def elif_chain_normalize_publisher(name: str) -> str:
+    """
+    Normalize publisher names to standard forms.
+    1. Map known variants to standard names.
+    2. Remove " Inc." suffix.
+    3. Handle specific known encoding issues.
+    4. Trim leading/trailing spaces.
+    5. Return empty string if name is None.
+    """
+    if name is None:
+        return ""
+    name_lower = name.lower()
+    if "BMC" in name or "biomed central" in name_lower:
+        return "Springer Nature (BioMed Central)"
+    elif "springer" in name_lower or "nature" == name_lower or "nature publishing group" in name_lower or "nature research" in name_lower or "nature portfolio" in name_lower:
+        return "Springer Nature"
+    elif "wiley" in name_lower:
+        return "John Wiley & Sons"
+    elif "de gruyter" in name_lower or "brill" in name_lower:
+        return "De Gruyter Brill"
+    elif "karger" in name_lower:
+        return "Karger Publishers"
+    elif "inderscience" in name_lower:
+        return "Inderscience Publishers"
+    elif ("taylor" in name_lower) and ("francis" in name_lower) and ("(" not in name_lower):
+        return "Taylor & Francis Group"
+    elif ("taylor" in name_lower) and ("francis" in name_lower):
+        return "Taylor & Francis Group (" + name.split("(", 1)[1]
+    elif "PeerJ" in name:
+        return "Taylor & Francis Group (PeerJ)"
+    elif ("sage" in name_lower) and ("(" not in name_lower):
+        return "Sage Publishing"
+    elif "sage publishing" in name_lower:
+        return "Sage Publishing (" + name.split("(", 1)[1]
+    elif "Cell" == name or "cell press" in name_lower:
+        return "Elsevier (Cell Press)"
+    elif "academic press" in name_lower:
+        return "Elsevier (Academic Press)"
+    elif "elsevier" in name_lower:
+        return "Elsevier"
+    elif "frontiers" in name_lower:
+        return "Frontiers Media SA"
+    elif "BMJ" in name:
+        return "BMJ Group"
+    elif "BioOne Complete" in name:
+        return "BioOne"
+    elif "OUP" in name or "oxford university press" in name_lower:
+        return "Oxford University Press (OUP)"
+    elif "CUP" in name or "cambridge university press" in name_lower:
+        return "Cambridge University Press (CUP)"
+    elif "AAAS" in name or "american association for the advancement of science" in name_lower:
+        return "American Association for the Advancement of Science (AAAS)"
+    elif "AACR" in name or "american association for cancer research" in name_lower:
+        return "American Association for Cancer Research (AACR)"
+    elif "ACS" in name or "american chemical society" in name_lower:
+        return "American Chemical Society (ACS)"
+    elif "AMA" in name or "american medical association" in name_lower:
+        return "American Medical Association (AMA)"
+    elif "APA" in name or "american psychological association" in name_lower:
+        return "American Psychological Association (APA)"
+    elif "APS" in name or "american physiological society" in name_lower:
+        return "American Physiological Society (APS)"
+    elif "ASM" in name or "american society for microbiology" in name_lower:
+        return "American Society for Microbiology (ASM)"
+    elif "ERS" in name or "european respiratory society" in name_lower:
+        return "European Respiratory Society (ERS)"
+    elif "public library of science" in name_lower or "plos" in name_lower:
+        return "Public Library of Science (PLoS)"
+    elif "PCI" in name or "peer community in" in name_lower:
+        return "Peer Community In"
+    elif "annual reviews" in name_lower:
+        return "Annual Reviews"
+    elif "lippincott" in name_lower and "williams" in name_lower and "wilkins" in name_lower:
+        return "Wolters Kluwer (Lippincott)"
+    elif "ovid technologies" in name_lower:
+        return "Wolters Kluwer (Ovid Technologies)"
+    elif "wolters kluwer" in name_lower and "(" not in name_lower and ")" not in name_lower:
+        return "Wolters Kluwer"
+    elif "bioscientifica" in name_lower:
+        return "Bioscientifica Ltd"
+    elif "mary ann liebert" in name_lower:
+        return "Sage Publishing (Mary Ann Liebert)"
+    elif "pensoft publishers" in name_lower or "pensoft" in name_lower:
+        return "Pensoft Publishers"
+    elif "CSIRO" in name or "commonwealth scientific and industrial research organisation" in name_lower:
+        return "CSIRO Publishing"
+    elif "MIT" in name and "mit press" in name_lower:
+        return "MIT Press"
+    elif "john libbey" in name_lower or "JLE" in name:
+        return "John Libbey Eurotext"
+    elif "national" in name_lower and "histoire" in name_lower and "naturelle" in name_lower:
+        return "Muséum national d'Histoire naturelle (MNHN)"
+    elif "korean society for microbiology and biotechnology" in name_lower or "KSBMB" in name:
+        return "Korean Society for Microbiology and Biotechnology (KSBMB)"
+    elif "cold spring harbor" in name_lower:
+        return "Cold Spring Harbor (CSH) Laboratory Press"
+    elif "pagepress" in name_lower or "page press publications" in name_lower:
+        return "PAGEPress Publications"
+    elif "PUF" in name or "presses universitaires de france" in name_lower:
+        return "Presses Universitaires de France (PUF)"
+    elif "company of biologists" in name_lower:
+        return "The Company of Biologists"
+    elif "royal society publishing" in name_lower or "the royal society" in name_lower:
+        return "The Royal Society"
+    elif "EDP Sciences" in name or "china science publishing & media" in name_lower:
+        return "China Science Publishing & Media (EDP Sciences)"
+    return str(clean_string(name))
+
+
+def best_time(fn, repeat: int) -> tuple[float, list]:
+    """Best wall time of repeat calls of fn, in seconds, with the result of the last call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark normalize_publisher on the DOAJ Publisher column.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation (default: 5).")
+    args = parser.parse_args()
+
+    publishers = sources.scan_source("doaj").select(pl.col("Publisher").cast(pl.Utf8)).collect().to_series()
+    names = publishers.drop_nulls().unique(maintain_order=True).to_list()
+    print(f"DOAJ Publisher: {publishers.len()} rows, {len(names)} distinct")
+
+    print(f"{'names':>8} {'elif chain':>12} {'scalar':>12} {'series':>12}")
+    for size in [n for n in SUBSET_SIZES if n < len(names)] + [len(names)]:
+        subset = names[:size]
+        t_chain, chain = best_time(lambda: [elif_chain_normalize_publisher(n) for n in subset], args.repeat)
+        t_scalar, scalar = best_time(lambda: [normalize_publisher(n) for n in subset], args.repeat)
+        t_series, series = best_time(
+            lambda: normalize_publisher_series(pl.Series(subset, dtype=pl.Utf8)).to_list(), args.repeat)
+        assert chain == scalar == series, "normalize_publisher implementations disagree"
+        print(f"{size:>8} {t_chain * 1000:>9.1f} ms {t_scalar * 1000:>9.1f} ms {t_series * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""check_norm_name.py — Check that norm_name_expr gives the same keys as norm_name.
+
+Usage:
+    python3 ./scripts/check_norm_name.py
+
+Runs the Python norm_name and the vectorized norm_name_expr on every distinct journal
+title of the Scimago, DOAJ and OpenAPC dumps in data_extraction/, and fails listing the
+titles whose keys differ. Run it after changing either implementation or its rule tables.
+"""
+
+import sys
+import polars as pl
+import sources
+from libraries import norm_name, norm_name_expr
+
+# Source name -> title columns matched on norm_name by update_extracted.py
+TITLE_COLUMNS = {
+    "scimago": ["Title"],
+    "doaj": ["Journal title", "Alternative title"],
+    "openapc": ["journal_full_title"],
+}
+
+# Mismatches printed per source
+MAX_PRINTED = 20
+
+
+def title_mismatches(source: str, columns: list[str]) -> pl.DataFrame:
+    """Distinct non-null titles of source with their norm_name and norm_name_expr keys, when they differ."""
+    titles = (
+        sources.scan_source(source)
+        .select(pl.concat_list([pl.col(c).cast(pl.Utf8) for c in columns]).alias("title"))
+        .explode("title")
+        .drop_nulls()
+        .unique()
+        .collect()
+    )
+    keys = titles.with_columns(
+        pl.col("title").map_elements(norm_name, return_dtype=pl.Utf8).alias("norm_name"),
+        norm_name_expr("title").alias("norm_name_expr"),
+    )
+    print(f"{source}: {titles.height} distinct titles in {', '.join(columns)}")
+    return keys.filter(pl.col("norm_name") != pl.col("norm_name_expr"))
+
+
+def main() -> None:
+    failed = False
+    for source, columns in TITLE_COLUMNS.items():
+        mismatches = title_mismatches(source, columns)
+        if mismatches.height:
+            failed = True
+            print(f"{source}: {mismatches.height} titles with different keys")
+            for title, expected, got in mismatches.head(MAX_PRINTED).iter_rows():
+                print(f"\t{title!r}: norm_name={expected!r}, norm_name_expr={got!r}")
+    if failed:
+        sys.exit(1)
+    print("norm_name_expr matches norm_name on every title.")
+
+
+if __name__ == "__main__":
+    main()
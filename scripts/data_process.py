@@ -1,8 +1,14 @@
 # From the list of .csv files in the 'data_extracted' directory, process each file to have it formatted with specific columns and write them to a new directory 'data'.
 # Create one more csv file in the 'data' directory: all_biology.csv containing all entries (deduplicated if necessary).
+import argparse
+import contextlib
+import io
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
 from libraries import *
+import sources
 
 INPUT_DIR = "data_extracted"
 OUTPUT_DIR = "data"
@@ -30,6 +36,9 @@ EXPECTED_COLUMNS = [
     "p-ISSN",
 ]
 
+# ISSN columns linking duplicate journals (see cluster_duplicates)
+DEDUP_ISSN_COLS = ["e-ISSN", "p-ISSN", "ISSN-L"]
+
 dico_field_normalization = {
     "all_biology": "All Fields",
     "anatomy_physiology": "Anatomy & Physiology",
@@ -78,234 +87,183 @@ def is_valid_value(val) -> bool:
     return val is not None and str(val).strip() != "" and str(val).lower() != "nan"
 
 
-def collect_valid_values(entries: list[dict], field: str) -> list:
-    """Collect all valid values for a field from entries."""
-    return [entry.get(field) for entry in entries if is_valid_value(entry.get(field))]
+# Columns merged by keeping their highest numeric value (see merge_duplicate_clusters)
+NUMERIC_MAX_FIELDS = ["APC Euros", "H index", "Scimago Rank"]
 
 
-def merge_field_values(values: list) -> str:
-    """Merge Field values by collecting unique values and joining alphabetically with '; '.
-    Skip None/empty values.
-    Returns concatenated string.
-    """
-    # Collect unique non-empty field values
-    unique_fields = set()
-    for v in values:
-        if is_valid_value(v):
-            unique_fields.add(str(v).strip())
-
-    if len(unique_fields) > 3:
-        print(
-            f"\t[merge_field_values] WARNING: More than 3 unique Field values found: {unique_fields} from options={values}")
-        unique_fields = set([f.split("-")[0].strip() for f in unique_fields])
-        print(f"\t[merge_field_values] After simplification, unique Field values: {unique_fields}")
-
-    # Sort alphabetically and join with "; "
-    if not unique_fields:
-        return None
+def valid_value_expr(col: str) -> pl.Expr:
+    """Expression counterpart of is_valid_value."""
+    as_str = pl.col(col).cast(pl.Utf8)
+    return pl.col(col).is_not_null() & (as_str.str.strip_chars() != "") & (as_str.str.to_lowercase() != "nan")
 
-    sorted_fields = sorted(unique_fields)
-    conflict = None
-    if len(unique_fields) > 1:
-        conflict = f"Field: concat='{'; '.join(sorted_fields)}' from options={values}"
-    return "; ".join(sorted_fields), conflict
 
+def merge_duplicate_clusters(df_norm: pl.DataFrame, columns: list[str],
+                             concat_fields: bool) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Merge the rows of each duplicate cluster (cluster_id, see cluster_duplicates) into one row.
 
-def merge_numeric_field(values: list, field: str) -> tuple[any, str | None]:
-    """Merge numeric field by keeping highest value. Returns (best_value, conflict_msg or None)."""
-    numeric_values = []
-    for v in values:
-        try:
-            numeric_values.append((float(v), v))
-        except (ValueError, TypeError):
-            pass
+    Only valid values (is_valid_value) are merged; a column with a single valid value keeps it:
+    - NUMERIC_MAX_FIELDS: highest numeric value (the first valid value if none is numeric)
+    - Field, when concat_fields: unique stripped values sorted and joined with "; ". With more
+      than 3 of them, each is first simplified to its part before "-"
+    - other EXPECTED_COLUMNS: longest value
+    - remaining columns: first valid value
+    Ties go to the first row of the cluster.
 
-    if not numeric_values:
-        return values[0], None
-
-    numeric_values.sort(key=lambda x: x[0], reverse=True)
-    best_val = numeric_values[0][1]
+    Args:
+        df_norm: Rows with cluster_id, in their original order.
+        columns: Columns to merge and return.
+        concat_fields: Whether to concatenate Field values instead of picking one.
 
-    # Check for conflicts
-    unique_nums = set(nv[0] for nv in numeric_values)
-    conflict = None
-    if len(unique_nums) > 1:
-        conflict = f"{field}: kept={best_val} from options={[nv[1] for nv in numeric_values]}"
+    Returns:
+        (one merged row per cluster with cluster_id and columns, merge conflicts with cluster_id,
+        Journal, column, kept, options), both sorted by cluster_id.
+    """
+    aggs = []
+    conflict_cols = []
+    for col in columns:
+        valid = valid_value_expr(col)
+        values = pl.col(col).filter(valid)
+        options = values.cast(pl.Utf8).unique(maintain_order=True).alias(f"_options_{col}")
+        if col not in EXPECTED_COLUMNS:
+            aggs.append(values.first().alias(col))
+        elif col == "Field" and concat_fields:
+            fields = values.cast(pl.Utf8).str.strip_chars().unique()
+            aggs += [values.len().alias("_field_count"), values.first().alias("_field_first"),
+                     fields.alias("_fields"), options]
+            conflict_cols.append(col)
+        elif col in NUMERIC_MAX_FIELDS:
+            as_str = pl.col(col).cast(pl.Utf8).str.strip_chars()
+            parsed = as_str.cast(pl.Float64, strict=False) if df_norm.schema[col] == pl.Utf8 else pl.col(col).cast(pl.Float64)
+            parsed = pl.when(valid).then(parsed)
+            aggs += [pl.coalesce(pl.col(col).filter(parsed == parsed.max()).first(), values.first()).alias(col),
+                     (parsed.drop_nulls().n_unique() > 1).alias(f"_conflict_{col}"), options]
+            conflict_cols.append(col)
+        else:
+            length = pl.col(col).cast(pl.Utf8).str.len_chars()
+            longest = pl.when(valid).then(length)
+            aggs += [pl.col(col).filter(longest == longest.max()).first().alias(col),
+                     (values.n_unique() > 1).alias(f"_conflict_{col}"), options]
+            conflict_cols.append(col)
+
+    duplicates = df_norm.filter(pl.len().over("cluster_id") > 1)
+    merged = duplicates.group_by("cluster_id").agg(aggs).sort("cluster_id")
+    if "Field" in conflict_cols and concat_fields:
+        fields = pl.when(pl.col("_fields").list.len() > 3).then(
+            pl.col("_fields").list.eval(pl.element().str.split("-").list.first().str.strip_chars()).list.unique()
+        ).otherwise(pl.col("_fields")).list.sort()
+        merged = merged.with_columns(fields.alias("_fields")).with_columns(
+            pl.when(pl.col("_field_count") == 1).then(pl.col("_field_first"))
+            .when(pl.col("_field_count") > 1).then(pl.col("_fields").list.join("; "))
+            .alias("Field"),
+            (pl.col("_fields").list.len() > 1).alias("_conflict_Field"),
+        )
 
-    return best_val, conflict
+    conflicts = pl.concat([
+        merged.filter(pl.col(f"_conflict_{col}")).select(
+            "cluster_id",
+            pl.col("Journal").cast(pl.Utf8),
+            pl.lit(col).alias("column"),
+            pl.col(col).cast(pl.Utf8).alias("kept"),
+            pl.col(f"_options_{col}").list.join("; ").alias("options"),
+        )
+        for col in conflict_cols
+    ] + [pl.DataFrame(schema={"cluster_id": pl.UInt32, "Journal": pl.Utf8, "column": pl.Utf8,
+                              "kept": pl.Utf8, "options": pl.Utf8})]).sort("cluster_id", maintain_order=True)
+    return merged.select(["cluster_id"] + [pl.col(c).cast(df_norm.schema[c]) for c in columns]), conflicts
 
 
-def merge_text_field(values: list, field: str) -> tuple[str, str | None]:
-    """Merge text field by keeping longest value. Returns (best_value, conflict_msg or None)."""
-    str_values = [(len(str(v)), str(v)) for v in values]
-    str_values.sort(key=lambda x: x[0], reverse=True)
-    best_val = str_values[0][1]
+def add_dedupe_keys(df: pl.DataFrame, offset: int = 0) -> pl.DataFrame:
+    """Add the normalized journal name (norm_journal) and website (norm_website) of df, and row_idx from offset."""
+    return (
+        map_unique(df.with_columns(norm_journal=norm_name_expr("Journal")), "Website", norm_url, alias="norm_website")
+        .with_row_index("row_idx", offset=offset)
+    )
 
-    # Check for conflicts
-    unique_vals = set(sv[1] for sv in str_values if sv[1])
-    conflict = None
-    if len(unique_vals) > 1:
-        conflict = f"{field}: kept='{best_val}' from options={list(unique_vals)}"
 
-    return best_val, conflict
+def duplicate_keys(df_norm: pl.DataFrame) -> pl.DataFrame:
+    """Non-empty keys linking duplicate rows of df_norm (see add_dedupe_keys), one row per (row_idx, _kind, _key).
 
+    _kind is URL (norm_website), Name (norm_journal) or ISSN (ISSN code of any DEDUP_ISSN_COLS).
+    """
+    issn_cols = [c for c in DEDUP_ISSN_COLS if c in df_norm.columns]
+    return pl.concat([
+        df_norm.select("row_idx", pl.lit("URL").alias("_kind"), pl.col("norm_website").alias("_key"))
+        .filter(pl.col("_key") != ""),
+        df_norm.select("row_idx", pl.lit("Name").alias("_kind"), pl.col("norm_journal").alias("_key"))
+        .filter(pl.col("_key").is_not_null() & (pl.col("_key") != "")),
+    ] + [
+        df_norm.select("row_idx", pl.lit("ISSN").alias("_kind"),
+                       issn_code_expr(format_issn_expr(c)).cast(pl.Utf8).alias("_key"))
+        .filter(pl.col("_key").is_not_null())
+        for c in issn_cols
+    ])
+
+
+def find_root(parent: list[int], i: int) -> int:
+    """Root of row i in the union-find forest parent (with path halving)."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_duplicates(df_norm: pl.DataFrame, source_name: str) -> pl.DataFrame:
+    """Cluster the rows of df_norm that share a normalized website, a normalized journal name or an ISSN.
+
+    Every shared non-empty key links two rows; duplicate groups are the connected components
+    of these links, so a row matching one group by URL and another by name merges both groups.
+    Components are computed with a union-find over the row_idx ids, each row being linked to the
+    first row sharing its key. The cluster id is the first row_idx of the component.
 
-def merge_duplicates(entries: list[dict], all_columns: list[str], concat_fields: bool) -> dict:
-    """Merge duplicate entries by keeping the best information from all duplicates.
-    Args:
-        entries: List of dictionaries representing duplicate rows
-        all_columns: Optional ordered list of all columns to preserve in results
-        concat_fields: Whether to concatenate Field values instead of picking one
     Returns:
-        Merged dictionary with the best values from all entries
-    """
-    if not entries:
-        return {}
-
-    if len(entries) == 1:
-        return {col: entries[0].get(col) for col in all_columns}
-
-    numeric_max_fields = {"APC Euros", "H index", "Scimago Rank"}
-    merged = {}
-    conflicts = []
-
-    # Process each field across all entries for the expected output columns
-    for col in EXPECTED_COLUMNS:
-        if col not in all_columns:
-            continue
-        values = collect_valid_values(entries, col)
-
-        if not values:
-            merged[col] = None
-        elif len(values) == 1:
-            merged[col] = values[0]
-        elif col == "Field" and concat_fields:
-            # Special handling: concatenate unique Field values alphabetically
-            concat_val, conflict = merge_field_values(values)
-            merged[col] = concat_val
-            if conflict:
-                conflicts.append(conflict)
-        elif col in numeric_max_fields:
-            best_val, conflict = merge_numeric_field(values, col)
-            merged[col] = best_val
-            if conflict:
-                conflicts.append(conflict)
-        else:
-            best_val, conflict = merge_text_field(values, col)
-            merged[col] = best_val
-            if conflict:
-                conflicts.append(conflict)
-
-    # For any remaining columns, keep the first non-null entry
-    for col in all_columns:
-        if col in merged:
-            continue
-        values = collect_valid_values(entries, col)
-        merged[col] = values[0] if values else None
-
-    if conflicts:
-        journal_name = merged.get("Journal", "Unknown")
-        print(f"\t[merge_duplicates] WARNING: Conflicts for Journal='{journal_name}':")
-        for conflict in conflicts:
-            print(f"\t\t{conflict}")
-
-    return merged
-
-
-def identify_duplicate_groups(df_norm: pl.DataFrame, source_name: str) -> tuple[dict, dict, int, int]:
-    """Identify duplicate groups by URL and Name. Returns (url_groups, name_groups, url_count, name_count)."""
-    duplicate_groups_by_url = {}
-    duplicate_groups_by_name = {}
-    seen_names = set()
-    seen_urls = set()
-    url_removed_count = 0
-    name_removed_count = 0
-
-    for row in df_norm.select(["row_idx", "norm_journal", "norm_website", "Journal", "Website"]).iter_rows(named=True):
-        idx = row["row_idx"]
-        nj = row["norm_journal"] or ""
-        nw = row["norm_website"] or ""
-
-        # URL duplicate has priority when website is non-empty and already seen
-        if nw and nw in seen_urls:
-            duplicate_groups_by_url.setdefault(nw, []).append(idx)
-            url_removed_count += 1
-            print(f"\t[dedupe:{source_name}] Duplicate (URL) norm_website='{nw}'"
-                  f"\n\t\tJournal='{row['Journal']}', Website='{row['Website']}'")
-            continue
-
-        # Name duplicate fallback
-        if nj in seen_names:
-            duplicate_groups_by_name.setdefault(nj, []).append(idx)
-            name_removed_count += 1
-            print(f"\t[dedupe:{source_name}] Duplicate (Name) norm_journal='{nj}'"
-                  f"\n\t\tJournal='{row['Journal']}', Website='{row['Website']}'")
-            continue
-
-        # Keep this row; register as seen and record as first in its group
-        seen_names.add(nj)
-        duplicate_groups_by_name.setdefault(nj, []).append(idx)
-        if nw:
-            seen_urls.add(nw)
-            duplicate_groups_by_url.setdefault(nw, []).append(idx)
-
-    return duplicate_groups_by_url, duplicate_groups_by_name, url_removed_count, name_removed_count
-
-
-def dedupe_by_journal_and_website(df: pl.DataFrame, source_name: str, concat_fields: bool) -> pl.DataFrame:
-    """Deduplicate entries using OR logic and merge duplicate information.
-    Logging:
-    - Print one line per removed row: reason (URL/Name), normalized key, kept row (Journal/Website), removed row (Journal/Website).
-    - Print a summary with URL and Name counts (sum equals total removed by construction).
+        df_norm with a cluster_id column.
     """
-    df_norm = (
-        df.with_columns(
-            norm_journal=pl.col("Journal").map_elements(norm_name, return_dtype=pl.Utf8),
-            norm_website=pl.col("Website").map_elements(norm_url, return_dtype=pl.Utf8),
-        )
-        .with_row_index("row_idx")
+    links = (
+        duplicate_keys(df_norm)
+        .with_columns(pl.col("row_idx").min().over("_kind", "_key").alias("_first"))
+        .filter(pl.col("row_idx") != pl.col("_first"))
     )
 
-    # Identify duplicate groups
-    url_groups, name_groups, url_count, name_count = identify_duplicate_groups(df_norm, source_name)
+    # Union-find: each root is the smallest row_idx of its component
+    parent = list(range(df_norm.height))
+    for a, b in zip(links["row_idx"].to_list(), links["_first"].to_list()):
+        root_a, root_b = find_root(parent, a), find_root(parent, b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+    df_norm = df_norm.with_columns(
+        pl.Series("cluster_id", [find_root(parent, i) for i in range(df_norm.height)], dtype=pl.UInt32))
 
-    total_removed = url_count + name_count
+    total_removed = df_norm.height - df_norm["cluster_id"].n_unique()
     if total_removed > 0:
-        print(f"\t[dedupe:{source_name}] Summary: found {total_removed} duplicate(s): "
-              f"\n\t{url_count} by URL, {name_count} by Name.")
-    else:
-        # No duplicates found, return early
-        return df_norm.drop([c for c in ("norm_journal", "norm_website", "row_idx") if c in df_norm.columns])
-
-    # Convert dataframe to list of dicts for easier manipulation
-    all_rows = df_norm.drop([c for c in ("norm_journal", "norm_website", "row_idx") if c in df_norm.columns]).to_dicts()
-
-    # Merge duplicate groups and track which indices to keep
-    processed_indices = set()
-    kept_indices = []
-
-    # Process URL groups first (higher priority), then Name groups
-    for groups in [url_groups, name_groups]:
-        for indices in groups.values():
-            if len(indices) > 1 and not any(idx in processed_indices for idx in indices):
-                entries = [all_rows[idx] for idx in indices]
-                merged = merge_duplicates(entries, list(df.columns), concat_fields=concat_fields)
-                first_idx = min(indices)
-                all_rows[first_idx] = merged
-                kept_indices.append(first_idx)
-                processed_indices.update(indices)
-
-    # Keep non-duplicate rows as-is
-    for idx in range(len(all_rows)):
-        if idx not in processed_indices:
-            kept_indices.append(idx)
-
-    # Build result by selecting kept rows in order
-    kept_indices.sort()
-    result_rows = [all_rows[idx] for idx in kept_indices]
-
-    # Convert back to DataFrame
-    return pl.DataFrame(result_rows, schema=df.schema)
+        clusters = df_norm.filter(pl.len().over("cluster_id") > 1)["cluster_id"].n_unique()
+        linked = links.group_by("_kind").agg(pl.col("row_idx").n_unique())
+        linked = dict(zip(linked["_kind"].to_list(), linked["row_idx"].to_list()))
+        print(f"\t[dedupe:{source_name}] Summary: found {total_removed} duplicate(s) in {clusters} group(s): "
+              f"\n\t{linked.get('URL', 0)} row(s) linked by URL, {linked.get('Name', 0)} by Name, "
+              f"{linked.get('ISSN', 0)} by ISSN.")
+    return df_norm
+
+
+def dedupe_by_journal_and_website(df: pl.DataFrame, source_name: str,
+                                  concat_fields: bool) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Deduplicate entries sharing a normalized website, journal name or ISSN, and merge their information.
+
+    Duplicate groups come from cluster_duplicates; each group is merged into its first row
+    (merge_duplicate_clusters), the other rows keep their order.
+
+    Returns:
+        (deduplicated rows, merge conflicts with source, Journal, column, kept, options)
+    """
+    df_norm = cluster_duplicates(add_dedupe_keys(df), source_name)
+    merged, conflicts = merge_duplicate_clusters(df_norm, df.columns, concat_fields)
+    conflicts = conflicts.select(pl.lit(source_name).alias("source"), pl.exclude("cluster_id"))
+    if conflicts.height:
+        print(f"\t[dedupe:{source_name}] {conflicts.height} merge conflict(s) in "
+              f"{conflicts['Journal'].n_unique()} journal(s)")
+
+    singles = df_norm.filter(pl.len().over("cluster_id") == 1).select(["cluster_id"] + df.columns)
+    result = pl.concat([singles, merged]).sort("cluster_id").drop("cluster_id")
+    return result, conflicts
 
 
 def prefix_field_with_source(field_value: str, source_field_name: str) -> str:
@@ -322,67 +280,151 @@ def prefix_field_with_source(field_value: str, source_field_name: str) -> str:
     return f"{source_field_name} - {field_str}"
 
 
+def build_all_biology(frames: list[pl.DataFrame],
+                      key_frames: list[pl.DataFrame]) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Concatenate the processed field frames into all_biology, merging the journals listed in several fields.
+
+    key_frames holds the duplicate_keys of each frame, with row_idx numbered across frames. The frames
+    are already deduplicated and formatted, so only the rows sharing a key with another row are
+    deduplicated; the merged rows are marked as not _formatted and go through format_table again.
+
+    Returns:
+        (all_biology rows sorted by Journal, merge conflicts)
+    """
+    all_df = (
+        pl.concat(frames, how="vertical_relaxed")
+        .with_row_index("_all_row")
+        .with_columns(_formatted=pl.lit(True))
+    )
+    shared = (
+        pl.concat(key_frames)
+        .filter(pl.len().over("_kind", "_key") > 1)
+        .select(pl.col("row_idx").unique().alias("_all_row"))
+    )
+    overlap = all_df.join(shared, on="_all_row", how="semi", maintain_order="left")
+    print(f"\t{overlap.height} of {all_df.height} row(s) share a journal name, website or ISSN with another row")
+    merged, conflicts = dedupe_by_journal_and_website(overlap, "all_biology.csv", concat_fields=True)
+    all_df = pl.concat([
+        all_df.join(shared, on="_all_row", how="anti"),
+        merged.with_columns(_formatted=pl.lit(False)),
+    ], how="vertical_relaxed")
+
+    pending = ~pl.col("_formatted")
+    formatted = format_table(all_df.filter(pending)).select(all_df.columns)
+    all_df = pl.concat([all_df.filter(~pending), formatted], how="vertical_relaxed")
+    return all_df.sort("_all_row").drop("_all_row", "_formatted").sort("Journal"), conflicts
+
+
+def process_field_file(csv_path: str, pci_friendly_set: set[str]) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Clean, deduplicate and format the field file csv_path, and write it to OUTPUT_DIR.
+
+    Returns:
+        (the written rows with Field prefixed by the field name, for all_biology; merge conflicts)
+    """
+    print(f"Processing file: {csv_path}")
+    df = load_csv(csv_path)
+    # Drop rows with empty/null Journal
+    df = drop_empty_and_predatory_journals(df, os.path.basename(csv_path))
+    df = project_to_final_string_schema(df)
+
+    # Backfill Field
+    df = map_unique(df, "Field", normalize_field)
+
+    df = map_unique(df, "Publisher type", normalize_publisher_type)
+    # Update PCI partner using PCI_friendly.csv list
+    df = mark_pci_friendly(df, pci_friendly_set)
+
+    # Deduplicate by Journal (case-insensitive, trimmed)
+    df, conflicts = dedupe_by_journal_and_website(df, os.path.basename(csv_path), concat_fields=False)
+    df = format_table(df)
+
+    # Sort alphabetically by Journal
+    df = df.sort(by=["Journal"], descending=[False])
+
+    # Ensure expected columns and order
+    df = ensure_columns_and_order(df)
+
+    # Write to output directory using same filename
+    out_path = os.path.join(OUTPUT_DIR, os.path.basename(csv_path))
+    # Write using "" surrounding for all fields to ensure proper CSV formatting
+    check_consistency(df)
+    df.write_csv(out_path, quote_char='"', quote_style="always")
+    print(f"Wrote formatted data to: {out_path}")
+
+    # Extract source field name from filename for all_biology.csv processing
+    filename_base = os.path.basename(csv_path).replace(".csv", "")
+    source_field_name = dico_field_normalization.get(filename_base, filename_base.capitalize().replace("_", " "))
+    df = map_unique(df, "Field", lambda x: prefix_field_with_source(x, source_field_name))
+    return df, conflicts
+
+
+def process_field_file_worker(csv_path: str, pci_friendly_set: set[str]) -> tuple[str, bytes, bytes, dict]:
+    """Worker entry point of process_field_file.
+
+    Returns:
+        The captured log, the two frames as Arrow IPC and the memo_updates of the worker.
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        df, conflicts = process_field_file(csv_path, pci_friendly_set)
+    return log.getvalue(), df.write_ipc(None).getvalue(), conflicts.write_ipc(None).getvalue(), memo_updates()
+
+
+def process_field_files(csv_paths: list[str], pci_friendly_set: set[str],
+                        jobs: int = 1) -> list[tuple[pl.DataFrame, pl.DataFrame]]:
+    """Run process_field_file on each of csv_paths, returning the results in csv_paths order.
+
+    With jobs > 1, the files are processed concurrently in worker processes. The frames come
+    back as Arrow IPC; worker logs are printed and worker memos merged in csv_paths order,
+    so the output does not depend on which file finishes first.
+    """
+    if jobs <= 1 or len(csv_paths) <= 1:
+        return [process_field_file(csv_path, pci_friendly_set) for csv_path in csv_paths]
+
+    results = []
+    # spawn, not fork: forking after Polars started its thread pool can deadlock
+    with ProcessPoolExecutor(max_workers=min(jobs, len(csv_paths)),
+                             mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(process_field_file_worker, csv_path, pci_friendly_set) for csv_path in csv_paths]
+        for future in futures:
+            log, df_ipc, conflicts_ipc, updates = future.result()
+            print(log, end="")
+            merge_memo_updates(updates)
+            results.append((pl.read_ipc(io.BytesIO(df_ipc)), pl.read_ipc(io.BytesIO(conflicts_ipc))))
+    return results
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Clean, deduplicate and format data_extracted/ into data/.")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Number of processes used to process the field files (default: 1).",
+    )
+    args = parser.parse_args()
+
+    # Before any worker process loads a memo
+    evict_stale_memos()
+
     processed_frames: list[pl.DataFrame] = []
+    # Duplicate keys of the processed frames, indexed by their row in all_biology
+    key_frames: list[pl.DataFrame] = []
+    conflict_frames: list[pl.DataFrame] = []
 
     # Load PCI-friendly journals once
-    pci_friendly_set = load_pci_friendly_set()
+    pci_friendly_set = build_pci_friendly_set(sources.pci_friendly())
 
     # Process each CSV in the input directory
-    for csv_path in sorted(glob(os.path.join(INPUT_DIR, "*.csv"))):
-        print(f"Processing file: {csv_path}")
-        df = load_csv(csv_path)
-        # Drop rows with empty/null Journal
-        df = drop_empty_and_predatory_journals(df, os.path.basename(csv_path))
-        df = project_to_final_string_schema(df)
-
-        # Backfill Field
-        df = df.with_columns(
-            pl.col("Field").map_elements(normalize_field, return_dtype=pl.Utf8).alias("Field")
-        )
-
-        df = df.with_columns(
-            pl.col("Publisher type").map_elements(normalize_publisher_type, return_dtype=pl.Utf8)
-            .alias("Publisher type")
-        )
-        # Update PCI partner using PCI_friendly.csv list
-        df = mark_pci_friendly(df, pci_friendly_set)
-
-        # Deduplicate by Journal (case-insensitive, trimmed)
-        df = dedupe_by_journal_and_website(df, os.path.basename(csv_path), concat_fields=False)
-        df = format_table(df)
-
-        # Sort alphabetically by Journal
-        df = df.sort(by=["Journal"], descending=[False])
-
-        # Ensure expected columns and order
-        df = ensure_columns_and_order(df)
-
-        # Write to output directory using same filename
-        out_path = os.path.join(OUTPUT_DIR, os.path.basename(csv_path))
-        # Write using "" surrounding for all fields to ensure proper CSV formatting
-        check_consistency(df)
-        df.write_csv(out_path, quote_char='"', quote_style="always")
-        print(f"Wrote formatted data to: {out_path}")
-
-        # Extract source field name from filename for all_biology.csv processing
-        filename_base = os.path.basename(csv_path).replace(".csv", "")
-        source_field_name = dico_field_normalization.get(filename_base, filename_base.capitalize().replace("_", " "))
-        df = df.with_columns(
-            pl.col("Field").map_elements(
-                lambda x: prefix_field_with_source(x, source_field_name),
-                return_dtype=pl.Utf8
-            ).alias("Field")
-        )
+    csv_paths = sorted(glob(os.path.join(INPUT_DIR, "*.csv")))
+    for df, conflicts in process_field_files(csv_paths, pci_friendly_set, args.jobs):
+        conflict_frames.append(conflicts)
+        key_frames.append(duplicate_keys(add_dedupe_keys(df, offset=sum(f.height for f in processed_frames))))
         processed_frames.append(df)
 
     # Create all_biology.csv as the concatenation of all processed frames, deduplicated by Journal
     print(f"\nCreating 'all_biology.csv' by concatenating and deduplicating {len(processed_frames)} source files...")
     if processed_frames:
-        all_df = pl.concat(processed_frames, how="vertical_relaxed")
-        # Deduplicate using OR logic (same normalized journal OR same normalized website)
-        all_df = dedupe_by_journal_and_website(all_df, "all_biology.csv", concat_fields=True).sort("Journal")
-        all_df = format_table(all_df)
+        all_df, conflicts = build_all_biology(processed_frames, key_frames)
+        conflict_frames.append(conflicts)
         all_df = ensure_columns_and_order(all_df)
         check_consistency(all_df)
 
@@ -392,19 +434,9 @@ def main():
 
         # Report journals whose publisher (after normalization) is not in country_formatting.json.
         # This helps identify publishers missing from the configuration table.
-        formatting = load_country_formatting()
-        all_known_publishers = (
-                set(formatting["for_profit"].keys())
-                | set(formatting.get("university_press", {}).keys())
-                | set(formatting.get("non_profit", {}).keys())
-                | set(formatting.get("predatory_for_profit", {}).keys())
-        )
         missing_pub_df = (
-            all_df.filter(
-                pl.col("Publisher").is_not_null()
-                & (pl.col("Publisher").cast(pl.Utf8).str.strip_chars() != "")
-                & ~pl.col("Publisher").is_in(list(all_known_publishers))
-            )
+            publisher_config_coverage(all_df)
+            .filter(pl.col("_missing_publisher"))
             .select([
                 pl.col("Journal").alias("journal"),
                 pl.col("Publisher").alias("publisher"),
@@ -421,6 +453,17 @@ def main():
         missing_pub_df.write_csv(missing_pub_path)
         print(f"Missing publisher report written to {missing_pub_path} ({missing_pub_df.height} rows).")
 
+    # Values dropped when merging duplicates, for manual review
+    if conflict_frames:
+        os.makedirs("logs", exist_ok=True)
+        conflicts_path = os.path.join("logs", "merge_conflicts.csv")
+        conflicts_df = pl.concat(conflict_frames)
+        conflicts_df.write_csv(conflicts_path)
+        print(f"Merge conflicts report written to {conflicts_path} ({conflicts_df.height} rows).")
+
+    # Persist normalizer results for the next run
+    save_normalizer_memos()
+
 
 if __name__ == "__main__":
     main()
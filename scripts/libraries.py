@@ -1,8 +1,13 @@
+import functools
+import hashlib
+import inspect
 import json
+import os
 import polars as pl
 import re
 import unicodedata
 import gzip
+from dataclasses import dataclass
 from pathlib import Path
 
 # Expected columns and their final order
@@ -40,11 +45,12 @@ NUMERIC_COLUMNS = [
 ]
 
 
-def ensure_columns(df: pl.DataFrame) -> pl.DataFrame:
+def ensure_columns(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     # Ensure all FINAL_COLUMNS exist; add missing as nulls
-    for c in FINAL_COLUMNS:
-        if c not in df.columns:
-            df = df.with_columns(pl.lit(None).alias(c))
+    columns = df.collect_schema().names()
+    missing = [c for c in FINAL_COLUMNS if c not in columns]
+    if missing:
+        df = df.with_columns([pl.lit(None).alias(c) for c in missing])
     return df
 
 
@@ -66,18 +72,43 @@ def load_csv(file_path, **kwargs):
         return pl.read_csv(file_path, **kwargs)
 
 
+# Mojibake and dash replacements of ascii_fallbacks, applied in the same order
+ASCII_FALLBACKS: list[tuple[str, str]] = [
+    ("¬†", " "), ("√°√±", "an"), ("√º", "u"), ("√§", "a"), ("√ß", "ç"), ("‚Äô", "'"), ("√©", "é"),
+    ("√∫", "u"), ("√o", "u"), ("√≠", "i"), ("√†", "à"), ("Äö", ""),
+    ("–", "-"), ("—", "-"), ("−", "-"),
+]
+
+# Leading articles stripped by norm_name (each checked once, in this order)
+NORM_NAME_PREFIXES = ["the ", "la ", "le ", "les ", "el ", "los ", "las ", "a ", "l'"]
+
+# Inner words removed by norm_name, in this order
+NORM_NAME_INFIXES = [(" an ", " "), (" of ", " "), (" l'", " "), (" and ", " "), ("&", " ")]
+
+
+@functools.cache
+def combining_chars_pattern() -> str:
+    """Regex character class of every code point unicodedata.combining() reports as combining,
+    i.e. the characters strip_diacritics drops, for the Polars regex engine. Built on first use,
+    as it scans every code point.
+    """
+    ranges: list[tuple[int, int]] = []
+    for cp in range(0x110000):
+        if unicodedata.combining(chr(cp)):
+            if ranges and ranges[-1][1] == cp - 1:
+                ranges[-1] = (ranges[-1][0], cp)
+            else:
+                ranges.append((cp, cp))
+    return "[" + "".join(f"\\x{{{a:X}}}-\\x{{{b:X}}}" for a, b in ranges) + "]"
+
+
 def ascii_fallbacks(s: str) -> str:
     """Handle characters that are not removed by unicode normalization.
     """
-    # e.g. bad decoding of UTF-8 as Latin-1 or similar
-    mojibake = [("¬†", " "), ("√°√±", "an"), ("√º", "u"), ("√§", "a"),
-                ("√ß", "ç"), ("‚Äô", "'"), ("√©", "é"), ("√∫", "u"),
-                ("√o", "u"), ("√≠", "i"), ("√†", "à"), ("Äö", "")]
-    for a, b in mojibake:
+    # e.g. bad decoding of UTF-8 as Latin-1 or similar, then various dashes to ASCII hyphen
+    for a, b in ASCII_FALLBACKS:
         if a in s:
             s = s.replace(a, b)
-    # Normalize various dashes to ASCII hyphen
-    s = s.replace("–", "-").replace("—", "-").replace("−", "-")
     return s
 
 
@@ -124,34 +155,12 @@ def norm_name(text: str) -> str:
     if text is None:
         return ""
     s = strip_diacritics(clean_string(text)).lower()
-    if s.startswith("the "):
-        s = s.replace("the ", "", 1)
-    if s.startswith("la "):
-        s = s.replace("la ", "", 1)
-    if s.startswith("le "):
-        s = s.replace("le ", "", 1)
-    if s.startswith("les "):
-        s = s.replace("les ", "", 1)
-    if s.startswith("el "):
-        s = s.replace("el ", "", 1)
-    if s.startswith("los "):
-        s = s.replace("los ", "", 1)
-    if s.startswith("las "):
-        s = s.replace("las ", "", 1)
-    if s.startswith("a "):
-        s = s.replace("a ", "", 1)
-    if s.startswith("l'"):
-        s = s.replace("l'", "", 1)
-    if " an " in s:
-        s = s.replace(" an ", " ")
-    if " of " in s:
-        s = s.replace(" of ", " ")
-    if " l'" in s:
-        s = s.replace(" l'", " ")
-    if " and " in s:
-        s = s.replace(" and ", " ")
-    if "&" in s:
-        s = s.replace("&", " ")
+    for prefix in NORM_NAME_PREFIXES:
+        if s.startswith(prefix):
+            s = s.replace(prefix, "", 1)
+    for a, b in NORM_NAME_INFIXES:
+        if a in s:
+            s = s.replace(a, b)
     # Remove anything between parentheses
     s = re.sub(r"\(.*?\)", "", s)
     # Remove any non [a-z0-9]
@@ -161,6 +170,42 @@ def norm_name(text: str) -> str:
     return s
 
 
+def clean_string_expr(col: str | pl.Expr) -> pl.Expr:
+    """Vectorized clean_string: same steps as the Python version, null stays null."""
+    expr = pl.col(col) if isinstance(col, str) else col
+    expr = (
+        expr.cast(pl.Utf8)
+        .str.normalize("NFKC")
+        .str.replace_all(r"[\p{Cc}\p{Cf}]", "")
+        .str.replace_all("\u00A0", " ", literal=True)
+    )
+    for a, b in ASCII_FALLBACKS:
+        expr = expr.str.replace_all(a, b, literal=True)
+    return expr.str.replace_all(r"\s+", " ").str.strip_chars()
+
+
+def norm_name_expr(col: str | pl.Expr) -> pl.Expr:
+    """Vectorized norm_name built only from Polars string kernels.
+
+    Gives the same keys as norm_name for non-null input; null input stays null
+    (as with map_elements, which skips nulls).
+    """
+    expr = (
+        clean_string_expr(col)
+        .str.normalize("NFKD")
+        .str.replace_all(combining_chars_pattern(), "")
+        .str.to_lowercase()
+    )
+    for prefix in NORM_NAME_PREFIXES:
+        expr = expr.str.strip_prefix(prefix)
+    for a, b in NORM_NAME_INFIXES:
+        expr = expr.str.replace_all(a, b, literal=True)
+    return (
+        expr.str.replace_all(r"\(.*?\)", "")
+        .str.replace_all(r"[^a-z0-9]+", "")
+    )
+
+
 def norm_url(url: str) -> str:
     """Normalize URLs for duplicate detection.
     - Lowercase
@@ -202,11 +247,7 @@ def format_url(url: str) -> str:
 
 def format_urls(df: pl.DataFrame, col: str = "Website") -> pl.DataFrame:
     """Format the 'Website' column to normalized URLs."""
-    return df.with_columns(
-        pl.col(col)
-        .map_elements(format_url, return_dtype=pl.Utf8)
-        .alias(col)
-    )
+    return map_unique(df, col, format_url)
 
 
 def format_issn(issn: str) -> str | None:
@@ -234,6 +275,50 @@ def format_issn(issn: str) -> str | None:
     return s.upper()
 
 
+def issn_check_digit_expr(digits: str | pl.Expr) -> pl.Expr:
+    """Expected ISSN check character ("0"-"9" or "X") of an 8-character digit string:
+    weighted sum of the first 7 digits (weights 8..2), then (11 - sum mod 11) mod 11, 10 written "X".
+    """
+    expr = pl.col(digits) if isinstance(digits, str) else digits
+    weighted = pl.sum_horizontal([expr.str.slice(i, 1).cast(pl.Int32, strict=False) * (8 - i) for i in range(7)])
+    check = (11 - weighted % 11) % 11
+    return pl.when(check == 10).then(pl.lit("X")).otherwise(check.cast(pl.Utf8))
+
+
+def format_issn_expr(col: str | pl.Expr, validate_check_digit: bool = False) -> pl.Expr:
+    """Vectorized format_issn: same XXXX-XXXX formatting, null for anything that is not an ISSN.
+    With validate_check_digit, ISSNs whose mod-11 check digit does not match are rejected too
+    (used on lookup sources so malformed ISSNs never become join keys).
+    """
+    expr = pl.col(col) if isinstance(col, str) else col
+    digits = expr.cast(pl.Utf8).str.replace_all(r"[^0-9Xx]", "").str.to_uppercase()
+    valid = digits.str.contains(r"^[0-9]{7}[0-9X]$")
+    if validate_check_digit:
+        valid = valid & (digits.str.slice(7, 1) == issn_check_digit_expr(digits))
+    formatted = pl.concat_str([digits.str.slice(0, 4), pl.lit("-"), digits.str.slice(4, 4)])
+    return pl.when(valid).then(formatted).otherwise(None)
+
+
+def issn_code_expr(col: str | pl.Expr) -> pl.Expr:
+    """Pack a formatted XXXX-XXXX ISSN into a UInt32: the 7 leading digits times 11 plus the
+    check character (0-9, X = 10). Anything that is not a formatted ISSN becomes null.
+    """
+    expr = pl.col(col) if isinstance(col, str) else col
+    digits = pl.concat_str([expr.str.slice(0, 4), expr.str.slice(5, 3)]).cast(pl.UInt32, strict=False)
+    check_char = expr.str.slice(8, 1)
+    check = pl.when(check_char == "X").then(pl.lit(10, pl.UInt32)).otherwise(check_char.cast(pl.UInt32, strict=False))
+    return pl.when(expr.str.contains(r"^[0-9]{4}-[0-9]{3}[0-9X]$")).then(digits * 11 + check).otherwise(None)
+
+
+def issn_from_code_expr(col: str | pl.Expr) -> pl.Expr:
+    """Decode a packed ISSN code (issn_code_expr) back to its XXXX-XXXX string."""
+    code = pl.col(col) if isinstance(col, str) else col
+    digits = (code // 11).cast(pl.Utf8).str.zfill(7)
+    check = code % 11
+    check_char = pl.when(check == 10).then(pl.lit("X")).otherwise(check.cast(pl.Utf8))
+    return pl.concat_str([digits.str.slice(0, 4), pl.lit("-"), digits.str.slice(4, 3), check_char])
+
+
 def format_APC(apc: str) -> str:
     """Format a single APC value to extract the integer part before any comma or period, removing non-digit characters."""
     if apc is None:
@@ -254,21 +339,28 @@ def format_APC(apc: str) -> str:
     return s
 
 
+def format_APC_expr(col: str = "APC Euros") -> pl.Expr:
+    """Expression formatting an APC column to integer (see format_APC)."""
+    return map_unique_expr(col, format_APC).cast(pl.Int64, strict=True).alias(col)
+
+
+def invalid_APC_expr(col: str = "APC Euros") -> pl.Expr:
+    """True for formatted APC values below 0 or above 20000."""
+    return (pl.col(col).is_not_null()) & ((pl.col(col) < 0) | (pl.col(col) > 20000))
+
+
 def format_APC_Euros(df: pl.DataFrame, col: str = "APC Euros") -> pl.DataFrame:
     """Format the 'APC Euros' column to be integer, extracting only the part before any comma or period, then removing non-digit characters."""
-    df = df.with_columns(
-        pl.col(col).map_elements(format_APC, return_dtype=pl.Utf8).cast(pl.Int64, strict=True)
-        .alias(col)
-    )
+    df = df.with_columns(format_APC_expr(col))
     # assert there is no APC < 0 and APC > 20000
-    filter_invalid = df.filter((pl.col(col).is_not_null()) & ((pl.col(col) < 0) | (pl.col(col) > 20000)))
+    filter_invalid = df.filter(invalid_APC_expr(col))
     if filter_invalid.height > 0:
         print("Invalid APC Euros values found:")
         print(filter_invalid)
     return df
 
 
-def format_Scimago_Rank(df: pl.DataFrame, col: str = "Scimago Rank") -> pl.DataFrame:
+def format_Scimago_Rank(df: pl.DataFrame | pl.LazyFrame, col: str = "Scimago Rank") -> pl.DataFrame | pl.LazyFrame:
     """Format the 'Scimago Rank' column to be a float, removing non-numeric characters."""
     return df.with_columns(
         pl.col(col)
@@ -280,11 +372,11 @@ def format_Scimago_Rank(df: pl.DataFrame, col: str = "Scimago Rank") -> pl.DataF
     )
 
 
-def load_pci_friendly_set() -> set[str]:
-    """Load the set of normalized (lowercase, trimmed) journal names that are PCI-friendly."""
-    PCI_FRIENDLY_PATH = "data_extraction/PCI_friendly.csv.gz"
-    df = load_csv(PCI_FRIENDLY_PATH)
-    journals = [clean_string(j) for j in df["Journal"].to_list()]
+def build_pci_friendly_set(pci_df: pl.DataFrame) -> set[str]:
+    """Build the set of normalized (lowercase, trimmed) journal names that are PCI-friendly
+    from the PCI-friendly dump (sources.pci_friendly).
+    """
+    journals = [clean_string(j) for j in pci_df["Journal"].to_list()]
     return {str(j).lower().strip() for j in journals if j is not None}
 
 
@@ -305,10 +397,7 @@ def normalize_pci_friendly(entry: str) -> str:
 
 def mark_pci_friendly(df: pl.DataFrame, friendly_set: set[str]) -> pl.DataFrame:
     """Set 'PCI partner' to 'PCI friendly' when journal is in friendly_set."""
-    df = df.with_columns(
-        pl.col("PCI partner").map_elements(normalize_pci_friendly, return_dtype=pl.Utf8, skip_nulls=False).alias(
-            "PCI partner")
-    )
+    df = map_unique(df, "PCI partner", normalize_pci_friendly, skip_nulls=False)
     return df.with_columns(
         pl.when(
             pl.col("Journal").cast(pl.Utf8).str.to_lowercase().str.strip_chars().is_in(list(friendly_set))
@@ -329,115 +418,170 @@ def normalize_field(name: str) -> str:
     return name[0].upper() + name[1:]
 
 
+# Publisher canonicalization rules, tried in order (first match wins).
+# Each rule is (alternatives, canonical): it matches if all tests of any one alternative pass.
+# Tests: ("has", s) substring of the raw name (case-sensitive), ("lhas", s) / ("lnot", s)
+# substring / not a substring of the lowercased name, ("is", s) / ("lis", s) equality with
+# the raw / lowercased name. A canonical ending in "(" is completed with the text following
+# the first "(" of the raw name. Names matching no rule are passed through clean_string.
+PUBLISHER_RULES: list[tuple[list[list[tuple[str, str]]], str]] = [
+    ([[("has", "BMC")], [("lhas", "biomed central")]], "Springer Nature (BioMed Central)"),
+    ([[("lhas", "springer")], [("lis", "nature")], [("lhas", "nature publishing group")],
+      [("lhas", "nature research")], [("lhas", "nature portfolio")]], "Springer Nature"),
+    ([[("lhas", "wiley")]], "John Wiley & Sons"),
+    ([[("lhas", "de gruyter")], [("lhas", "brill")]], "De Gruyter Brill"),
+    ([[("lhas", "karger")]], "Karger Publishers"),
+    ([[("lhas", "inderscience")]], "Inderscience Publishers"),
+    ([[("lhas", "taylor"), ("lhas", "francis"), ("lnot", "(")]], "Taylor & Francis Group"),
+    ([[("lhas", "taylor"), ("lhas", "francis")]], "Taylor & Francis Group ("),
+    ([[("has", "PeerJ")]], "Taylor & Francis Group (PeerJ)"),
+    ([[("lhas", "sage"), ("lnot", "(")]], "Sage Publishing"),
+    ([[("lhas", "sage publishing")]], "Sage Publishing ("),
+    ([[("is", "Cell")], [("lhas", "cell press")]], "Elsevier (Cell Press)"),
+    ([[("lhas", "academic press")]], "Elsevier (Academic Press)"),
+    ([[("lhas", "elsevier")]], "Elsevier"),
+    ([[("lhas", "frontiers")]], "Frontiers Media SA"),
+    ([[("has", "BMJ")]], "BMJ Group"),
+    ([[("has", "BioOne Complete")]], "BioOne"),
+    ([[("has", "OUP")], [("lhas", "oxford university press")]], "Oxford University Press (OUP)"),
+    ([[("has", "CUP")], [("lhas", "cambridge university press")]], "Cambridge University Press (CUP)"),
+    ([[("has", "AAAS")], [("lhas", "american association for the advancement of science")]],
+     "American Association for the Advancement of Science (AAAS)"),
+    ([[("has", "AACR")], [("lhas", "american association for cancer research")]],
+     "American Association for Cancer Research (AACR)"),
+    ([[("has", "ACS")], [("lhas", "american chemical society")]], "American Chemical Society (ACS)"),
+    ([[("has", "AMA")], [("lhas", "american medical association")]], "American Medical Association (AMA)"),
+    ([[("has", "APA")], [("lhas", "american psychological association")]],
+     "American Psychological Association (APA)"),
+    ([[("has", "APS")], [("lhas", "american physiological society")]], "American Physiological Society (APS)"),
+    ([[("has", "ASM")], [("lhas", "american society for microbiology")]],
+     "American Society for Microbiology (ASM)"),
+    ([[("has", "ERS")], [("lhas", "european respiratory society")]], "European Respiratory Society (ERS)"),
+    ([[("lhas", "public library of science")], [("lhas", "plos")]], "Public Library of Science (PLoS)"),
+    ([[("has", "PCI")], [("lhas", "peer community in")]], "Peer Community In"),
+    ([[("lhas", "annual reviews")]], "Annual Reviews"),
+    ([[("lhas", "lippincott"), ("lhas", "williams"), ("lhas", "wilkins")]], "Wolters Kluwer (Lippincott)"),
+    ([[("lhas", "ovid technologies")]], "Wolters Kluwer (Ovid Technologies)"),
+    ([[("lhas", "wolters kluwer"), ("lnot", "("), ("lnot", ")")]], "Wolters Kluwer"),
+    ([[("lhas", "bioscientifica")]], "Bioscientifica Ltd"),
+    ([[("lhas", "mary ann liebert")]], "Sage Publishing (Mary Ann Liebert)"),
+    ([[("lhas", "pensoft publishers")], [("lhas", "pensoft")]], "Pensoft Publishers"),
+    ([[("has", "CSIRO")], [("lhas", "commonwealth scientific and industrial research organisation")]],
+     "CSIRO Publishing"),
+    ([[("has", "MIT"), ("lhas", "mit press")]], "MIT Press"),
+    ([[("lhas", "john libbey")], [("has", "JLE")]], "John Libbey Eurotext"),
+    ([[("lhas", "national"), ("lhas", "histoire"), ("lhas", "naturelle")]],
+     "Muséum national d'Histoire naturelle (MNHN)"),
+    ([[("lhas", "korean society for microbiology and biotechnology")], [("has", "KSBMB")]],
+     "Korean Society for Microbiology and Biotechnology (KSBMB)"),
+    ([[("lhas", "cold spring harbor")]], "Cold Spring Harbor (CSH) Laboratory Press"),
+    ([[("lhas", "pagepress")], [("lhas", "page press publications")]], "PAGEPress Publications"),
+    ([[("has", "PUF")], [("lhas", "presses universitaires de france")]], "Presses Universitaires de France (PUF)"),
+    ([[("lhas", "company of biologists")]], "The Company of Biologists"),
+    ([[("lhas", "royal society publishing")], [("lhas", "the royal society")]], "The Royal Society"),
+    ([[("has", "EDP Sciences")], [("lhas", "china science publishing & media")]],
+     "China Science Publishing & Media (EDP Sciences)"),
+]
+
+# Patterns searched in one Aho-Corasick pass each by normalize_publisher_series
+PUBLISHER_CASE_PATTERNS = sorted({p for alts, _ in PUBLISHER_RULES for alt in alts for k, p in alt if k == "has"})
+PUBLISHER_LOWER_PATTERNS = sorted(
+    {p for alts, _ in PUBLISHER_RULES for alt in alts for k, p in alt if k in ("lhas", "lnot")})
+
+
+def _publisher_test_source(kind: str, pattern: str) -> str:
+    if kind == "has":
+        return f"{pattern!r} in name"
+    elif kind == "lhas":
+        return f"{pattern!r} in name_lower"
+    elif kind == "lnot":
+        return f"{pattern!r} not in name_lower"
+    elif kind == "is":
+        return f"name == {pattern!r}"
+    elif kind == "lis":
+        return f"name_lower == {pattern!r}"
+    raise ValueError(f"Unknown publisher rule test: {kind}")
+
+
+def compile_publisher_rules(rules: list[tuple[list[list[tuple[str, str]]], str]]):
+    """Compile publisher rules into one if chain, match(name, name_lower) -> canonical name or None.
+
+    Walking the rule table in a Python loop costs several times more per name than the
+    equivalent hand-written chain of `in` tests, so the chain is generated from the table.
+    """
+    lines = ["def match(name, name_lower):"]
+    for alternatives, canonical in rules:
+        condition = " or ".join(
+            "(" + " and ".join(_publisher_test_source(k, p) for k, p in tests) + ")" for tests in alternatives
+        )
+        lines.append(f"    if {condition}:")
+        if canonical.endswith("("):
+            lines.append(f"        return {canonical!r} + name.split('(', 1)[1]")
+        else:
+            lines.append(f"        return {canonical!r}")
+    lines.append("    return None")
+    namespace: dict = {}
+    exec(compile("\n".join(lines), "<publisher rules>", "exec"), namespace)
+    return namespace["match"]
+
+
+_match_publisher_rule = compile_publisher_rules(PUBLISHER_RULES)
+
+
 def normalize_publisher(name: str) -> str:
     """
     Normalize publisher names to standard forms.
-    1. Map known variants to standard names.
-    2. Remove " Inc." suffix.
-    3. Handle specific known encoding issues.
-    4. Trim leading/trailing spaces.
-    5. Return empty string if name is None.
+    1. Map known variants to standard names (first matching rule of PUBLISHER_RULES).
+    2. Otherwise clean the name with clean_string.
+    3. Return empty string if name is None.
     """
     if name is None:
         return ""
-    name_lower = name.lower()
-    if "BMC" in name or "biomed central" in name_lower:
-        return "Springer Nature (BioMed Central)"
-    elif "springer" in name_lower or "nature" == name_lower or "nature publishing group" in name_lower or "nature research" in name_lower or "nature portfolio" in name_lower:
-        return "Springer Nature"
-    elif "wiley" in name_lower:
-        return "John Wiley & Sons"
-    elif "de gruyter" in name_lower or "brill" in name_lower:
-        return "De Gruyter Brill"
-    elif "karger" in name_lower:
-        return "Karger Publishers"
-    elif "inderscience" in name_lower:
-        return "Inderscience Publishers"
-    elif ("taylor" in name_lower) and ("francis" in name_lower) and ("(" not in name_lower):
-        return "Taylor & Francis Group"
-    elif ("taylor" in name_lower) and ("francis" in name_lower):
-        return "Taylor & Francis Group (" + name.split("(", 1)[1]
-    elif "PeerJ" in name:
-        return "Taylor & Francis Group (PeerJ)"
-    elif ("sage" in name_lower) and ("(" not in name_lower):
-        return "Sage Publishing"
-    elif "sage publishing" in name_lower:
-        return "Sage Publishing (" + name.split("(", 1)[1]
-    elif "Cell" == name or "cell press" in name_lower:
-        return "Elsevier (Cell Press)"
-    elif "academic press" in name_lower:
-        return "Elsevier (Academic Press)"
-    elif "elsevier" in name_lower:
-        return "Elsevier"
-    elif "frontiers" in name_lower:
-        return "Frontiers Media SA"
-    elif "BMJ" in name:
-        return "BMJ Group"
-    elif "BioOne Complete" in name:
-        return "BioOne"
-    elif "OUP" in name or "oxford university press" in name_lower:
-        return "Oxford University Press (OUP)"
-    elif "CUP" in name or "cambridge university press" in name_lower:
-        return "Cambridge University Press (CUP)"
-    elif "AAAS" in name or "american association for the advancement of science" in name_lower:
-        return "American Association for the Advancement of Science (AAAS)"
-    elif "AACR" in name or "american association for cancer research" in name_lower:
-        return "American Association for Cancer Research (AACR)"
-    elif "ACS" in name or "american chemical society" in name_lower:
-        return "American Chemical Society (ACS)"
-    elif "AMA" in name or "american medical association" in name_lower:
-        return "American Medical Association (AMA)"
-    elif "APA" in name or "american psychological association" in name_lower:
-        return "American Psychological Association (APA)"
-    elif "APS" in name or "american physiological society" in name_lower:
-        return "American Physiological Society (APS)"
-    elif "ASM" in name or "american society for microbiology" in name_lower:
-        return "American Society for Microbiology (ASM)"
-    elif "ERS" in name or "european respiratory society" in name_lower:
-        return "European Respiratory Society (ERS)"
-    elif "public library of science" in name_lower or "plos" in name_lower:
-        return "Public Library of Science (PLoS)"
-    elif "PCI" in name or "peer community in" in name_lower:
-        return "Peer Community In"
-    elif "annual reviews" in name_lower:
-        return "Annual Reviews"
-    elif "lippincott" in name_lower and "williams" in name_lower and "wilkins" in name_lower:
-        return "Wolters Kluwer (Lippincott)"
-    elif "ovid technologies" in name_lower:
-        return "Wolters Kluwer (Ovid Technologies)"
-    elif "wolters kluwer" in name_lower and "(" not in name_lower and ")" not in name_lower:
-        return "Wolters Kluwer"
-    elif "bioscientifica" in name_lower:
-        return "Bioscientifica Ltd"
-    elif "mary ann liebert" in name_lower:
-        return "Sage Publishing (Mary Ann Liebert)"
-    elif "pensoft publishers" in name_lower or "pensoft" in name_lower:
-        return "Pensoft Publishers"
-    elif "CSIRO" in name or "commonwealth scientific and industrial research organisation" in name_lower:
-        return "CSIRO Publishing"
-    elif "MIT" in name and "mit press" in name_lower:
-        return "MIT Press"
-    elif "john libbey" in name_lower or "JLE" in name:
-        return "John Libbey Eurotext"
-    elif "national" in name_lower and "histoire" in name_lower and "naturelle" in name_lower:
-        return "Muséum national d'Histoire naturelle (MNHN)"
-    elif "korean society for microbiology and biotechnology" in name_lower or "KSBMB" in name:
-        return "Korean Society for Microbiology and Biotechnology (KSBMB)"
-    elif "cold spring harbor" in name_lower:
-        return "Cold Spring Harbor (CSH) Laboratory Press"
-    elif "pagepress" in name_lower or "page press publications" in name_lower:
-        return "PAGEPress Publications"
-    elif "PUF" in name or "presses universitaires de france" in name_lower:
-        return "Presses Universitaires de France (PUF)"
-    elif "company of biologists" in name_lower:
-        return "The Company of Biologists"
-    elif "royal society publishing" in name_lower or "the royal society" in name_lower:
-        return "The Royal Society"
-    elif "EDP Sciences" in name or "china science publishing & media" in name_lower:
-        return "China Science Publishing & Media (EDP Sciences)"
+    canonical = _match_publisher_rule(name, name.lower())
+    if canonical is not None:
+        return canonical
     return str(clean_string(name))
 
 
+def _publisher_test_expr(kind: str, pattern: str) -> pl.Expr:
+    if kind == "has":
+        return pl.col("_hits").list.contains(pattern)
+    elif kind == "lhas":
+        return pl.col("_lower_hits").list.contains(pattern)
+    elif kind == "lnot":
+        return ~pl.col("_lower_hits").list.contains(pattern)
+    elif kind == "is":
+        return pl.col("_name") == pattern
+    elif kind == "lis":
+        return pl.col("_lower") == pattern
+    raise ValueError(f"Unknown publisher rule test: {kind}")
+
+
+def normalize_publisher_series(s: pl.Series) -> pl.Series:
+    """Vectorized normalize_publisher. Each unique name is scanned once for all case-sensitive
+    and once for all lowercase rule patterns (Aho-Corasick), then PUBLISHER_RULES are resolved
+    in order from the matched patterns. Nulls stay null.
+    """
+    s = s.cast(pl.Utf8)
+    names = pl.DataFrame({"_name": s.drop_nulls().unique()}).with_columns(
+        pl.col("_name").str.to_lowercase().alias("_lower")
+    ).with_columns(
+        pl.col("_name").str.extract_many(PUBLISHER_CASE_PATTERNS, overlapping=True).alias("_hits"),
+        pl.col("_lower").str.extract_many(PUBLISHER_LOWER_PATTERNS, overlapping=True).alias("_lower_hits"),
+    )
+    resolved = None
+    for alternatives, canonical in PUBLISHER_RULES:
+        matches = pl.any_horizontal(
+            [pl.all_horizontal([_publisher_test_expr(k, p) for k, p in alt]) for alt in alternatives]
+        )
+        value = pl.lit(canonical)
+        if canonical.endswith("("):
+            value = pl.concat_str([value, pl.col("_name").str.splitn("(", 2).struct.field("field_1")])
+        resolved = (pl.when(matches) if resolved is None else resolved.when(matches)).then(value)
+    names = names.select("_name", resolved.otherwise(clean_string_expr("_name")).alias("_publisher"))
+    return s.replace_strict(names["_name"], names["_publisher"], default=None, return_dtype=pl.Utf8)
+
+
 def load_country_formatting() -> dict[str, dict[str, str]]:
     """Load publisher→country mappings from config/country_formatting.json.
 
@@ -458,46 +602,157 @@ def load_country_formatting() -> dict[str, dict[str, str]]:
     return data
 
 
+# Publisher type of each country_formatting group; later groups take precedence in
+# PublisherConfig.types when two config names normalize to the same publisher
+PUBLISHER_TYPE_GROUPS = [("for_profit", "For-profit"), ("predatory_for_profit", "Predatory For-profit"),
+                         ("non_profit", "Non-profit"), ("university_press", "University Press")]
+
+# Groups whose countries are used to derive a missing Country (later groups take precedence)
+PUBLISHER_COUNTRY_GROUPS = ["for_profit", "university_press", "non_profit"]
+
+
+@dataclass(frozen=True)
+class PublisherConfig:
+    """config/country_formatting.json with publisher names normalized by normalize_publisher.
+
+    groups:           normalized publisher names of each country_formatting group.
+    types:            one row per normalized publisher: Publisher, Publisher type.
+    countries:        one row per normalized publisher of PUBLISHER_COUNTRY_GROUPS: Publisher, Country.
+                      A config name that is already normalized wins over one that only
+                      normalizes to it.
+    """
+    groups: dict[str, frozenset[str]]
+    types: pl.DataFrame
+    countries: pl.DataFrame
+
+
+# (mtime_ns, sha256) of the loaded config file and the config built from it
+_publisher_config: tuple[tuple[int, str], PublisherConfig] | None = None
+
+
+def build_publisher_config(formatting: dict[str, dict[str, str]]) -> PublisherConfig:
+    """Build a PublisherConfig from the dict returned by load_country_formatting."""
+    rows = pl.DataFrame(
+        [(group, name, country) for group, entries in formatting.items() for name, country in entries.items()],
+        schema={"group": pl.Utf8, "name": pl.Utf8, "Country": pl.Utf8}, orient="row",
+    ).with_row_index("_order")
+    rows = rows.with_columns(memo_map_series(rows["name"], normalize_publisher).alias("Publisher"))
+    groups = {
+        group: frozenset(rows.filter(pl.col("group") == group)["Publisher"].to_list()) for group in formatting
+    }
+    type_groups = [group for group, _ in PUBLISHER_TYPE_GROUPS]
+    types = (
+        rows.filter(pl.col("group").is_in(type_groups))
+        .with_columns(
+            pl.col("group").replace_strict(type_groups, list(range(len(type_groups))), return_dtype=pl.UInt32)
+            .alias("_rank"),
+            pl.col("group").replace_strict(dict(PUBLISHER_TYPE_GROUPS)).alias("Publisher type"),
+        )
+        .sort("_rank", "_order")
+        .unique("Publisher", keep="last", maintain_order=True)
+        .select("Publisher", "Publisher type")
+    )
+    countries = (
+        rows.filter(pl.col("group").is_in(PUBLISHER_COUNTRY_GROUPS))
+        .with_columns(
+            (pl.col("name") == pl.col("Publisher")).alias("_exact"),
+            pl.col("group").replace_strict(PUBLISHER_COUNTRY_GROUPS, list(range(len(PUBLISHER_COUNTRY_GROUPS))),
+                                           return_dtype=pl.UInt32).alias("_rank"),
+        )
+        .sort("_exact", "_rank", "_order")
+        .unique("Publisher", keep="last", maintain_order=True)
+        .select("Publisher", "Country")
+    )
+    return PublisherConfig(
+        groups=groups,
+        types=types,
+        countries=countries,
+    )
+
+
+def load_publisher_config() -> PublisherConfig:
+    """Return the PublisherConfig of config/country_formatting.json, built once per process.
+    The file is parsed again only when its mtime changes, and the config rebuilt only when
+    its content hash changes too.
+    """
+    global _publisher_config
+    mtime = os.stat(COUNTRY_FORMATTING_PATH).st_mtime_ns
+    if _publisher_config is not None and _publisher_config[0][0] == mtime:
+        return _publisher_config[1]
+    digest = hashlib.sha256(COUNTRY_FORMATTING_PATH.read_bytes()).hexdigest()
+    if _publisher_config is None or _publisher_config[0][1] != digest:
+        config = build_publisher_config(load_country_formatting())
+    else:
+        config = _publisher_config[1]
+    _publisher_config = ((mtime, digest), config)
+    return config
+
+
 def build_publisher_type_map() -> dict[str, str]:
     """Build publisher -> type map using country_formatting groups."""
-    formatting = load_country_formatting()
-    result: dict[str, str] = {}
-    for publisher in formatting["for_profit"].keys():
-        result[normalize_publisher(publisher)] = "For-profit"
-    for publisher in formatting.get("predatory_for_profit", {}).keys():
-        result[normalize_publisher(publisher)] = "Predatory For-profit"
-    for publisher in formatting.get("non_profit", {}).keys():
-        result[normalize_publisher(publisher)] = "Non-profit"
-    for publisher in formatting.get("university_press", {}).keys():
-        result[normalize_publisher(publisher)] = "University Press"
-    return result
-
-
-def classify_publisher_type(publisher: str, type_map: dict[str, str]) -> str:
-    """Return normalized publisher type for color coding."""
-    normalized = normalize_publisher(publisher)
-    if not normalized.strip():
-        return "Other"
-    return type_map.get(normalized, "Other")
-
-
-def derive_country_from_publisher(df: pl.DataFrame) -> pl.DataFrame:
+    types = load_publisher_config().types
+    return dict(zip(types["Publisher"].to_list(), types["Publisher type"].to_list()))
+
+
+def classify_publisher_type_expr(col: str, type_map: dict[str, str]) -> pl.Expr:
+    """Publisher type of the publisher names in col, for color coding: the type_map entry of
+    the normalized name (normalize_publisher runs once per distinct name). Blank, null and
+    unknown names give "Other"."""
+    normalized = map_unique_expr(col, normalize_publisher).fill_null("")
+    return (pl.when(normalized.str.strip_chars() == "").then(pl.lit("Other"))
+            .otherwise(normalized.replace_strict(list(type_map), list(type_map.values()),
+                                                 default="Other", return_dtype=pl.Utf8)))
+
+
+def publisher_config_coverage(df: pl.DataFrame, config: PublisherConfig | None = None) -> pl.DataFrame:
+    """Join each row of df with the type of its Publisher in config/country_formatting.json.
+
+    Adds to df:
+        _config_publisher_type:  type of the normalized Publisher in PublisherConfig.types,
+                                 null when the Publisher is blank or missing from the config
+        _missing_publisher:      True when a non-blank Publisher is missing from the config
+        _dataset_publisher_base: base category of Publisher type (see publisher_type_base_category_expr)
+        _publisher_type_disagreement: True when Publisher and Publisher type are both non-empty,
+                                 the Publisher type is known and its base category differs from
+                                 the config type (society-run variants are refinements, not conflicts)
+
+    Used for the "Utmost priority" rows of logs/disagreements.csv (update_extracted.py) and for
+    logs/missing_publisher_in_configs.csv (data_process.py).
+    """
+    types = (config or load_publisher_config()).types.rename(
+        {"Publisher": "_normalized_publisher", "Publisher type": "_config_publisher_type"})
+    publisher = pl.col("Publisher").cast(pl.Utf8)
+    publisher_type = pl.col("Publisher type").cast(pl.Utf8)
+    nonblank = publisher.is_not_null() & (publisher.str.strip_chars() != "")
+    df = df.with_columns(map_unique_expr("Publisher", normalize_publisher).alias("_normalized_publisher"))
+    return df.join(types, on="_normalized_publisher", how="left", maintain_order="left").with_columns(
+        (nonblank & pl.col("_config_publisher_type").is_null()).alias("_missing_publisher"),
+        publisher_type_base_category_expr(publisher_type).alias("_dataset_publisher_base"),
+    ).with_columns(
+        (
+            (publisher.fill_null("") != "")
+            & (publisher_type.fill_null("") != "")
+            & pl.col("_config_publisher_type").is_not_null()
+            & (pl.col("_dataset_publisher_base") != "Other")
+            & (pl.col("_dataset_publisher_base") != pl.col("_config_publisher_type"))
+        ).alias("_publisher_type_disagreement")
+    ).drop("_normalized_publisher")
+
+
+def derive_country_from_publisher(df: pl.DataFrame | pl.LazyFrame,
+                                  config: PublisherConfig | None = None) -> pl.DataFrame | pl.LazyFrame:
     """Derive 'Country' from known 'Publisher' names when 'Country' is missing/empty.
-    Publisher→country mapping is loaded from config/country_formatting.json (all 3 groups).
+    Publisher→country mapping is taken from config/country_formatting.json (PublisherConfig.countries).
     """
-    formatting = load_country_formatting()
-    country_map = {
-        **formatting["for_profit"],
-        **formatting.get("university_press", {}),
-        **formatting.get("non_profit", {}),
-    }
+    countries = (config or load_publisher_config()).countries
+    publisher_country = pl.col("Publisher").cast(pl.Utf8).replace_strict(
+        countries["Publisher"], countries["Country"], default=None, return_dtype=pl.Utf8)
     return df.with_columns(
         pl.when(
             (pl.col("Country").is_null() | (pl.col("Country").cast(pl.Utf8).str.strip_chars() == ""))
-            & pl.col("Publisher").is_not_null()
-            & pl.col("Publisher").is_in(list(country_map.keys()))
+            & publisher_country.is_not_null()
         )
-        .then(pl.col("Publisher").replace(country_map).alias("Country"))
+        .then(publisher_country)
         .otherwise(pl.col("Country"))
         .alias("Country")
     )
@@ -639,7 +894,7 @@ def normalize_institution_type(name: str) -> str:
         return s
 
 
-def infer_institution_type(df: pl.DataFrame) -> pl.DataFrame:
+def infer_institution_type(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """Infer 'Institution type' as 'Society' when Institution name suggests a society and Institution type is empty/null."""
     pattern_assoc = r"\b(society|société|societe|sociedad|società|sociedade|gesellschaft|association|associación|associação|vereniging|genootschap)\b"
     df = df.with_columns(inst_lower=pl.col("Institution").cast(pl.Utf8).str.to_lowercase())
@@ -655,6 +910,20 @@ def infer_institution_type(df: pl.DataFrame) -> pl.DataFrame:
     return df
 
 
+PUBLISHER_TYPE_FORMATS = {
+    "for-profit": "For-profit",
+    "for profit": "For-profit",
+    "forprofit": "For-profit",
+    "predatory for-profit": "Predatory For-profit",
+    "predatory for profit": "Predatory For-profit",
+    "university press": "University Press",
+    "university_press": "University Press",
+    "non-profit": "Non-profit",
+    "non profit": "Non-profit",
+    "nonprofit": "Non-profit",
+}
+
+
 def format_publisher_type(name: str) -> str:
     """Normalize publisher type values.
     "for-profit" -> "For-profit"
@@ -665,37 +934,29 @@ def format_publisher_type(name: str) -> str:
     if name is None:
         return ""
     s = str(name).strip().lower()
-    mapping = {
-        "for-profit": "For-profit",
-        "for profit": "For-profit",
-        "forprofit": "For-profit",
-        "predatory for-profit": "Predatory For-profit",
-        "predatory for profit": "Predatory For-profit",
-        "university press": "University Press",
-        "university_press": "University Press",
-        "non-profit": "Non-profit",
-        "non profit": "Non-profit",
-        "nonprofit": "Non-profit",
-    }
-    if s in mapping:
-        return mapping[s]
+    if s in PUBLISHER_TYPE_FORMATS:
+        return PUBLISHER_TYPE_FORMATS[s]
     else:
         return name.strip().replace("Society-run", "Society-Run")  # Preserve Society-Run suffix if present
 
 
-def publisher_type_base_category(publisher_type: str) -> str:
-    """Return the base publisher-type category, stripping society-run variants.
-    Unknown or empty values are returned as "Other".
+def publisher_type_base_category_expr(col: str | pl.Expr) -> pl.Expr:
+    """Base publisher-type category of col: the type formatted as by format_publisher_type,
+    with the Society-Run variants stripped. Empty and null values give "Other".
     """
-    s = format_publisher_type(publisher_type)
-    if s == "":
-        return "Other"
-    return s.replace("Society-Run", "").strip()
+    stripped = (pl.col(col) if isinstance(col, str) else col).cast(pl.Utf8).fill_null("").str.strip_chars()
+    formatted = stripped.str.to_lowercase().replace_strict(
+        list(PUBLISHER_TYPE_FORMATS), list(PUBLISHER_TYPE_FORMATS.values()),
+        default=stripped.str.replace_all("Society-run", "Society-Run", literal=True), return_dtype=pl.Utf8)
+    return (pl.when(formatted == "").then(pl.lit("Other"))
+            .otherwise(formatted.str.replace_all("Society-Run", "", literal=True).str.strip_chars()))
 
-def infer_publisher_type_from_publisher(df: pl.DataFrame) -> pl.DataFrame:
+
+def infer_publisher_type_from_publisher(df: pl.DataFrame | pl.LazyFrame,
+                                        config: PublisherConfig | None = None) -> pl.DataFrame | pl.LazyFrame:
     """Infer 'Publisher type' from known publisher names when Publisher type is empty/null.
 
-    Publisher name sets are loaded from config/country_formatting.json:
+    Publisher name sets come from config/country_formatting.json (PublisherConfig.groups):
       - 'for_profit' keys  → 'For-profit'
       - 'predatory_for_profit' keys → 'Predatory For-profit'
       - 'university_press' keys → 'University Press'
@@ -704,11 +965,11 @@ def infer_publisher_type_from_publisher(df: pl.DataFrame) -> pl.DataFrame:
     A catch-all fallback assigns 'University Press' to any publisher whose name
     contains the substring 'University Press' (covers unlisted publishers).
     """
-    formatting = load_country_formatting()
-    for_profit_pubs = set(formatting["for_profit"].keys())
-    university_press_pubs = set(formatting.get("university_press", {}).keys())
-    non_profit_pubs = set(formatting.get("non_profit", {}).keys())
-    predatory_for_profit_pubs = set(formatting.get("predatory_for_profit", {}).keys())
+    groups = (config or load_publisher_config()).groups
+    for_profit_pubs = groups["for_profit"]
+    university_press_pubs = groups["university_press"]
+    non_profit_pubs = groups["non_profit"]
+    predatory_for_profit_pubs = groups["predatory_for_profit"]
 
     pub = pl.col("Publisher").cast(pl.Utf8)
     empty_pubtype = pl.col("Publisher type").is_null() | (
@@ -734,14 +995,14 @@ def infer_publisher_type_from_publisher(df: pl.DataFrame) -> pl.DataFrame:
     return df
 
 
-def annotate_publisher_type_from_institution_type(df: pl.DataFrame) -> pl.DataFrame:
+def society_run_publisher_type_expr() -> pl.Expr:
     """Annotate 'Publisher type' with Society-Run based on 'Institution type'.
     Rules:
-    - If Publisher type is 'For-profit' and Institution type is 'Society' => 'For-profit Society-Run'
-    - If Publisher type is 'University Press' and Institution type is 'Society' => 'University Press Society-Run'
-    Log each change with journal, previous publisher type, institution, institution type, and new publisher type.
+    - If Publisher type is 'For-profit' and Institution type is 'Society/Association' => 'For-profit Society-Run'
+    - If Publisher type is 'University Press' and Institution type is 'Society/Association' => 'University Press Society-Run'
+    The changes are logged by log_publisher_type_annotations.
     """
-    new_type_expr = (
+    return (
         pl.when((pl.col("Publisher type") == "For-profit") & (pl.col("Institution type") == "Society/Association"))
         .then(pl.lit("For-profit Society-Run"))
         .otherwise(
@@ -752,20 +1013,18 @@ def annotate_publisher_type_from_institution_type(df: pl.DataFrame) -> pl.DataFr
         )
     )
 
-    df_temp = df.with_columns(new_publisher_type=new_type_expr)
-    changes = df_temp.filter(pl.col("new_publisher_type") != pl.col("Publisher type"))
-    if changes.height > 0:
-        for row in changes.select(
-                ["Journal", "Publisher type", "Institution", "Institution type", "new_publisher_type"]).to_dicts():
-            print("\t[annotate_publisher_type_from_institution_type] Journal='{}'"
-                  "\n\t\tprev_publisher_type='{}', institution='{}',\n\t\tinstitution_type='{}', new_publisher_type='{}'".format(
-                row.get("Journal"), row.get("Publisher type"), row.get("Institution"), row.get("Institution type"),
-                row.get("new_publisher_type")))
-    df_temp = df_temp.with_columns(pl.col("new_publisher_type").alias("Publisher type")).drop("new_publisher_type")
-    return df_temp
+
+def log_publisher_type_annotations(changes: pl.DataFrame) -> None:
+    """Print the Society-Run annotations in changes (previous type in 'Publisher type', new in 'new_publisher_type')."""
+    for row in changes.select(
+            ["Journal", "Publisher type", "Institution", "Institution type", "new_publisher_type"]).to_dicts():
+        print("\t[society_run_publisher_type_expr] Journal='{}'"
+              "\n\t\tprev_publisher_type='{}', institution='{}',\n\t\tinstitution_type='{}', new_publisher_type='{}'".format(
+            row.get("Journal"), row.get("Publisher type"), row.get("Institution"), row.get("Institution type"),
+            row.get("new_publisher_type")))
 
 
-def derive_business_model_from_APC(df: pl.DataFrame) -> pl.DataFrame:
+def derive_business_model_from_APC(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """ Derive 'Business model' from 'APC Euros'.
     - If APC Euros is > 0 and business model is empty or 'Subscription', set Business model to 'Hybrid'.
     """
@@ -786,7 +1045,7 @@ def derive_business_model_from_APC(df: pl.DataFrame) -> pl.DataFrame:
     return df
 
 
-def derive_APC_from_business_model(df: pl.DataFrame) -> pl.DataFrame:
+def derive_APC_from_business_model(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """ Derive 'APC Euros' from 'Business model'.
     - If Business model is 'OA diamond', set 'APC Euros' to 0.
     - If Business model is 'Subscription', set 'APC Euros' to None.
@@ -802,67 +1061,318 @@ def derive_APC_from_business_model(df: pl.DataFrame) -> pl.DataFrame:
     return df
 
 
-def format_table(df: pl.DataFrame) -> pl.DataFrame:
-    # Format numeric columns and URLs
-    df = format_APC_Euros(df)
-    df = format_Scimago_Rank(df)
-    df = format_urls(df)
+# ─── Persistent normalizer memo ──────────────────────────────────────────────
 
-    # Normalize text fields
-    # Format names
-    df = df.with_columns(
-        pl.col("Journal").map_elements(clean_string, return_dtype=pl.Utf8).alias("Journal")
-    )
-    df = df.with_columns(
-        pl.col("Publisher").map_elements(normalize_publisher, return_dtype=pl.Utf8).alias("Publisher")
-    )
-    # Format publisher type
-    df = df.with_columns(
-        pl.col("Publisher type").map_elements(format_publisher_type, return_dtype=pl.Utf8).alias("Publisher type")
-    )
+# Raw -> normalized memos of the pure string normalizers, reused across monthly runs
+MEMO_DIR = Path("data_extraction") / ".cache"
+# Entries kept per memo file; the oldest entries are dropped first
+MEMO_MAX_ENTRIES = 500_000
+
+# Memoizable normalizers and the helpers/rule tables their output depends on;
+# any change to one of them changes the memo version and evicts the stale file
+MEMO_NORMALIZERS = {
+    "clean_string": (clean_string, ascii_fallbacks, ASCII_FALLBACKS),
+    "normalize_publisher": (normalize_publisher, PUBLISHER_RULES, compile_publisher_rules, _publisher_test_source,
+                            normalize_publisher_series, _publisher_test_expr, clean_string, clean_string_expr,
+                            ascii_fallbacks, ASCII_FALLBACKS),
+    "standardize_country_name": (standardize_country_name,),
+}
+
+# Vectorized implementations used to compute memo misses in one batch
+MEMO_BATCH_NORMALIZERS = {
+    "normalize_publisher": normalize_publisher_series,
+}
+# Misses below which the scalar normalizer is faster than its batch version, which has a
+# fixed cost of several ms (see scripts/bench_normalize_publisher.py)
+MEMO_BATCH_MIN_MISSES = 5000
+
+_memos: dict[str, dict[str, str | None]] = {}
+_memo_stats: dict[str, dict[str, int]] = {}
+
+
+def memo_version(name: str) -> str:
+    """Short hash of the source code and rule tables of a memoized normalizer, and of the
+    Polars and Unicode database versions its string handling depends on.
+    """
+    assert name in MEMO_NORMALIZERS, f"{name} is not a memoized normalizer"
+    h = hashlib.sha256()
+    h.update(repr((pl.__version__, unicodedata.unidata_version)).encode("utf-8"))
+    for part in MEMO_NORMALIZERS[name]:
+        h.update((inspect.getsource(part) if callable(part) else repr(part)).encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
+def evict_stale_memos() -> None:
+    """Delete the memo files written by another rule version or for a normalizer no longer memoized.
+    Called once by the parent process, before any worker process loads a memo.
+    """
+    for path in MEMO_DIR.glob("*.parquet"):
+        name = path.stem.rsplit("-", 1)[0]
+        if name not in MEMO_NORMALIZERS:
+            print(f"Evicting memo {path} (normalizer no longer memoized)")
+            path.unlink(missing_ok=True)
+        elif path.stem != f"{name}-{memo_version(name)}":
+            print(f"Evicting stale memo {path} (rules of {name} changed)")
+            path.unlink(missing_ok=True)
+
+
+def load_memo(name: str) -> dict[str, str | None]:
+    """Return the memo of a normalizer, loading it from MEMO_DIR on first use.
+    Memo files of other rule versions are ignored (see evict_stale_memos).
+    """
+    if name in _memos:
+        return _memos[name]
+    path = MEMO_DIR / f"{name}-{memo_version(name)}.parquet"
+    memo: dict[str, str | None] = {}
+    if path.exists():
+        df = pl.read_parquet(path)
+        assert df.columns == ["raw", "value"], f"Unexpected columns in {path}: {df.columns}"
+        memo = dict(zip(df["raw"].to_list(), df["value"].to_list()))
+    _memos[name] = memo
+    _memo_stats[name] = {"hits": 0, "misses": 0, "loaded": len(memo)}
+    return memo
+
+
+def memo_map_series(s: pl.Series, fn) -> pl.Series:
+    """Apply a memoized normalizer to a Series: fn only runs on unique values missing from
+    the memo, results are mapped back with replace_strict. Nulls stay null (as with map_elements).
+    """
+    memo = load_memo(fn.__name__)
+    stats = _memo_stats[fn.__name__]
+    s = s.cast(pl.Utf8)
+    uniques = s.drop_nulls().unique().to_list()
+    missing = [v for v in uniques if v not in memo]
+    if len(missing) >= MEMO_BATCH_MIN_MISSES and fn.__name__ in MEMO_BATCH_NORMALIZERS:
+        computed = MEMO_BATCH_NORMALIZERS[fn.__name__](pl.Series(missing, dtype=pl.Utf8)).to_list()
+    else:
+        computed = [fn(v) for v in missing]
+    memo.update(zip(missing, computed))
+    stats["hits"] += len(uniques) - len(missing)
+    stats["misses"] += len(missing)
+    return s.replace_strict(uniques, [memo[v] for v in uniques], default=None, return_dtype=pl.Utf8)
+
+
+def map_unique_series(s: pl.Series, fn, return_dtype: pl.DataType = pl.Utf8,
+                      skip_nulls: bool = True) -> pl.Series:
+    """Same result as s.map_elements(fn), but fn is called once per distinct value (in order of
+    first appearance) and the results are mapped back with replace_strict.
+    Memoized normalizers (MEMO_NORMALIZERS) are resolved through their on-disk memo.
+    """
+    if MEMO_NORMALIZERS.get(fn.__name__, (None,))[0] is fn:
+        assert skip_nulls and return_dtype == pl.Utf8, f"Memoized {fn.__name__} maps non-null values to Utf8"
+        return memo_map_series(s, fn)
+    uniques = (s.drop_nulls() if skip_nulls else s).unique(maintain_order=True)
+    values = pl.Series([fn(v) for v in uniques.to_list()], dtype=return_dtype)
+    return s.replace_strict(uniques, values, default=None, return_dtype=return_dtype)
+
+
+def map_unique_expr(col: str | pl.Expr, fn, return_dtype: pl.DataType = pl.Utf8,
+                    skip_nulls: bool = True) -> pl.Expr:
+    """Lazy counterpart of map_unique: an expression applying fn once per distinct value
+    of col (see map_unique_series), usable inside a LazyFrame plan.
+    """
+    expr = pl.col(col) if isinstance(col, str) else col
+    return expr.map_batches(lambda s: map_unique_series(s, fn, return_dtype, skip_nulls), return_dtype=return_dtype)
+
+
+def map_unique(df: pl.DataFrame, col: str | list[str], fn, alias: str | None = None,
+               return_dtype: pl.DataType = pl.Utf8, skip_nulls: bool = True) -> pl.DataFrame:
+    """Apply fn to column col of df, calling it once per distinct value (see map_unique_series).
+    col may be a list of columns: fn then receives each distinct row as a dict, as with
+    map_elements on a struct. The result replaces col, or is written to alias if given.
+    """
+    if isinstance(col, str):
+        s = df.get_column(col)
+    else:
+        assert alias is not None, "map_unique over several columns needs an alias"
+        s = df.select(pl.struct(col)).to_series()
+    return df.with_columns(map_unique_series(s, fn, return_dtype, skip_nulls).alias(alias or col))
+
+
+def memo_updates() -> dict[str, tuple[dict[str, str | None], dict[str, int]]]:
+    """Entries added to each memo since it was loaded or last reported, with the hit/miss counts since then.
+    Used to hand the memo work of a worker process back to the parent (see merge_memo_updates),
+    once per task when a worker runs several of them.
+    """
+    updates = {}
+    for name, memo in _memos.items():
+        stats = _memo_stats[name]
+        added = dict(list(memo.items())[stats["loaded"]:])
+        updates[name] = (added, {"hits": stats["hits"], "misses": stats["misses"]})
+        stats.update(hits=0, misses=0, loaded=len(memo))
+    return updates
+
+
+def merge_memo_updates(updates: dict[str, tuple[dict[str, str | None], dict[str, int]]]) -> None:
+    """Merge the memo_updates of a worker process into the memos of this process."""
+    for name, (added, counts) in updates.items():
+        load_memo(name).update(added)
+        _memo_stats[name]["hits"] += counts["hits"]
+        _memo_stats[name]["misses"] += counts["misses"]
+
+
+def save_normalizer_memos() -> None:
+    """Write the memos that gained entries this run and print hit/miss counts.
+    Each file keeps the MEMO_MAX_ENTRIES most recently added entries.
+    """
+    for name, memo in _memos.items():
+        stats = _memo_stats[name]
+        print(f"Memo {name}: {stats['hits']} hits, {stats['misses']} misses ({len(memo)} entries)")
+        if len(memo) == stats["loaded"]:
+            continue
+        MEMO_DIR.mkdir(parents=True, exist_ok=True)
+        path = MEMO_DIR / f"{name}-{memo_version(name)}.parquet"
+        entries = list(memo.items())[-MEMO_MAX_ENTRIES:]
+        pl.DataFrame(
+            {"raw": [raw for raw, _ in entries], "value": [value for _, value in entries]},
+            schema={"raw": pl.Utf8, "value": pl.Utf8},
+        ).write_parquet(path)
+        stats["loaded"] = len(memo)
+
+
+# ─── Content-addressed lookup cache ──────────────────────────────────────────
+
+# Processed source lookup tables, reused as long as their inputs are unchanged
+LOOKUP_CACHE_DIR = MEMO_DIR / "lookups"
+
+
+def skip_gzip_header(f) -> None:
+    """Move f past the header of a gzip file, which holds the original file mtime and name."""
+    header = f.read(10)
+    assert header[:2] == b"\x1f\x8b", f"{f.name} is not a gzip file"
+    flags = header[3]
+    if flags & 4:  # FEXTRA
+        f.seek(int.from_bytes(f.read(2), "little"), 1)
+    for flag in (8, 16):  # FNAME, FCOMMENT
+        if flags & flag:
+            while f.read(1) not in (b"\0", b""):
+                pass
+    if flags & 2:  # FHCRC
+        f.read(2)
+
+
+def lookup_cache_key(files: list[str | Path], *extra) -> str:
+    """Short SHA-256 over the content of files, the repr of extra and the Polars version.
+    Gzip files are hashed without their header, so re-downloading unchanged data is a hit.
+    """
+    h = hashlib.sha256()
+    for path in files:
+        with open(path, "rb") as f:
+            if str(path).endswith(".gz"):
+                skip_gzip_header(f)
+            h.update(hashlib.file_digest(f, "sha256").digest())
+    h.update(repr((pl.__version__, *extra)).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def lookup_cache_path(name: str, files: list[str | Path], *extra) -> Path:
+    """Path of the cached_frame entry of name for the current content of files and extra."""
+    return LOOKUP_CACHE_DIR / f"{name}-{lookup_cache_key(files, *extra)}.arrow"
+
+
+def cached_frame(name: str, build, files: list[str | Path], *extra) -> pl.DataFrame:
+    """Return build(), cached in LOOKUP_CACHE_DIR under a key of files and extra (see lookup_cache_key).
+    Entries are uncompressed Arrow IPC files, memory-mapped on a hit. Entries of name written
+    for other inputs are deleted.
+    """
+    path = lookup_cache_path(name, files, *extra)
+    if path.exists():
+        print(f"Loaded {name} from cache {path}")
+        return pl.read_ipc(path)
+    for stale in LOOKUP_CACHE_DIR.glob(f"{name}-*.arrow"):
+        print(f"Evicting stale cache {stale} (inputs of {name} changed)")
+        stale.unlink(missing_ok=True)
+    df = build()
+    LOOKUP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    df.write_ipc(tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+    return df
+
+
+# Helper columns kept by format_table_lazy(log_columns=True) for log_format_table
+FORMAT_TABLE_LOG_COLUMNS = ["_invalid_APC", "_prev_publisher_type"]
+
+
+def format_table_lazy(lf: pl.LazyFrame, config: PublisherConfig,
+                      log_columns: bool = False) -> pl.LazyFrame:
+    """Build the whole table formatting and normalization as a single lazy query plan.
+
+    config is the PublisherConfig returned by load_publisher_config. Python normalizers run once
+    per distinct value inside the plan. With log_columns, the plan keeps FORMAT_TABLE_LOG_COLUMNS
+    (the invalid APC values and the publisher types replaced by a Society-Run annotation),
+    to be printed by log_format_table after collect.
+    """
+    # Format numeric columns and URLs
+    lf = lf.with_columns(format_APC_expr("APC Euros"))
+    lf = lf.with_columns(pl.when(invalid_APC_expr("APC Euros")).then(pl.col("APC Euros")).alias("_invalid_APC"))
+    lf = format_Scimago_Rank(lf)
+    lf = lf.with_columns([
+        map_unique_expr("Website", format_url),
+        # Normalize text fields
+        # Format names
+        map_unique_expr("Journal", clean_string),
+        map_unique_expr("Publisher", normalize_publisher),
+        # Format publisher type
+        map_unique_expr("Publisher type", format_publisher_type),
+        map_unique_expr("Country", standardize_country_name),
+        map_unique_expr("Institution", normalize_institution),
+        map_unique_expr("Institution type", normalize_institution_type),
+    ])
     # Force Business model to 'OA diamond' for all "Peer Community In" journals
-    df = df.with_columns(
-        pl.when(pl.col("Journal").cast(pl.Utf8).str.starts_with("Peer Community In"))
-        .then(pl.lit("OA diamond"))
-        .otherwise(pl.col("Business model"))
-        .alias("Business model")
-    )
-    df = df.with_columns(
-        pl.col("Business model").map_elements(normalize_business_model, return_dtype=pl.Utf8).alias("Business model"))
-    df = df.with_columns(
-        pl.col("Country").map_elements(standardize_country_name, return_dtype=pl.Utf8).alias("Country")
-    )
-    df = df.with_columns(
-        pl.col("Institution").map_elements(normalize_institution, return_dtype=pl.Utf8).alias("Institution")
-    )
-    # Infer types and annotate the publisher type based on the institution type
-    df = df.with_columns(
-        pl.col("Institution type").map_elements(normalize_institution_type, return_dtype=pl.Utf8).alias(
-            "Institution type")
+    lf = lf.with_columns(
+        map_unique_expr(
+            pl.when(pl.col("Journal").cast(pl.Utf8).str.starts_with("Peer Community In"))
+            .then(pl.lit("OA diamond"))
+            .otherwise(pl.col("Business model")),
+            normalize_business_model,
+        ).alias("Business model")
     )
     # Derive Country from Publisher when missing/empty
-    df = derive_country_from_publisher(df)
+    lf = derive_country_from_publisher(lf, config)
 
     # Ensure required columns exist for inference
-    df = ensure_columns(df)
+    lf = ensure_columns(lf)
 
     # Format ISSNs to standard XXXX-XXXX (ensures consistency with external source lookups)
-    df = df.with_columns([
-        pl.col("e-ISSN").map_elements(format_issn, return_dtype=pl.Utf8).alias("e-ISSN"),
-        pl.col("p-ISSN").map_elements(format_issn, return_dtype=pl.Utf8).alias("p-ISSN"),
-        pl.col("ISSN-L").map_elements(format_issn, return_dtype=pl.Utf8).alias("ISSN-L"),
-    ])
+    lf = lf.with_columns([format_issn_expr(c).alias(c) for c in ["e-ISSN", "p-ISSN", "ISSN-L"]])
 
     # Infer types and annotate the publisher type based on the institution type
-    df = infer_institution_type(df)
-    df = infer_publisher_type_from_publisher(df)
-    df = annotate_publisher_type_from_institution_type(df)
+    lf = infer_institution_type(lf)
+    lf = infer_publisher_type_from_publisher(lf, config)
+    new_type = society_run_publisher_type_expr()
+    lf = lf.with_columns(
+        pl.when(new_type != pl.col("Publisher type")).then(pl.col("Publisher type")).alias("_prev_publisher_type"),
+        new_type.alias("Publisher type"),
+    )
 
     # Infer Business model from APC first (Subscription + APC > 0 → Hybrid)
-    df = derive_business_model_from_APC(df)
+    lf = derive_business_model_from_APC(lf)
     # Then derive APC from Business model (OA diamond → 0, Subscription → None)
-    df = derive_APC_from_business_model(df)
-    return df
+    lf = derive_APC_from_business_model(lf)
+    if not log_columns:
+        lf = lf.drop(FORMAT_TABLE_LOG_COLUMNS)
+    return lf
+
+
+def log_format_table(df: pl.DataFrame) -> None:
+    """Print the invalid APCs and Society-Run annotations recorded by format_table_lazy(log_columns=True)."""
+    invalid = df.filter(pl.col("_invalid_APC").is_not_null())
+    if invalid.height > 0:
+        print("Invalid APC Euros values found:")
+        print(invalid.with_columns(pl.col("_invalid_APC").alias("APC Euros")).drop(FORMAT_TABLE_LOG_COLUMNS))
+    log_publisher_type_annotations(
+        df.filter(pl.col("_prev_publisher_type").is_not_null())
+        .with_columns(pl.col("Publisher type").alias("new_publisher_type"),
+                      pl.col("_prev_publisher_type").alias("Publisher type"))
+    )
+
+
+def format_table(df: pl.DataFrame) -> pl.DataFrame:
+    """Format and normalize a journal table (see format_table_lazy), printing its logs."""
+    df = format_table_lazy(df.lazy(), load_publisher_config(), log_columns=True).collect()
+    log_format_table(df)
+    return df.drop(FORMAT_TABLE_LOG_COLUMNS)
 
 
 def normalize_publisher_type(name: str) -> str:
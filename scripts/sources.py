@@ -0,0 +1,109 @@
+"""Parsed raw source dumps of data_extraction/, shared by all scripts.
+
+Each dump is parsed once into an uncompressed Arrow IPC mirror in
+data_extraction/.cache/lookups/, named after the content hash of the dump and its parse
+options (see libraries.lookup_cache_key). Gzip dumps are decompressed chunk by chunk into
+a temporary file that Polars streams into the mirror, so the uncompressed dump is never
+held in memory. Later reads memory-map the mirror instead of re-parsing the CSV.
+
+Usage:
+    import sources
+    doaj_df = sources.scan_source("doaj").select(["Journal title", "Publisher"]).collect()
+    scimago_df = sources.scimago()
+"""
+
+import gzip
+import os
+import shutil
+from pathlib import Path
+import polars as pl
+from libraries import LOOKUP_CACHE_DIR, lookup_cache_key
+
+SCIMAGO_FILE = os.path.join("data_extraction", "scimagojr.csv.gz")
+OPENAPC_FILE = os.path.join("data_extraction", "openapc.csv.gz")
+DOAJ_FILE = os.path.join("data_extraction", "DOAJ.csv.gz")
+DATAVERSE_FILE = os.path.join("data_extraction", "APC_dataverse.txt.gz")
+PCI_FRIENDLY_FILE = os.path.join("data_extraction", "PCI_friendly.csv.gz")
+
+# Source name -> (dump path, read_csv options)
+SOURCES: dict[str, tuple[str, dict]] = {
+    "scimago": (SCIMAGO_FILE, {"separator": ";"}),
+    "openapc": (OPENAPC_FILE, {}),
+    "doaj": (DOAJ_FILE, {}),
+    "dataverse": (DATAVERSE_FILE, {"separator": "\t", "encoding": "utf8-lossy"}),
+    "pci_friendly": (PCI_FRIENDLY_FILE, {}),
+}
+
+_mirrors: dict[str, Path] = {}
+_sources: dict[str, pl.DataFrame] = {}
+
+
+def write_mirror(path: str, options: dict, mirror: Path) -> None:
+    """Stream the dump at path, parsed with options, into the IPC file mirror."""
+    LOOKUP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    csv_path = path
+    if path.endswith(".gz"):
+        csv_path = mirror.with_suffix(".csv")
+        with gzip.open(path, "rb") as src, open(csv_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+    tmp_path = mirror.with_suffix(".tmp")
+    try:
+        pl.scan_csv(csv_path, **options).sink_ipc(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, mirror)
+    finally:
+        if csv_path != path:
+            os.remove(csv_path)
+
+
+def source_mirror(name: str) -> Path:
+    """Return the IPC mirror of source name, writing it when the dump changed."""
+    if name in _mirrors:
+        return _mirrors[name]
+    assert name in SOURCES, f"Unknown source '{name}', expected one of {list(SOURCES)}"
+    path, options = SOURCES[name]
+    mirror = LOOKUP_CACHE_DIR / f"source_{name}-{lookup_cache_key([path], sorted(options.items()))}.arrow"
+    if not mirror.exists():
+        for stale in LOOKUP_CACHE_DIR.glob(f"source_{name}-*.arrow"):
+            print(f"Evicting stale mirror {stale} ({path} changed)")
+            stale.unlink(missing_ok=True)
+        print(f"Mirroring {path} to {mirror}")
+        write_mirror(path, options, mirror)
+    _mirrors[name] = mirror
+    return mirror
+
+
+def scan_source(name: str) -> pl.LazyFrame:
+    """LazyFrame over the mirror of source name: selects and filters are pushed down to the scan."""
+    return pl.scan_ipc(source_mirror(name))
+
+
+def load_source(name: str) -> pl.DataFrame:
+    """All columns of source name, memory-mapped from its mirror and kept for the process."""
+    if name not in _sources:
+        _sources[name] = pl.read_ipc(source_mirror(name))
+    return _sources[name]
+
+
+def scimago() -> pl.DataFrame:
+    """Scimago journal rankings (scimagojr.csv.gz)."""
+    return load_source("scimago")
+
+
+def openapc() -> pl.DataFrame:
+    """OpenAPC article processing charges (openapc.csv.gz)."""
+    return load_source("openapc")
+
+
+def doaj() -> pl.DataFrame:
+    """DOAJ journal metadata (DOAJ.csv.gz)."""
+    return load_source("doaj")
+
+
+def dataverse() -> pl.DataFrame:
+    """Annual APCs of six large publishers (APC_dataverse.txt.gz)."""
+    return load_source("dataverse")
+
+
+def pci_friendly() -> pl.DataFrame:
+    """PCI-friendly journals (PCI_friendly.csv.gz)."""
+    return load_source("pci_friendly")
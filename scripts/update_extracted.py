@@ -1,20 +1,31 @@
+import argparse
+import contextlib
 import datetime
+import hashlib
+import io
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
-from collections import Counter, defaultdict
+from collections import defaultdict
 from libraries import *
-import re
+import sources
 
 # Current year used for openAPC recency check
 CURRENT_YEAR = datetime.datetime.now().year
 
 # Constants
 DATA_EXTRACTED_DIR = "data_extracted"
-SCIMAGO_FILE = os.path.join("data_extraction", "scimagojr.csv.gz")
+SCIMAGO_FILE = sources.SCIMAGO_FILE
 ISSN_TYPE_FILE = os.path.join("config", "ISSN_type.csv")
-OPENAPC_FILE = os.path.join("data_extraction", "openapc.csv.gz")
-DOAJ_FILE = os.path.join("data_extraction", "DOAJ.csv.gz")
-DATAVERSE_FILE = os.path.join("data_extraction", "APC_dataverse.txt.gz")
+# Bit of each ISSN type code in the Type_mask column of the ISSN type index
+ISSN_TYPE_BITS = {"e": 1, "p": 2, "l": 4}
+OPENAPC_FILE = sources.OPENAPC_FILE
+DOAJ_FILE = sources.DOAJ_FILE
+DATAVERSE_FILE = sources.DATAVERSE_FILE
+# Code the cached lookup tables depend on (see cached_frame)
+LOOKUP_CODE_FILES = [__file__] + [os.path.join(os.path.dirname(os.path.abspath(__file__)), f)
+                                  for f in ["libraries.py", "sources.py"]]
 FILES_TO_SKIP = []
 
 # Columns that should be updated from each data source
@@ -44,7 +55,6 @@ FILE_COLS = {"scimago": [("Scimago Rank", True),
                            ("Business model", False)]}
 
 COLUMNS_TO_UPDATE = set([col for cols in FILE_COLS.values() for col, _ in cols])
-print(f"Columns to update: {COLUMNS_TO_UPDATE}")
 
 # Maps source name -> presence column written in data_extracted CSVs
 # (Dataverse intentionally omitted — no presence column was requested for it)
@@ -58,30 +68,34 @@ SOURCE_PRESENCE_COL = {
 PRESENCE_VALUES = ["Yes", "With alternative journal name", "ISSN-L match",
                    "e-ISSN match", "p-ISSN match", "Ambiguous", "No"]
 
+# Dataset ISSN columns matched through their packed UInt32 codes (<col>_code, see issn_code_expr)
+ISSN_KEY_COLS = ["ISSN-L", "e-ISSN", "p-ISSN"]
+
 # Candidate join key cascade for each source.
 # Each entry is (left_col_in_target, right_col_in_lookup, presence_label).
 # Keys are tried in order; once a row gets a non-"No"/non-"Ambiguous" presence it stops.
+# ISSN steps compare the packed integer codes; the resolved join keys stay XXXX-XXXX strings.
 CANDIDATE_KEYS: dict[str, list[tuple[str, str, str]]] = {
     "scimago": [
         ("norm_journal", "norm_journal_scimago", "Yes"),
         ("alt_journal_norm", "norm_journal_scimago", "With alternative journal name"),
-        ("ISSN-L", "ISSN-L_scimago", "ISSN-L match"),
-        ("e-ISSN", "e-ISSN_scimago", "e-ISSN match"),
-        ("p-ISSN", "p-ISSN_scimago", "p-ISSN match"),
+        ("ISSN-L_code", "ISSN-L_scimago_code", "ISSN-L match"),
+        ("e-ISSN_code", "e-ISSN_scimago_code", "e-ISSN match"),
+        ("p-ISSN_code", "p-ISSN_scimago_code", "p-ISSN match"),
     ],
     "openapc": [
         ("norm_journal", "norm_journal_openapc", "Yes"),
         ("alt_journal_norm", "norm_journal_openapc", "With alternative journal name"),
-        ("ISSN-L", "ISSN-L_openapc", "ISSN-L match"),
-        ("e-ISSN", "e-ISSN_openapc", "e-ISSN match"),
-        ("p-ISSN", "p-ISSN_openapc", "p-ISSN match"),
+        ("ISSN-L_code", "ISSN-L_openapc_code", "ISSN-L match"),
+        ("e-ISSN_code", "e-ISSN_openapc_code", "e-ISSN match"),
+        ("p-ISSN_code", "p-ISSN_openapc_code", "p-ISSN match"),
     ],
     "doaj": [
         ("norm_journal", "norm_journal_doaj", "Yes"),
         ("alt_journal_norm", "norm_journal_doaj", "With alternative journal name"),
         # DOAJ lookup has no ISSN-L column
-        ("e-ISSN", "e-ISSN_doaj", "e-ISSN match"),
-        ("p-ISSN", "p-ISSN_doaj", "p-ISSN match"),
+        ("e-ISSN_code", "e-ISSN_doaj_code", "e-ISSN match"),
+        ("p-ISSN_code", "p-ISSN_doaj_code", "p-ISSN match"),
     ],
     "dataverse": [
         ("norm_journal", "norm_journal_dataverse", "Yes"),
@@ -98,53 +112,66 @@ PUBLISHER_TYPE_BG_HEX: dict[str, str] = {
 }
 
 
-def format_scimago_quartile_from_categories(categories_str: str | None, best_quartile: str | None) -> str | None:
-    """Return a string like 'Q1 (Oncology and Cancer; Medicine)' built from the Categories field.
+SCIMAGO_QUARTILE_TAG = r"\(Q([1-4])\)"
+
+
+def format_scimago_quartiles(scimago_df: pl.DataFrame) -> pl.DataFrame:
+    """Build strings like 'Q1 (Oncology and Cancer; Medicine)' from the Categories field.
 
     Logic:
     - Parse categories like 'Oncology and Cancer (Q1); Medicine (miscellaneous) (Q1)'.
-    - Determine the best quartile (prefer the provided best_quartile; if missing, infer best from categories).
-    - Keep only categories with that best quartile.
-    - Remove '(*)' from category names and strip trailing spaces.
-    - Format as 'Qx (Cat1; Cat2)'. If no categories found, return just 'Qx'. If nothing available, return None.
+    - Remove the '(Qn)' tag and any trailing '(*)' from category names, and strip spaces.
+    - Keep the first occurrence of each category name, then only those with the best quartile.
+    - Format as 'Qx (Cat1; Cat2)'. If no categories match, return just the best quartile.
+
+    All Categories cells are split and exploded in one pass and re-joined per row.
+
+    Args:
+        scimago_df: Scimago frame with a '_row' index, 'Categories_scimago' and 'Best Quartile_scimago'.
+
+    Returns:
+        One row per '_row': '_row' and 'Scimago Quartile_scimago'.
     """
-    if categories_str is None:
-        categories_str = ""
-
-    # Split individual category entries
-    raw_items = [part.strip() for part in categories_str.split(";") if part.strip()]
-
-    # Extract (clean_name, 'Qn' or None)
-    extracted: list[tuple[str, str | None]] = []
-    q_pat = re.compile(r"\(Q([1-4])\)")
-    set_extracted = set()
-    for item in raw_items:
-        # Find quartile tag, typically at the end
-        m = q_pat.search(item)
-        q = f"Q{m.group(1)}" if m else None
-        # Remove the quartile tag and '(miscellaneous)' tag from the name
-        name = q_pat.sub("", item)
-        # Remove anything between parentheses at the end (e.g., miscellaneous)
-        name = re.sub(r"\s*\(.*?\)\s*$", "", name)
-        name = name.strip()
-        # Guard against empty after cleaning
-        if name and name not in set_extracted:
-            set_extracted.add(name)
-            extracted.append((name, q))
-
-    # Keep only categories with that best quartile
-    best_items = [name for name, q in extracted if q == best_quartile]
-    if best_items:
-        return f"{best_quartile} ({'; '.join(best_items)})"
-    # If we have no category names but we do know best quartile, return just best
-    return best_quartile
-
-
-def load_issn_type_lookup() -> dict[str, str]:
-    """Load config/ISSN_type.csv and return a dict mapping ISSN → combined type string.
-
-    The type string is a semicolon-joined set of type codes sorted by TYPE_ORDER,
-    e.g. "p;l", "e;l", "e", "p".
+    best = pl.col("Best Quartile_scimago")
+    items = (
+        scimago_df.select("_row", best, pl.col("Categories_scimago").cast(pl.Utf8).str.split(";").alias("_name"))
+        .explode("_name")
+        .with_columns(pl.col("_name").str.strip_chars())
+        .filter(pl.col("_name") != "")
+        .with_columns([
+            pl.concat_str(pl.lit("Q"), pl.col("_name").str.extract(SCIMAGO_QUARTILE_TAG, 1)).alias("_q"),
+            pl.col("_name")
+            .str.replace_all(SCIMAGO_QUARTILE_TAG, "")
+            # Remove anything between parentheses at the end (e.g., miscellaneous)
+            .str.replace(r"\s*\(.*?\)\s*$", "")
+            .str.strip_chars(),
+        ])
+        .filter(pl.col("_name") != "")
+        .unique(["_row", "_name"], keep="first", maintain_order=True)
+        # Untagged categories match a missing best quartile, which is then rendered as 'None'
+        .filter(pl.col("_q").eq_missing(best))
+        .group_by("_row", maintain_order=True)
+        .agg("_name")
+    )
+    return (
+        scimago_df.select("_row", best)
+        .join(items, on="_row", how="left")
+        .sort("_row")
+        .select(
+            "_row",
+            pl.when(pl.col("_name").is_not_null())
+            .then(pl.format("{} ({})", best.fill_null("None"), pl.col("_name").list.join("; ")))
+            .otherwise(best)
+            .alias("Scimago Quartile_scimago"),
+        )
+    )
+
+
+def load_issn_type_index() -> pl.DataFrame:
+    """Load config/ISSN_type.csv as a compact index sorted by packed ISSN code.
+
+    Columns: ISSN_code (UInt32, see issn_code_expr) and Type_mask (UInt8), the OR of
+    ISSN_TYPE_BITS for the semicolon-joined type codes of the file (e.g. "p;l" -> 2 | 4).
     """
     df = pl.read_csv(ISSN_TYPE_FILE)
     assert list(df.columns) == ["ISSN", "Type"], (
@@ -156,41 +183,59 @@ def load_issn_type_lookup() -> dict[str, str]:
     assert df.filter(pl.col("ISSN").is_null() | pl.col("Type").is_null()).height == 0, (
         f"{ISSN_TYPE_FILE} has null ISSN or Type values"
     )
-    return dict(zip(df["ISSN"].to_list(), df["Type"].to_list()))
+    # replace_strict fails on unknown type codes
+    index = df.select(
+        issn_code_expr("ISSN").alias("ISSN_code"),
+        pl.col("Type").str.split(";")
+        .list.eval(pl.element().replace_strict(ISSN_TYPE_BITS, return_dtype=pl.UInt8).bitwise_or())
+        .list.first().alias("Type_mask"),
+    ).sort("ISSN_code")
+    assert index["ISSN_code"].null_count() == 0, f"{ISSN_TYPE_FILE} has malformed ISSNs"
+    return index
+
+
+def with_issn_codes(df: pl.DataFrame, issn_cols: list[str]) -> pl.DataFrame:
+    """Add the packed UInt32 code (<col>_code, see issn_code_expr) of each formatted ISSN column."""
+    return df.with_columns([issn_code_expr(c).alias(f"{c}_code") for c in issn_cols])
+
+
+# Scimago ISSN columns filled from the Issn cell, with the ISSN type bit each one takes
+SCIMAGO_ISSN_TYPE_COLS = [
+    ("e-ISSN_scimago", ISSN_TYPE_BITS["e"]),
+    ("p-ISSN_scimago", ISSN_TYPE_BITS["p"]),
+    ("ISSN-L_scimago", ISSN_TYPE_BITS["l"]),
+]
 
 
-def classify_scimago_issns(issns_str: str | None, issn_type_lookup: dict[str, str]
-                           ) -> tuple[str | None, str | None, str | None]:
-    """Classify ISSNs from a Scimago 'Issn' cell into e-ISSN, p-ISSN, and ISSN-L.
+def classify_scimago_issns(scimago_df: pl.DataFrame, issn_type_index: pl.DataFrame) -> pl.DataFrame:
+    """Classify the ISSNs of each Scimago 'Issn' cell into e-ISSN, p-ISSN, and ISSN-L.
 
     The Scimago Issn cell contains comma-separated ISSNs, e.g. "1234-5678, 8765-4321".
-    Each ISSN is looked up in issn_type_lookup; the type string (e.g. "p;l") is split
-    on ";" to determine which categories (e, p, l) the ISSN belongs to.
-    Returns the first ISSN found for each category (e_issn, p_issn, issn_l).
-    """
-    if issns_str is None:
-        return None, None, None
+    All cells are split and exploded in one pass (keeping the order of the parts), formatted,
+    and joined on packed code to the ISSN type index. Parts with a wrong check digit are
+    dropped before the join, so they never become join keys. For each type, the first
+    remaining ISSN of the cell whose Type_mask has that bit is kept.
 
-    e_issn = None
-    p_issn = None
-    issn_l = None
-
-    for part in str(issns_str).split(","):
-        formatted = format_issn(part.strip())
-        if formatted is None:
-            continue
-        type_str = issn_type_lookup.get(formatted)
-        if type_str is None:
-            continue
-        codes = set(type_str.split(";"))
-        if "e" in codes and e_issn is None:
-            e_issn = formatted
-        if "p" in codes and p_issn is None:
-            p_issn = formatted
-        if "l" in codes and issn_l is None:
-            issn_l = formatted
+    Args:
+        scimago_df:      Scimago frame with a '_row' index and the 'Issn_scimago' column.
+        issn_type_index: Index returned by load_issn_type_index.
 
-    return e_issn, p_issn, issn_l
+    Returns:
+        One row per '_row' with at least one known ISSN: '_row' and SCIMAGO_ISSN_TYPE_COLS.
+    """
+    parts = (
+        scimago_df.select("_row", pl.col("Issn_scimago").cast(pl.Utf8).str.split(",").alias("_issn"))
+        .explode("_issn")
+        .with_row_index("_pos")
+        .with_columns(format_issn_expr("_issn", validate_check_digit=True).alias("_issn"))
+        .with_columns(issn_code_expr("_issn").alias("ISSN_code"))
+        .join(issn_type_index, on="ISSN_code", how="inner")
+        .sort("_pos")
+    )
+    return parts.group_by("_row", maintain_order=True).agg([
+        pl.col("_issn").filter((pl.col("Type_mask") & bit) != 0).first().alias(col)
+        for col, bit in SCIMAGO_ISSN_TYPE_COLS
+    ])
 
 
 def build_issn_title_lookup(lookup_df: pl.DataFrame, title_col: str, issn_cols: list[str]) -> dict[str, list[str]]:
@@ -219,23 +264,23 @@ def load_scimago_lookup() -> pl.DataFrame:
     Returns:
         pl.DataFrame: Processed Scimago lookup table with normalized journal names.
     """
-    scimago_df = load_csv(SCIMAGO_FILE, separator=';')
-    scimago_df = scimago_df.rename({
+    scimago_columns = {
         "Title": "Journal_scimago",
         "SJR": "Scimago Rank_scimago",
         "Publisher": "Publisher_scimago",
         "SJR Best Quartile": "Scimago Quartile_scimago",
         "H index": "H index_scimago",
         "Country": "Country_scimago",
-        "Areas": "Areas_scimago",
         "Categories": "Categories_scimago",
         "Open Access": "Open Access_scimago",
         "Open Access Diamond": "Open Access Diamond_scimago",
         "Issn": "Issn_scimago",
-    })
+    }
+    # Read only the columns used below
+    scimago_df = sources.scan_source("scimago").select(list(scimago_columns)).rename(scimago_columns).collect()
 
     scimago_df = scimago_df.with_columns([
-        pl.col("Journal_scimago").map_elements(norm_name, return_dtype=pl.Utf8).alias("norm_journal_scimago"),
+        norm_name_expr("Journal_scimago").alias("norm_journal_scimago"),
         pl.col("Scimago Quartile_scimago").alias("Best Quartile_scimago"),
         pl.when(pl.col("Open Access Diamond_scimago") == "Yes")
         .then(pl.lit("OA diamond"))
@@ -245,40 +290,22 @@ def load_scimago_lookup() -> pl.DataFrame:
         .alias("Business model_scimago"),
     ])
     # Normalize publisher names for consistent enrichment and disagreement comparison
-    scimago_df = scimago_df.with_columns(
-        pl.col("Publisher_scimago").map_elements(normalize_publisher, return_dtype=pl.Utf8).alias("Publisher_scimago")
-    )
+    scimago_df = map_unique(scimago_df, "Publisher_scimago", normalize_publisher)
 
     # Format Scimago Rank to standard numeric format
     scimago_df = format_Scimago_Rank(scimago_df, "Scimago Rank_scimago")
 
-    # Build formatted Scimago Quartile from Categories + best quartile
-    scimago_df = scimago_df.with_columns(
-        pl.struct(["Categories_scimago", "Best Quartile_scimago"]).map_elements(
-            lambda s: format_scimago_quartile_from_categories(
-                s.get("Categories_scimago"),
-                s.get("Best Quartile_scimago")
-            ),
-            return_dtype=pl.Utf8,
-        ).alias("Scimago Quartile_scimago")
-    )
-
-    # Classify ISSNs into e-ISSN, p-ISSN, ISSN-L using the ISSN type lookup
-    issn_type_lookup = load_issn_type_lookup()
-    scimago_df = scimago_df.with_columns(
-        pl.col("Issn_scimago").map_elements(
-            lambda issns: classify_scimago_issns(issns, issn_type_lookup)[0],
-            return_dtype=pl.Utf8,
-        ).alias("e-ISSN_scimago"),
-        pl.col("Issn_scimago").map_elements(
-            lambda issns: classify_scimago_issns(issns, issn_type_lookup)[1],
-            return_dtype=pl.Utf8,
-        ).alias("p-ISSN_scimago"),
-        pl.col("Issn_scimago").map_elements(
-            lambda issns: classify_scimago_issns(issns, issn_type_lookup)[2],
-            return_dtype=pl.Utf8,
-        ).alias("ISSN-L_scimago"),
+    # Build formatted Scimago Quartile from Categories + best quartile, and classify ISSNs
+    # into e-ISSN, p-ISSN, ISSN-L using the ISSN type index
+    scimago_df = scimago_df.with_row_index("_row")
+    scimago_df = (
+        scimago_df.drop("Scimago Quartile_scimago")
+        .join(format_scimago_quartiles(scimago_df), on="_row", how="left")
+        .join(classify_scimago_issns(scimago_df, load_issn_type_index()), on="_row", how="left")
+        .sort("_row")
+        .drop("_row")
     )
+    scimago_issn_cols = [col for col, _ in SCIMAGO_ISSN_TYPE_COLS]
 
     selected_columns = [
         "norm_journal_scimago",
@@ -294,7 +321,7 @@ def load_scimago_lookup() -> pl.DataFrame:
         "ISSN-L_scimago",
     ]
     # Return all rows without deduplication (duplicates handled by compute_presence_and_keys)
-    return scimago_df.select(selected_columns)
+    return with_issn_codes(scimago_df.select(selected_columns), scimago_issn_cols)
 
 
 def load_openapc_lookup() -> pl.DataFrame:
@@ -307,13 +334,21 @@ def load_openapc_lookup() -> pl.DataFrame:
     Returns:
         pl.DataFrame: Processed OpenAPC lookup table with normalized journal names.
     """
-    openapc_df = load_csv(OPENAPC_FILE)
-    openapc_df = openapc_df.rename(
-        {"journal_full_title": "Journal_openapc",
-         "euro": "APC Euros_openapc",
-         "publisher": "Publisher_openapc",
-         "issn_electronic": "e-ISSN_openapc",
-         "issn_l": "ISSN-L_openapc"}
+    openapc_columns = {
+        "journal_full_title": "Journal_openapc",
+        "euro": "APC Euros_openapc",
+        "publisher": "Publisher_openapc",
+        "issn_electronic": "e-ISSN_openapc",
+        "issn_l": "ISSN-L_openapc",
+    }
+    # Read only the columns used below, and only the records recent enough to be kept:
+    # a journal's most recent period must be >= CURRENT_YEAR - 3 and only that period is kept
+    openapc_df = (
+        sources.scan_source("openapc")
+        .select(list(openapc_columns) + ["issn_print", "period", "is_hybrid"])
+        .filter(pl.col("period") >= (CURRENT_YEAR - 3))
+        .rename(openapc_columns)
+        .collect()
     )
 
     # Treat "NA" as null for print ISSN
@@ -357,21 +392,18 @@ def load_openapc_lookup() -> pl.DataFrame:
     ]
     openapc_df = openapc_df.group_by("Journal_openapc").agg(agg_expressions)
     # Normalize publisher names for consistent enrichment and disagreement comparison
-    openapc_df = openapc_df.with_columns(
-        pl.col("Publisher_openapc").map_elements(normalize_publisher, return_dtype=pl.Utf8).alias("Publisher_openapc")
-    )
+    openapc_df = map_unique(openapc_df, "Publisher_openapc", normalize_publisher)
 
     # Format ISSNs to standard XXXX-XXXX
     openapc_df = openapc_df.with_columns([
-        pl.col("e-ISSN_openapc").map_elements(format_issn, return_dtype=pl.Utf8).alias("e-ISSN_openapc"),
-        pl.col("p-ISSN_openapc").map_elements(format_issn, return_dtype=pl.Utf8).alias("p-ISSN_openapc"),
-        pl.col("ISSN-L_openapc").map_elements(format_issn, return_dtype=pl.Utf8).alias("ISSN-L_openapc"),
+        format_issn_expr(c, validate_check_digit=True).alias(c)
+        for c in ["e-ISSN_openapc", "p-ISSN_openapc", "ISSN-L_openapc"]
     ])
 
     openapc_df = format_APC_Euros(openapc_df, "APC Euros_openapc")
     # Normalize journal names first
     openapc_df = openapc_df.with_columns(
-        pl.col("Journal_openapc").map_elements(norm_name, return_dtype=pl.Utf8).alias("norm_journal_openapc")
+        norm_name_expr("Journal_openapc").alias("norm_journal_openapc")
     )
     selected_columns = [
         "norm_journal_openapc",
@@ -383,7 +415,7 @@ def load_openapc_lookup() -> pl.DataFrame:
         "p-ISSN_openapc",
         "ISSN-L_openapc",
     ]
-    return openapc_df.select(selected_columns)
+    return with_issn_codes(openapc_df.select(selected_columns), ["e-ISSN_openapc", "p-ISSN_openapc", "ISSN-L_openapc"])
 
 
 def load_dataverse_lookup() -> pl.DataFrame:
@@ -392,10 +424,13 @@ def load_dataverse_lookup() -> pl.DataFrame:
     Returns:
         pl.DataFrame: Processed Dataverse lookup table with normalized journal names and aggregated data from last 5 years.
     """
-    dataverse_df = load_csv(DATAVERSE_FILE, separator='\t', encoding="utf8-lossy")
-
     # Only keep rows where APC was actually provided
-    dataverse_df = dataverse_df.filter(pl.col("APC_provided") == "yes")
+    dataverse_df = (
+        sources.scan_source("dataverse")
+        .select(["Journal", "Publisher", "APC_EUR", "APC_year", "OA_status", "APC_provided"])
+        .filter(pl.col("APC_provided") == "yes")
+        .collect()
+    )
 
     # Rename columns to our convention
     dataverse_df = dataverse_df.rename({
@@ -407,7 +442,7 @@ def load_dataverse_lookup() -> pl.DataFrame:
 
     # Normalize journal names
     dataverse_df = dataverse_df.with_columns(
-        pl.col("Journal_dataverse").map_elements(norm_name, return_dtype=pl.Utf8).alias("norm_journal_dataverse")
+        norm_name_expr("Journal_dataverse").alias("norm_journal_dataverse")
     )
 
     # Map OA_status to Business model
@@ -437,10 +472,7 @@ def load_dataverse_lookup() -> pl.DataFrame:
     ])
 
     # Normalize publisher names
-    dataverse_df = dataverse_df.with_columns(
-        pl.col("Publisher_dataverse").map_elements(normalize_publisher, return_dtype=pl.Utf8).alias(
-            "Publisher_dataverse")
-    )
+    dataverse_df = map_unique(dataverse_df, "Publisher_dataverse", normalize_publisher)
 
     return format_APC_Euros(dataverse_df, "APC Euros_dataverse")
 
@@ -451,10 +483,8 @@ def load_doaj_lookup() -> pl.DataFrame:
     Returns:
         pl.DataFrame: Processed DOAJ lookup table with normalized journal names.
     """
-    doaj_df = load_csv(DOAJ_FILE)
-
-    # Rename columns to match our naming convention
-    doaj_df = doaj_df.rename({
+    # Read only the columns used below, renamed to match our naming convention
+    doaj_columns = {
         "Journal title": "Journal_doaj",
         "Publisher": "Publisher_doaj",
         "Country of publisher": "Country_doaj",
@@ -463,11 +493,12 @@ def load_doaj_lookup() -> pl.DataFrame:
         "APC amount": "APC Euros_doaj",
         "Journal ISSN (print version)": "p-ISSN_doaj",
         "Journal EISSN (online version)": "e-ISSN_doaj",
-    })
+    }
+    doaj_df = sources.scan_source("doaj").select(list(doaj_columns)).rename(doaj_columns).collect()
 
     # Normalize journal names
     doaj_df = doaj_df.with_columns(
-        pl.col("Journal_doaj").map_elements(norm_name, return_dtype=pl.Utf8).alias("norm_journal_doaj")
+        norm_name_expr("Journal_doaj").alias("norm_journal_doaj")
     )
 
     # Filter APC Euros to only include EUR currency
@@ -480,24 +511,17 @@ def load_doaj_lookup() -> pl.DataFrame:
     )
 
     # Standardize country names
-    doaj_df = doaj_df.with_columns(
-        pl.col("Country_doaj").map_elements(standardize_country_name, return_dtype=pl.Utf8).alias("Country_doaj")
-    )
+    doaj_df = map_unique(doaj_df, "Country_doaj", standardize_country_name)
 
     # Clean institution names
-    doaj_df = doaj_df.with_columns(
-        pl.col("Institution_doaj").map_elements(normalize_institution, return_dtype=pl.Utf8).alias("Institution_doaj")
-    )
+    doaj_df = map_unique(doaj_df, "Institution_doaj", normalize_institution)
 
     # Clean publisher names
-    doaj_df = doaj_df.with_columns(
-        pl.col("Publisher_doaj").map_elements(normalize_publisher, return_dtype=pl.Utf8).alias("Publisher_doaj")
-    )
+    doaj_df = map_unique(doaj_df, "Publisher_doaj", normalize_publisher)
 
     # Format ISSNs to standard XXXX-XXXX
     doaj_df = doaj_df.with_columns([
-        pl.col("e-ISSN_doaj").map_elements(format_issn, return_dtype=pl.Utf8).alias("e-ISSN_doaj"),
-        pl.col("p-ISSN_doaj").map_elements(format_issn, return_dtype=pl.Utf8).alias("p-ISSN_doaj"),
+        format_issn_expr(c, validate_check_digit=True).alias(c) for c in ["e-ISSN_doaj", "p-ISSN_doaj"]
     ])
 
     # Format APC Euros (extract numeric value)
@@ -516,7 +540,71 @@ def load_doaj_lookup() -> pl.DataFrame:
         "p-ISSN_doaj",
     ]
     # Keep only necessary columns and remove duplicates (keep first occurrence)
-    return doaj_df.select(selected_columns)
+    return with_issn_codes(doaj_df.select(selected_columns), ["e-ISSN_doaj", "p-ISSN_doaj"])
+
+
+# Processed lookup tables: name -> (loader, source label, files and extra values its cache key
+# depends on, the source file first). The OpenAPC recency filter depends on the current year.
+LOOKUPS = {
+    "scimago_lookup": (load_scimago_lookup, "Scimago", [SCIMAGO_FILE, ISSN_TYPE_FILE], ()),
+    "openapc_lookup": (load_openapc_lookup, "OpenAPC", [OPENAPC_FILE], (CURRENT_YEAR,)),
+    "doaj_lookup": (load_doaj_lookup, "DOAJ", [DOAJ_FILE], ()),
+    "dataverse_lookup": (load_dataverse_lookup, "Dataverse", [DATAVERSE_FILE], ()),
+}
+
+
+# Source name -> LOOKUPS table it enriches from, in enrichment order
+SOURCE_LOOKUPS = {
+    "scimago": "scimago_lookup",
+    "openapc": "openapc_lookup",
+    "doaj": "doaj_lookup",
+    "dataverse": "dataverse_lookup",
+}
+
+
+def load_lookup(name: str) -> pl.DataFrame:
+    """Return lookup table name, through its cache (see cached_frame)."""
+    loader, _, files, extra = LOOKUPS[name]
+    return cached_frame(name, loader, files + LOOKUP_CODE_FILES, *extra)
+
+
+def build_lookup(name: str) -> tuple[str, dict]:
+    """Worker entry point: build lookup table name into its cache file.
+
+    Returns:
+        The captured log of the loader and the memo_updates of the worker.
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        load_lookup(name)
+    return log.getvalue(), memo_updates()
+
+
+def load_lookups(jobs: int = 1) -> dict[str, pl.DataFrame]:
+    """Load all LOOKUPS tables, in LOOKUPS order.
+
+    With jobs > 1, the tables missing from the cache are built concurrently in worker
+    processes (the loaders are dominated by Python normalizers, which hold the GIL).
+    Each worker writes its table to the Arrow IPC cache, which is then memory-mapped here;
+    worker logs are printed and worker memos merged in LOOKUPS order.
+    """
+    missing = [name for name, (_, _, files, extra) in LOOKUPS.items()
+               if not lookup_cache_path(name, files + LOOKUP_CODE_FILES, *extra).exists()]
+    if jobs > 1 and len(missing) > 1:
+        # spawn, not fork: forking after Polars started its thread pool can deadlock
+        with ProcessPoolExecutor(max_workers=min(jobs, len(missing)),
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {name: pool.submit(build_lookup, name) for name in missing}
+            for name in missing:
+                log, updates = futures[name].result()
+                print(log, end="")
+                merge_memo_updates(updates)
+
+    lookups = {}
+    for name, (_, label, files, _) in LOOKUPS.items():
+        lookups[name] = load_lookup(name)
+        print(f"Successfully loaded and processed {label} data from {files[0]}")
+    return lookups
 
 
 def load_scimago_issn_title_lookup() -> dict[str, list[str]]:
@@ -571,90 +659,49 @@ REPORT_SCHEMA = {
     "OpenAPC_value": pl.Utf8,
 }
 
+# Sort rank of each report priority (Utmost priority first); unknown priorities sort last
+REPORT_PRIORITY_ORDER = {"Utmost priority": 0, "Highest": 1, "High": 2, "Medium": 3, "Low": 4}
 
-def has_disagreement(vals: list, col_name: str) -> bool:
-    """Return True if the non-null values disagree.
 
-    For APC Euros: flags only when one value is 0 and another is non-zero.
-    For all other columns: flags when at least two distinct non-null values exist.
-    Both dataset and lookup values are expected to be pre-normalized (post format_table).
-    """
-    non_null = [v for v in vals if v is not None and str(v).strip() != ""]
-    # If contains "(", remove it and everything after to ignore details
-    non_null = [str(v).split("(", 1)[0].strip().lower() if isinstance(v, str) else v for v in non_null]
-    if len(non_null) < 2:
-        return False
-    # For business model, if first (dataset) value is "Hybrid" and second (scimago) value is "OA", do not count as disagreement
-    if col_name == "Business model" and vals[0] == "Hybrid" and vals[1] == "OA":
-        return False
-    if col_name == "APC Euros":
-        as_ints = [int(v) for v in non_null if isinstance(v, (int, float))]
-        if len(as_ints) < 2:
-            return False
-        return any(v == 0 for v in as_ints) and any(v != 0 for v in as_ints)
-    return len(set(str(v) for v in non_null)) > 1
-
-
-def clean_variable(v):
-    return str(v).split("(", 1)[0].strip().lower() if isinstance(v, str) else v
-
-
-def calculate_disagreement_priority(dataset_val, source_vals_dict, col_name: str,
-                                    source_publisher_types: dict[str, str | None]) -> str:
-    """Calculate priority for a disagreement row.
+def clean_value_expr(expr: pl.Expr) -> pl.Expr:
+    """Value compared in the disagreement report: text from the first "(" on is ignored, case too."""
+    return expr.str.splitn("(", 2).struct.field("field_0").str.strip_chars().str.to_lowercase()
 
-    Args:
-        dataset_val: Value in our dataset
-        source_vals_dict: Dict mapping source name to value (e.g. {"scimago": val, "openapc": val, "doaj": val})
-        col_name: Column name ("Publisher", "Business model", etc.)
-        dataset_publisher_type: Publisher type in our dataset
-        source_publisher_types: Dict mapping source name to publisher type
 
-    Returns:
-        "High" or "Low"
-    """
-    priority = "Low"
-    # Publisher disagreement: if any external source has a different publisher type (non-"Other") than dataset → High
-    if col_name == "Publisher":
-        for source_name, source_pub_type in source_publisher_types.items():
-            # Skip "Other" types as we don't have info on them
-            if source_pub_type and source_pub_type != "Other" and source_pub_type != source_publisher_types.get(
-                    "dataset"):
-                priority = "High"
-
-    # If sources are disagreeing with dataset → higher priority
-    non_null_sources = [v for v in source_vals_dict.values() if v is not None and str(v).strip() != ""]
-    if len(non_null_sources) >= 2:
-        # Normalize for comparison (remove text after parenthesis)
-        cleaned = [clean_variable(v) for v in non_null_sources]
-        dataset_cleaned = clean_variable(dataset_val)
-        # If all disagreeing sources agree on the same value that is different from dataset → high priority
-        if len(set(cleaned)) == 1 and cleaned[0] != dataset_cleaned:
-            priority = "Highest" if priority == "High" else "High"
-
-        # If at least two sources agree on the same value that is different from dataset → normal priority
-        elif Counter([v for v in cleaned if v != dataset_cleaned]).most_common(1)[0][1] >= 2:
-            priority = "Medium" if priority == "Low" else priority
-    return priority
-
-
-def color_value(val, publisher_type: str = None) -> str | None:
-    if val is None:
-        return ""
-
-    if publisher_type and publisher_type in PUBLISHER_TYPE_BG_HEX:
-        return f"#{PUBLISHER_TYPE_BG_HEX[publisher_type]}; {val}"
-    else:
-        return str(val)
+def any_pair_differs(values: list[pl.Expr]) -> pl.Expr:
+    """True where at least two of the non-null values differ (more than one distinct value)."""
+    return pl.any_horizontal([(a != b).fill_null(False) for i, a in enumerate(values) for b in values[i + 1:]])
+
 
+def color_value_expr(expr: pl.Expr, publisher_type: pl.Expr | None = None) -> pl.Expr:
+    """Value shown in the disagreement report: "" for nulls, "#<bg hex>; value" for colored publisher types."""
+    value = expr.cast(pl.Utf8)
+    if publisher_type is None:
+        return value.fill_null("")
+    bg_hex = publisher_type.replace_strict(list(PUBLISHER_TYPE_BG_HEX), list(PUBLISHER_TYPE_BG_HEX.values()),
+                                           default=None, return_dtype=pl.Utf8)
+    return (pl.when(value.is_null()).then(pl.lit(""))
+            .when(bg_hex.is_not_null()).then(pl.concat_str([pl.lit("#"), bg_hex, pl.lit("; "), value]))
+            .otherwise(value))
 
-def compute_disagreements(enriched_df: pl.DataFrame, type_map: dict[str, str]) -> list[dict]:
+
+def compute_disagreements(enriched_df: pl.DataFrame, type_map: dict[str, str]) -> pl.DataFrame:
     """Generate disagreement rows comparing enriched dataset values with source lookup values.
 
     Source columns (Publisher_scimago, APC Euros_openapc, etc.) are already present in
     enriched_df after the join_and_enrich calls and are used directly — no re-matching needed.
     Dataverse is excluded (enrichment only, not in disagreement report).
 
+    Each entry of DISAGREEMENT_COLS is evaluated with expressions over all rows at once, and the
+    disagreeing (row, column) pairs are stacked in row order, then column order.
+    - Disagreement: values are compared after clean_value_expr, blank values ignored. APC Euros
+      disagree only when one value is 0 and another is non-zero. A dataset "Hybrid" against a
+      Scimago "OA" business model is not a disagreement.
+    - Priority: "High" when all (at least two) sources agree on a value different from the
+      dataset, "Medium" when two of them do. Publisher rows start at "High" when a source
+      publisher has a known type (country_formatting.json) other than the dataset one, raising
+      these levels to "Highest" and "High".
+
     Args:
         enriched_df: DataFrame after all join_and_enrich calls and format_table. Must contain
                      Journal, Website, Field, all dataset columns in DISAGREEMENT_COLS, and
@@ -662,7 +709,7 @@ def compute_disagreements(enriched_df: pl.DataFrame, type_map: dict[str, str]) -
         type_map: Publisher name -> publisher type map from country_formatting.json.
 
     Returns:
-        List of dicts with keys matching REPORT_SCHEMA.
+        DataFrame with the REPORT_SCHEMA columns.
     """
     dataset_cols = [d for d, *_ in DISAGREEMENT_COLS]
     all_source_cols = [c for _, s, o, d in DISAGREEMENT_COLS for c in [s, o, d] if c is not None]
@@ -672,56 +719,89 @@ def compute_disagreements(enriched_df: pl.DataFrame, type_map: dict[str, str]) -
         f"{[c for c in needed_cols if c not in enriched_df.columns]}"
     )
 
-    disagreements: list[dict] = []
-    for row in enriched_df.select(needed_cols).iter_rows(named=True):
-        journal = str(row["Journal"] or "")
-        url = str(row.get("Website") or "")
-        field = str(row["Field"] or "")
-        publisher_type = str(row.get("Publisher type") or "")
-
-        for dataset_col, scimago_col, openapc_col, doaj_col in DISAGREEMENT_COLS:
-            dataset_val = row.get(dataset_col)
-            scimago_val = row.get(scimago_col) if scimago_col else None
-            openapc_val = row.get(openapc_col) if openapc_col else None
-            doaj_val = row.get(doaj_col) if doaj_col else None
+    sources = ["scimago", "openapc", "doaj"]
+    publisher_cols = dict(zip(sources, next(c for c in DISAGREEMENT_COLS if c[0] == "Publisher")[1:]))
+    df = enriched_df.select(needed_cols).with_row_index("_row").with_columns(
+        publisher_type_base_category_expr("Publisher type").alias("_type_dataset"),
+        *[classify_publisher_type_expr(col, type_map).alias(f"_type_{source}") for source, col in publisher_cols.items()],
+    )
 
-            if not has_disagreement([dataset_val, scimago_val, openapc_val, doaj_val], dataset_col):
-                continue
+    parts = []
+    for col_idx, (dataset_col, *source_cols) in enumerate(DISAGREEMENT_COLS):
+        numeric = dataset_col == "APC Euros"
+        dtype = pl.Int64 if numeric else pl.Utf8
+        raw = {"dataset": pl.col(dataset_col).cast(dtype)}
+        for source, col in zip(sources, source_cols):
+            raw[source] = pl.col(col).cast(dtype) if col else pl.lit(None, dtype=dtype)
+
+        # Cleaned non-blank values (null otherwise); the dataset value is compared to the sources even if blank.
+        # Materialized once: eager frames do not share the subexpressions reused below
+        cleaned_exprs = []
+        for name, expr in raw.items():
+            nonempty = expr.is_not_null() if numeric else expr.is_not_null() & (expr.str.strip_chars() != "")
+            cleaned_exprs.append(pl.when(nonempty).then(pl.col(f"_clean_all_{name}")).alias(f"_clean_{name}"))
+        col_df = df.with_columns(
+            (expr if numeric else clean_value_expr(expr)).alias(f"_clean_all_{name}") for name, expr in raw.items()
+        ).with_columns(cleaned_exprs)
+        cleaned = {name: pl.col(f"_clean_{name}") for name in raw}
+        dataset_cleaned = pl.col("_clean_all_dataset")
+        source_values = [cleaned[source] for source in sources]
+
+        if numeric:
+            disagree = (pl.any_horizontal([v == 0 for v in cleaned.values()])
+                        & pl.any_horizontal([v != 0 for v in cleaned.values()]))
+        else:
+            disagree = any_pair_differs(list(cleaned.values()))
+        if dataset_col == "Business model":
+            disagree = disagree & ~((raw["dataset"] == "Hybrid") & (raw["scimago"] == "OA")).fill_null(False)
+        col_df = col_df.filter(disagree.fill_null(False))
+
+        if dataset_col == "Publisher":
+            high = pl.any_horizontal([(pl.col(f"_type_{source}") != "Other")
+                                      & (pl.col(f"_type_{source}") != pl.col("_type_dataset")) for source in sources])
+        else:
+            high = pl.lit(False)
+        several = pl.sum_horizontal([v.is_not_null() for v in source_values]) >= 2
+        all_agree = ~any_pair_differs(source_values) & pl.coalesce(source_values).ne_missing(dataset_cleaned)
+        two_agree = pl.any_horizontal([
+            (a == b) & a.ne_missing(dataset_cleaned)
+            for i, a in enumerate(source_values) for b in source_values[i + 1:]
+        ]).fill_null(False)
+        priority = (
+            pl.when(several & all_agree).then(pl.when(high).then(pl.lit("Highest")).otherwise(pl.lit("High")))
+            .when(several & two_agree).then(pl.when(high).then(pl.lit("High")).otherwise(pl.lit("Medium")))
+            .otherwise(pl.when(high).then(pl.lit("High")).otherwise(pl.lit("Low")))
+        )
 
-            # Extract publisher types for source-specific logic
-            dico_pt = defaultdict(str)
-            if dataset_col == "Publisher":
-                # Try to infer publisher types from publisher names
-                for source_name, source_col in [("scimago", scimago_col), ("openapc", openapc_col), ("doaj", doaj_col)]:
-                    if source_col and source_col in row:
-                        dico_pt[source_name] = classify_publisher_type(row.get(source_col), type_map)
-                dico_pt["dataset"] = publisher_type_base_category(publisher_type)
-
-            priority = calculate_disagreement_priority(
-                dataset_val, {"scimago": scimago_val, "openapc": openapc_val, "doaj": doaj_val}, dataset_col, dico_pt)
-
-            disagreements.append({
-                "priority": priority,
-                "journal": journal,
-                "url": url,
-                "publisher": "",
-                "publisher_type": publisher_type,
-                "field": field,
-                "column": dataset_col,
-                "dataset_value": color_value(dataset_val, dico_pt["dataset"]),
-                "expected_value": "",
-                "Scimago_value": color_value(scimago_val, dico_pt["scimago"]),
-                "DOAJ_value": color_value(doaj_val, dico_pt["doaj"]),
-                "OpenAPC_value": color_value(openapc_val, dico_pt["openapc"]),
-            })
-
-    return disagreements
-
-
-def compute_publisher_type_disagreements(enriched_df: pl.DataFrame, type_map: dict[str, str]) -> list[dict]:
+        def colored(name: str) -> pl.Expr:
+            publisher_type = pl.col(f"_type_{name}") if dataset_col == "Publisher" else None
+            return color_value_expr(raw[name], publisher_type)
+
+        parts.append(col_df.select(
+            "_row",
+            pl.lit(col_idx).alias("_col"),
+            priority.alias("priority"),
+            pl.col("Journal").cast(pl.Utf8).fill_null("").alias("journal"),
+            pl.col("Website").cast(pl.Utf8).fill_null("").alias("url"),
+            pl.lit("").alias("publisher"),
+            pl.col("Publisher type").cast(pl.Utf8).fill_null("").alias("publisher_type"),
+            pl.col("Field").cast(pl.Utf8).fill_null("").alias("field"),
+            pl.lit(dataset_col).alias("column"),
+            colored("dataset").alias("dataset_value"),
+            pl.lit("").alias("expected_value"),
+            colored("scimago").alias("Scimago_value"),
+            colored("doaj").alias("DOAJ_value"),
+            colored("openapc").alias("OpenAPC_value"),
+        ))
+
+    return pl.concat(parts).sort(["_row", "_col"]).select(list(REPORT_SCHEMA))
+
+
+def compute_publisher_type_disagreements(enriched_df: pl.DataFrame,
+                                         config: PublisherConfig | None = None) -> pl.DataFrame:
     """Generate disagreement rows where the dataset Publisher type does not match
     the publisher type inferred from the normalized Publisher name using
-    config/country_formatting.json.
+    config/country_formatting.json (see publisher_config_coverage).
 
     Society-run variants (e.g. "For-profit Society-Run") are treated as refinements
     of their base category, so they are not flagged when the inferred base category
@@ -731,10 +811,10 @@ def compute_publisher_type_disagreements(enriched_df: pl.DataFrame, type_map: di
     Args:
         enriched_df: DataFrame after format_table. Must contain Journal, Website,
                      Publisher type, Field, and Publisher.
-        type_map: Publisher name -> publisher type map from country_formatting.json.
+        config: PublisherConfig of country_formatting.json (default: load_publisher_config()).
 
     Returns:
-        List of dicts with keys matching REPORT_SCHEMA.
+        DataFrame with the REPORT_SCHEMA columns.
     """
     needed_cols = ["Journal", "Website", "Publisher type", "Field", "Publisher"]
     assert all(c in enriched_df.columns for c in needed_cols), (
@@ -742,144 +822,145 @@ def compute_publisher_type_disagreements(enriched_df: pl.DataFrame, type_map: di
         f"{[c for c in needed_cols if c not in enriched_df.columns]}"
     )
 
-    disagreements: list[dict] = []
-    for row in enriched_df.select(needed_cols).iter_rows(named=True):
-        publisher = str(row["Publisher"] or "")
-        dataset_type = str(row["Publisher type"] or "")
-        if not publisher or not dataset_type:
-            continue
-
-        inferred_type = classify_publisher_type(publisher, type_map)
-        if inferred_type == "Other":
-            continue
-
-        dataset_base = publisher_type_base_category(dataset_type)
-        if dataset_base == "Other" or dataset_base == inferred_type:
-            continue
-
-        journal = str(row["Journal"] or "")
-        url = str(row.get("Website") or "")
-        field = str(row["Field"] or "")
+    coverage = publisher_config_coverage(enriched_df.select(needed_cols), config)
+    return coverage.filter(pl.col("_publisher_type_disagreement")).select(
+        pl.lit("Utmost priority").alias("priority"),
+        pl.col("Journal").cast(pl.Utf8).fill_null("").alias("journal"),
+        pl.col("Website").cast(pl.Utf8).fill_null("").alias("url"),
+        pl.col("Publisher").cast(pl.Utf8).alias("publisher"),
+        pl.col("Publisher type").cast(pl.Utf8).alias("publisher_type"),
+        pl.col("Field").cast(pl.Utf8).fill_null("").alias("field"),
+        pl.lit("Publisher type").alias("column"),
+        color_value_expr(pl.col("Publisher type"), pl.col("_dataset_publisher_base")).alias("dataset_value"),
+        color_value_expr(pl.col("_config_publisher_type"), pl.col("_config_publisher_type")).alias("expected_value"),
+        pl.lit("").alias("Scimago_value"),
+        pl.lit("").alias("DOAJ_value"),
+        pl.lit("").alias("OpenAPC_value"),
+    )
 
-        disagreements.append({
-            "priority": "Utmost priority",
-            "journal": journal,
-            "url": url,
-            "publisher": publisher,
-            "publisher_type": dataset_type,
-            "field": field,
-            "column": "Publisher type",
-            "dataset_value": color_value(dataset_type, dataset_base),
-            "expected_value": color_value(inferred_type, inferred_type),
-            "Scimago_value": "",
-            "DOAJ_value": "",
-            "OpenAPC_value": "",
-        })
 
-    return disagreements
+def candidate_key_nonempty(col: str, dtype: pl.DataType) -> pl.Expr:
+    """True where a candidate key column holds a usable value (non-null, non-blank string)."""
+    if dtype == pl.UInt32:
+        return pl.col(col).is_not_null()
+    return pl.col(col).is_not_null() & (pl.col(col).cast(pl.Utf8).str.strip_chars() != "")
 
 
 def apply_candidate_key(target_df: pl.DataFrame, lookup_df: pl.DataFrame, left_col: str, right_col: str, label: str,
-                        left_key_col: str, right_key_col: str,
-                        presence_col: str) -> tuple[pl.DataFrame, pl.DataFrame]:
+                        left_key_col: str, row_col: str, claimed_col: str, presence_col: str,
+                        by: list[str] | None = None) -> tuple[pl.DataFrame, pl.DataFrame]:
     """Try to assign one candidate join key pair to unmatched / ambiguous rows.
 
     For rows in target_df where presence_col is "No" or "Ambiguous":
     - If left_col value appears exactly once in target_df AND exactly once in lookup_df
       (clean match) AND the matching lookup row has not yet been claimed:
-        → set left_key_col = left_col value, presence_col = label
+        → set left_key_col = row_col of the lookup row, presence_col = label
     - If left_col value appears more than once in either table, or the lookup row is
       already claimed by another match:
         → set presence_col = "Ambiguous" (only if currently "No")
 
-    Also updates lookup_df: sets right_key_col = right_col value for newly-claimed rows.
+    Also updates lookup_df: sets claimed_col for the lookup rows of all clean, unclaimed values.
+
+    Counts and matches are computed by joins inside Polars; the outcome of each key value is
+    carried as boolean mask columns (_available, _ambiguous) joined back onto target_df.
 
     Args:
         target_df:    Left DataFrame being enriched (has left_key_col and presence_col).
-        lookup_df:    Lookup DataFrame (has right_key_col).
+        lookup_df:    Lookup DataFrame (has row_col and claimed_col).
         left_col:     Column in target_df supplying candidate key values.
         right_col:    Column in lookup_df supplying candidate key values.
         label:        Presence label to set on successful match (e.g. "Yes", "e-ISSN match").
-        left_key_col: Column in target_df that stores the resolved join key.
-        right_key_col: Column in lookup_df that stores the resolved join key.
+        left_key_col: Column in target_df that stores the matched lookup row.
+        row_col:      Column in lookup_df numbering its rows.
+        claimed_col:  Boolean column in lookup_df, True for rows claimed by a previous match.
         presence_col: Column in target_df tracking match status.
+        by:           Columns present in both tables that scope the counts and matches
+                      (see partition_candidate_keys), or None.
 
     Returns:
         Updated (target_df, lookup_df).
     """
     if left_col not in target_df.columns or right_col not in lookup_df.columns:
         return target_df, lookup_df
-
-    is_nonempty_left = (pl.col(left_col).is_not_null() & (pl.col(left_col).cast(pl.Utf8).str.strip_chars() != ""))
-    is_nonempty_right = (pl.col(right_col).is_not_null() & (pl.col(right_col).cast(pl.Utf8).str.strip_chars() != ""))
+    by = by or []
 
     # Count occurrences of candidate key values in each table
-    left_counts = target_df.filter(is_nonempty_left).group_by(left_col).agg(pl.len().alias("_left_count"))
-    right_counts = lookup_df.filter(is_nonempty_right).group_by(right_col).agg(pl.len().alias("_right_count"))
+    left_counts = (
+        target_df.filter(candidate_key_nonempty(left_col, target_df.schema[left_col]))
+        .group_by(by + [left_col]).agg(pl.len().alias("_left_count"))
+        .rename({left_col: "_key"})
+    )
+    right_counts = (
+        lookup_df.filter(candidate_key_nonempty(right_col, lookup_df.schema[right_col]))
+        .group_by(by + [right_col])
+        .agg(pl.len().alias("_right_count"), pl.col(row_col).first(), pl.col(claimed_col).any())
+        .rename({right_col: "_key"})
+    )
 
-    # Values present in both tables
-    matched = left_counts.join(right_counts, left_on=left_col, right_on=right_col, how="inner")
+    # Values present in both tables. Clean: unique on both sides, claimable unless its lookup
+    # row was taken by a previous key step; ambiguous: duplicated on either side, or clean but taken
+    clean = (pl.col("_left_count") == 1) & (pl.col("_right_count") == 1)
+    matched = left_counts.join(right_counts, on=by + ["_key"], how="inner").select(
+        *by, "_key", row_col,
+        (clean & ~pl.col(claimed_col)).alias("_available"),
+        ((pl.col("_left_count") > 1) | (pl.col("_right_count") > 1) | (clean & pl.col(claimed_col)))
+        .alias("_ambiguous"),
+    ).filter(pl.col("_available") | pl.col("_ambiguous"))
     if matched.height == 0:
         return target_df, lookup_df
 
-    # Clean: unique on both sides; ambiguous: duplicated on either side
-    clean_values = set(matched.filter((pl.col("_left_count") == 1) & (pl.col("_right_count") == 1))[left_col].to_list())
-    ambiguous_values = set(
-        matched.filter((pl.col("_left_count") > 1) | (pl.col("_right_count") > 1))[left_col].to_list())
-
-    if not clean_values and not ambiguous_values:
-        return target_df, lookup_df
+    # Update target_df: assign key and presence in one pass
+    target_df = target_df.join(matched, left_on=by + [left_col], right_on=by + ["_key"], how="left",
+                               maintain_order="left")
+    needs_match = pl.col(presence_col).is_in(["No", "Ambiguous"]) & pl.col("_available").fill_null(False)
+    target_df = target_df.with_columns(
+        pl.when(needs_match).then(pl.col(row_col)).otherwise(pl.col(left_key_col)).alias(left_key_col),
+        pl.when(needs_match).then(pl.lit(label))
+        .when((pl.col(presence_col) == "No") & pl.col("_ambiguous").fill_null(False)).then(pl.lit("Ambiguous"))
+        .otherwise(pl.col(presence_col)).alias(presence_col),
+    ).drop([row_col, "_available", "_ambiguous"])
 
-    # Lookup rows already claimed by a previous key step
-    claimed_right = set(
-        lookup_df.filter(pl.col(right_key_col).is_not_null()).select(right_col).drop_nulls()[right_col].to_list()
-    )
+    # Update lookup_df: claim rows for newly-available clean matches
+    claims = matched.filter(pl.col("_available")).select(row_col, pl.lit(True).alias("_claim"))
+    if claims.height:
+        lookup_df = lookup_df.join(claims, on=row_col, how="left", maintain_order="left").with_columns(
+            (pl.col(claimed_col) | pl.col("_claim").fill_null(False)).alias(claimed_col)
+        ).drop("_claim")
+    return target_df, lookup_df
 
-    available_clean = clean_values - claimed_right  # can be claimed now
-    blocked_clean = clean_values & claimed_right  # clean but lookup row already taken
-    all_ambiguous = ambiguous_values | blocked_clean  # flag as ambiguous
 
-    needs_match = (pl.col(presence_col).is_in(["No", "Ambiguous"]) & is_nonempty_left)
+def partition_candidate_keys(target_df: pl.DataFrame, lookup_df: pl.DataFrame, source: str,
+                             partition: str) -> pl.DataFrame:
+    """Expand lookup_df to match a batch of files (see process_csv_files) file by file.
 
-    # Update target_df: assign key and presence in one pass
-    update_exprs = []
-    if available_clean:
-        update_exprs.append(
-            pl.when(needs_match & pl.col(left_col).is_in(list(available_clean)))
-            .then(pl.col(left_col))
-            .otherwise(pl.col(left_key_col))
-            .alias(left_key_col)
-        )
-    if available_clean or all_ambiguous:
-        presence_expr = (
-            pl.when(needs_match & pl.col(left_col).is_in(list(available_clean)))
-            .then(pl.lit(label))
-        )
-        if all_ambiguous:
-            presence_expr = presence_expr.when(
-                (pl.col(presence_col) == "No")
-                & is_nonempty_left
-                & pl.col(left_col).is_in(list(all_ambiguous))
-            ).then(pl.lit("Ambiguous"))
-        presence_expr = presence_expr.otherwise(pl.col(presence_col)).alias(presence_col)
-        update_exprs.append(presence_expr)
+    apply_candidate_key is then run with by=[partition], so the uniqueness counts and the
+    claimed lookup rows are per file, exactly as when each file is processed on its own.
+    The lookup is expanded to one copy per file of each lookup row sharing a candidate key
+    value with that file; rows matching no file are dropped once for the whole batch.
 
-    if update_exprs:
-        target_df = target_df.with_columns(update_exprs)
+    Returns:
+        The expanded lookup_df, with a partition column.
+    """
+    lookup_df = lookup_df.with_row_index("_lookup_row")
 
-    # Update lookup_df: claim rows for newly-available clean matches
-    if available_clean:
-        lookup_df = lookup_df.with_columns(
-            pl.when(pl.col(right_key_col).is_null() & pl.col(right_col).is_in(list(available_clean)))
-            .then(pl.col(right_col))
-            .otherwise(pl.col(right_key_col))
-            .alias(right_key_col)
-        )
-    return target_df, lookup_df
+    # (file, lookup row) pairs sharing at least one candidate key value
+    pairs = []
+    for left_col, right_col, _ in CANDIDATE_KEYS[source]:
+        if left_col not in target_df.columns or right_col not in lookup_df.columns:
+            continue
+        left_values = (target_df.filter(candidate_key_nonempty(left_col, target_df.schema[left_col]))
+                       .select(partition, pl.col(left_col).alias("_key")).unique())
+        right_values = (lookup_df.filter(candidate_key_nonempty(right_col, lookup_df.schema[right_col]))
+                        .select("_lookup_row", pl.col(right_col).alias("_key")))
+        pairs.append(left_values.join(right_values, on="_key").select(partition, "_lookup_row"))
+    return (pl.concat(pairs).unique().sort([partition, "_lookup_row"])
+            .join(lookup_df, on="_lookup_row").drop("_lookup_row"))
 
 
 def compute_presence_and_keys(target_df: pl.DataFrame, lookup_df: pl.DataFrame, source: str,
-                              presence_col: str | None) -> tuple[pl.DataFrame, pl.DataFrame]:
+                              presence_col: str | None,
+                              partition: str | None = None, ledger: pl.DataFrame | None = None,
+                              ledger_frames: list | None = None) -> tuple[pl.DataFrame, pl.DataFrame]:
     """Compute presence column and unique join keys for a source via the candidate key cascade.
 
     Tries candidate keys in priority order (norm_journal → alt_journal_norm → ISSN-L →
@@ -896,8 +977,8 @@ def compute_presence_and_keys(target_df: pl.DataFrame, lookup_df: pl.DataFrame,
                                    the only clean lookup row was already claimed
         "No"                     — no match found by any key
 
-    Adds left_key_{source} to target_df and right_key_{source} to lookup_df.
-    Both columns are null for rows/rows that could not be cleanly matched.
+    Adds left_key_{source} to target_df and right_key_{source} to lookup_df: the row number
+    of the matched lookup row. Both columns are null for rows that could not be cleanly matched.
 
     Asserts that non-null left-key values are unique in target_df and non-null
     right-key values are unique in lookup_df (guarantees join produces no duplicates).
@@ -908,31 +989,70 @@ def compute_presence_and_keys(target_df: pl.DataFrame, lookup_df: pl.DataFrame,
         source:       Source name ("scimago", "openapc", "doaj", "dataverse").
         presence_col: Column name to write presence info into target_df, or None to
                       skip writing the presence column (for sources like "dataverse").
+        partition:    Column of target_df naming the file of each row of a batch, or None for
+                      a single file. Keys are then matched per file (see partition_candidate_keys).
+        ledger:       Ledger of the previous run on this file (see load_ledger), or None to run
+                      the cascade on every row. Only the rows selected by split_by_ledger go
+                      through the cascade; the others reuse their previous key and presence.
+        ledger_frames: List accumulating the ledger rows of this run (mutated in-place), used
+                      with ledger.
 
     Returns:
         (target_df_with_left_key, lookup_df_with_right_key)
     """
     left_key_col = f"left_key_{source}"
     right_key_col = f"right_key_{source}"
+    row_col = f"_row_{source}"
+    claimed_col = f"_claimed_{source}"
     # Use a temporary internal name if no permanent presence column is needed
     presence_col_alias = presence_col if presence_col is not None else f"_presence_{source}"
+    by = [partition] if partition is not None else None
 
-    # Initialize: all rows start with no key and presence "No"
-    target_df = target_df.with_columns([
-        pl.lit(None).cast(pl.Utf8).alias(left_key_col),
+    # Initialize: all rows start with no key and presence "No"; ISSNs are matched by packed code
+    target_df = with_issn_codes(target_df, ISSN_KEY_COLS).with_columns([
+        pl.lit(None).cast(pl.UInt32).alias(left_key_col),
         pl.lit("No").alias(presence_col_alias),
     ])
-    lookup_df = lookup_df.with_columns(
-        pl.lit(None).cast(pl.Utf8).alias(right_key_col)
-    )
+    if partition is not None:
+        lookup_df = partition_candidate_keys(target_df, lookup_df, source, partition)
+    lookup_df = lookup_df.with_row_index(row_col).with_columns(pl.lit(False).alias(claimed_col))
+    if ledger is not None:
+        assert partition is None, "The enrichment ledger only supports files processed one by one"
+        fingerprint = ledger_fingerprint_expr(source, lookup_content_hash(source, lookup_df))
+        target_df = target_df.with_row_index("_ledger_row").with_columns(fingerprint.alias("_fingerprint"))
+        full_lookup_df = lookup_df
+        reused, target_df, lookup_df = split_by_ledger(target_df, lookup_df, source, ledger, row_col,
+                                                       left_key_col, presence_col_alias)
 
     # Walk through candidate keys in priority order
     for left_col, right_col, label in CANDIDATE_KEYS[source]:
         target_df, lookup_df = apply_candidate_key(
             target_df, lookup_df, left_col, right_col, label,
-            left_key_col, right_key_col, presence_col_alias,
+            left_key_col, row_col, claimed_col, presence_col_alias, by,
         )
 
+    if ledger is not None:
+        # Claims of the cascade, and reused rows claiming their previous lookup rows (row_col numbers the rows)
+        claims = pl.concat([lookup_df.filter(pl.col(claimed_col))[row_col], reused[left_key_col].drop_nulls()])
+        lookup_df = full_lookup_df.with_columns(
+            pl.repeat(False, full_lookup_df.height, eager=True).scatter(claims, True).alias(claimed_col))
+        target_df = pl.concat([reused, target_df]).sort("_ledger_row")
+        ledger_frames.append(target_df.select(
+            pl.lit(source).alias("source"),
+            pl.lit(lookup_content_hash(source, lookup_df)).alias("lookup"),
+            "_fingerprint",
+            *[pl.col(c) if c in target_df.columns else pl.lit(None, dtype).alias(c)
+              for c, dtype in LEDGER_KEY_COLS.items()],
+            pl.col(left_key_col).alias("left_key"),
+            pl.col(presence_col_alias).alias("presence"),
+        ).rename({"_fingerprint": "fingerprint"}))
+        target_df = target_df.drop("_ledger_row", "_fingerprint")
+
+    # The join key of a claimed lookup row is its row number
+    lookup_df = lookup_df.with_columns(
+        pl.when(pl.col(claimed_col)).then(pl.col(row_col)).alias(right_key_col)
+    ).drop([row_col, claimed_col] + ([partition] if partition is not None else []))
+
     # Log presence distribution
     print(f"  [{source}] presence distribution:")
     for val in PRESENCE_VALUES:
@@ -940,9 +1060,10 @@ def compute_presence_and_keys(target_df: pl.DataFrame, lookup_df: pl.DataFrame,
         if count > 0:
             print(f"    - {val}: {count}")
 
-    # Drop internal presence column if it was not requested
+    # Drop internal presence column if it was not requested, and the ISSN codes
     if presence_col is None:
         target_df = target_df.drop(presence_col_alias)
+    target_df = target_df.drop([f"{c}_code" for c in ISSN_KEY_COLS])
 
     # Assert: non-null left_key values are unique in target_df (no duplicate join keys)
     non_null_left = target_df.filter(pl.col(left_key_col).is_not_null())
@@ -961,6 +1082,164 @@ def compute_presence_and_keys(target_df: pl.DataFrame, lookup_df: pl.DataFrame,
     return target_df, lookup_df
 
 
+# Enrichment ledger: outcome of the key cascade of each row, per file and source (see split_by_ledger)
+LEDGER_DIR = MEMO_DIR / "enrichment"
+# Cascade inputs of a row, as seen by compute_presence_and_keys (the left columns of CANDIDATE_KEYS)
+LEDGER_KEY_COLS = {
+    "norm_journal": pl.Utf8,
+    "alt_journal_norm": pl.Utf8,
+    "ISSN-L_code": pl.UInt32,
+    "e-ISSN_code": pl.UInt32,
+    "p-ISSN_code": pl.UInt32,
+}
+LEDGER_SCHEMA = {"source": pl.Utf8, "lookup": pl.Utf8, "fingerprint": pl.UInt64, **LEDGER_KEY_COLS,
+                 "left_key": pl.UInt32, "presence": pl.Utf8}
+
+_lookup_hashes: dict[str, str] = {}
+
+
+def lookup_content_hash(source: str, lookup_df: pl.DataFrame) -> str:
+    """Hash of the rows of the lookup table of source, in order (lookup_df numbered by compute_presence_and_keys)."""
+    if source not in _lookup_hashes:
+        rows = lookup_df.drop([c for c in lookup_df.columns if c.startswith(("_row_", "_claimed_"))]).hash_rows()
+        _lookup_hashes[source] = hashlib.sha256(",".join(map(str, rows.to_list())).encode()).hexdigest()[:16]
+    return _lookup_hashes[source]
+
+
+def ledger_fingerprint_expr(source: str, lookup_hash: str) -> pl.Expr:
+    """Fingerprint of the cascade inputs of each row for source: its candidate key values and the lookup hash."""
+    key_cols = [left_col for left_col, _, _ in CANDIDATE_KEYS[source]]
+    return pl.struct(*key_cols, pl.lit(lookup_hash).alias("_lookup")).hash(seed=0)
+
+
+def ledger_path(csv_path: str) -> Path:
+    """Ledger file of a data_extracted CSV."""
+    return LEDGER_DIR / f"{Path(csv_path).stem}.parquet"
+
+
+def load_ledger(csv_path: str) -> pl.DataFrame:
+    """Ledger written by the previous run on csv_path, empty when there is none."""
+    path = ledger_path(csv_path)
+    if not path.exists():
+        return pl.DataFrame(schema=LEDGER_SCHEMA)
+    ledger = pl.read_parquet(path)
+    if ledger.schema != pl.Schema(LEDGER_SCHEMA):
+        print(f"Ignoring ledger {path} with an outdated schema")
+        return pl.DataFrame(schema=LEDGER_SCHEMA)
+    return ledger
+
+
+def save_ledger(ledger_frames: list[pl.DataFrame], csv_path: str) -> None:
+    """Write the ledger rows of this run on csv_path, replacing the previous ledger."""
+    LEDGER_DIR.mkdir(parents=True, exist_ok=True)
+    path = ledger_path(csv_path)
+    tmp_path = path.with_suffix(".tmp")
+    pl.concat([pl.DataFrame(schema=LEDGER_SCHEMA)] + ledger_frames).write_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def prune_ledgers(csv_paths: list[str]) -> None:
+    """Delete the ledgers of files that are no longer among csv_paths."""
+    kept = {ledger_path(csv_path) for csv_path in csv_paths}
+    for path in LEDGER_DIR.glob("*.parquet"):
+        if path not in kept:
+            print(f"Evicting ledger {path} (its file is no longer processed)")
+            path.unlink(missing_ok=True)
+
+
+def candidate_edges(rows: pl.DataFrame, row_id: str, lookup_df: pl.DataFrame, source: str,
+                    row_col: str) -> pl.DataFrame:
+    """(row_id, row_col) pairs of rows and lookup rows sharing a candidate key value, for any CANDIDATE_KEYS step."""
+    edges = [pl.DataFrame(schema={row_id: rows.schema[row_id], row_col: pl.UInt32})]
+    for left_col, right_col, _ in CANDIDATE_KEYS[source]:
+        if left_col not in rows.columns or right_col not in lookup_df.columns:
+            continue
+        # Only non-empty values on the left: blank lookup values never match, and null keys never join
+        left = rows.filter(candidate_key_nonempty(left_col, rows.schema[left_col])).select(
+            row_id, pl.col(left_col).alias("_key"))
+        right = lookup_df.select(row_col, pl.col(right_col).alias("_key"))
+        edges.append(left.join(right, on="_key").select(row_id, row_col))
+    return pl.concat(edges).unique()
+
+
+def split_by_ledger(target_df: pl.DataFrame, lookup_df: pl.DataFrame, source: str, ledger: pl.DataFrame,
+                    row_col: str, left_key_col: str,
+                    presence_col: str) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """Split target_df into rows reusing their cascade outcome from the ledger and rows to run it on.
+
+    Two rows can only change each other's outcome through a lookup row they both have a candidate
+    key value for: key values matching no lookup row are never counted, and claims are made on
+    lookup rows. The cascade outcome of a row is thus fixed by its connected component in the
+    graph linking rows to their candidate lookup rows. A component made only of rows already in
+    the previous run, with no candidate lookup row shared with a row that has since been edited
+    or removed, is the same as in the previous run, and so are the outcomes of its rows.
+
+    Rows are matched to the ledger by fingerprint (ledger_fingerprint_expr), which includes the
+    lookup hash; a fingerprint is reused only if it has as many rows as in the previous run.
+    Rows sharing a fingerprint share all key values, so they have the same outcome. The other
+    rows, and the old ledger rows they replace, seed the components to run the cascade on.
+    These components hold every lookup row with a key value of their rows, so the cascade can
+    run on them alone with the same counts and claims as on the whole tables. When no row
+    changed, the cascade is skipped.
+
+    Args:
+        target_df: Rows numbered by _ledger_row, with their _fingerprint and the cascade columns.
+        lookup_df: Lookup table numbered by row_col.
+        source: Source name.
+        ledger: Ledger of the previous run (see load_ledger).
+        row_col, left_key_col, presence_col: see apply_candidate_key.
+
+    Returns:
+        (rows with their previous left_key_col and presence_col, rows to run the cascade on,
+        lookup rows to run it on)
+    """
+    previous = (
+        ledger.filter((pl.col("source") == source) & (pl.col("lookup") == lookup_content_hash(source, lookup_df)))
+        .rename({"fingerprint": "_fingerprint"})
+    )
+    counts = target_df.group_by("_fingerprint").agg(pl.len().alias("_count"))
+    outcomes = (
+        previous.group_by("_fingerprint")
+        .agg(pl.len().alias("_count"), pl.col("left_key").first(), pl.col("presence").first())
+        .join(counts, on=["_fingerprint", "_count"], how="semi")
+    )
+    changed = target_df.join(outcomes, on="_fingerprint", how="anti")
+    key_cols = [c for c in LEDGER_KEY_COLS if c in target_df.columns]
+    removed = previous.join(outcomes, on="_fingerprint", how="anti").select(key_cols)
+
+    cascade_rows = changed.select("_ledger_row")
+    lookup_rows = pl.DataFrame(schema={row_col: pl.UInt32})
+    if changed.height or removed.height:
+        # Grow the components of the changed rows (and of the rows they replace) to a fixed point
+        edges = candidate_edges(target_df, "_ledger_row", lookup_df, source, row_col)
+        lookup_rows = edges.join(cascade_rows, on="_ledger_row", how="semi").select(row_col)
+        if removed.height:
+            removed_edges = candidate_edges(removed.with_row_index("_removed_row"), "_removed_row", lookup_df,
+                                            source, row_col)
+            lookup_rows = pl.concat([lookup_rows, removed_edges.select(row_col)]).unique()
+        while True:
+            rows = edges.join(lookup_rows, on=row_col, how="semi").select("_ledger_row")
+            grown_rows = pl.concat([cascade_rows, rows]).unique()
+            grown_lookup_rows = edges.join(grown_rows, on="_ledger_row", how="semi").select(row_col)
+            grown_lookup_rows = pl.concat([lookup_rows, grown_lookup_rows]).unique()
+            if grown_rows.height == cascade_rows.height and grown_lookup_rows.height == lookup_rows.height:
+                break
+            cascade_rows, lookup_rows = grown_rows, grown_lookup_rows
+
+    reused = (
+        target_df.join(cascade_rows, on="_ledger_row", how="anti")
+        .drop(left_key_col, presence_col)
+        .join(outcomes.select("_fingerprint", pl.col("left_key").alias(left_key_col),
+                              pl.col("presence").alias(presence_col)), on="_fingerprint", how="left",
+              maintain_order="left")
+        .select(target_df.columns)
+    )
+    print(f"  [{source}] ledger: {reused.height} row(s) reused, key cascade on {cascade_rows.height}")
+    # row_col numbers the rows of lookup_df
+    return (reused, target_df.join(cascade_rows, on="_ledger_row", how="semi", maintain_order="left"),
+            lookup_df.select(pl.all().gather(lookup_rows[row_col].sort())))
+
+
 def join_and_enrich(target_df: pl.DataFrame, lookup_df: pl.DataFrame, source: str, totals: dict) -> pl.DataFrame:
     """Perform a single left join using the pre-computed keys and enrich target columns.
 
@@ -984,32 +1263,31 @@ def join_and_enrich(target_df: pl.DataFrame, lookup_df: pl.DataFrame, source: st
 
     result = target_df.join(lookup_df, left_on=left_key_col, right_on=right_key_col, how="left", coalesce=False)
 
-    matches = result.filter(pl.col(right_key_col).is_not_null()).height
-    print(f"  [{source}] join matches: {matches} / {result.height}")
-
+    # All update counters are summed in one pass, then all updates are applied in one with_columns
+    applied = []
+    counters = [pl.col(right_key_col).is_not_null().sum().alias("_matches")]
+    update_exprs = []
     for col, overwrite in FILE_COLS.get(source, []):
         source_col = f"{col}_{source}"
         if source_col not in result.columns:
             continue
         if overwrite:
-            updates = result.filter(
-                pl.col(source_col).is_not_null()
-                & (pl.col(col).is_null() | (pl.col(col).cast(pl.Utf8) != pl.col(source_col).cast(pl.Utf8)))
-            ).height
-            result = result.with_columns(
-                pl.when(pl.col(source_col).is_not_null())
-                .then(pl.col(source_col))
-                .otherwise(pl.col(col))
-                .alias(col)
-            )
+            changed = pl.col(source_col).is_not_null() & (
+                pl.col(col).is_null() | (pl.col(col).cast(pl.Utf8) != pl.col(source_col).cast(pl.Utf8)))
+            update = pl.when(pl.col(source_col).is_not_null()).then(pl.col(source_col)).otherwise(pl.col(col))
         else:
-            updates = result.filter(pl.col(col).is_null() & pl.col(source_col).is_not_null()).height
-            result = result.with_columns(
-                pl.when(pl.col(col).is_null())
-                .then(pl.col(source_col))
-                .otherwise(pl.col(col))
-                .alias(col)
-            )
+            changed = pl.col(col).is_null() & pl.col(source_col).is_not_null()
+            update = pl.when(pl.col(col).is_null()).then(pl.col(source_col)).otherwise(pl.col(col))
+        applied.append((col, overwrite))
+        counters.append(changed.sum().alias(col))
+        update_exprs.append(update.alias(col))
+    counts = result.select(counters).row(0, named=True)
+    print(f"  [{source}] join matches: {counts['_matches']} / {result.height}")
+    if update_exprs:
+        result = result.with_columns(update_exprs)
+
+    for col, overwrite in applied:
+        updates = counts[col]
         totals[col] += updates
         if updates > 0:
             action = "updated" if overwrite else "filled"
@@ -1020,62 +1298,53 @@ def join_and_enrich(target_df: pl.DataFrame, lookup_df: pl.DataFrame, source: st
     return result
 
 
-def process_csv_file(csv_path: str, scimago_lookup: pl.DataFrame, openapc_lookup: pl.DataFrame,
-                     doaj_lookup: pl.DataFrame, dataverse_lookup: pl.DataFrame,
-                     pci_friendly_set: set, totals: dict, disagreement_rows: list) -> None:
-    """Process a single CSV file: enrich with external sources, then write back.
-
-    For each source, compute_presence_and_keys assigns unique join keys via a key-cascade
-    (norm_journal → alt_journal_norm → ISSN-L → e-ISSN → p-ISSN), then join_and_enrich
-    does a single left join and applies enrichment rules. Disagreements between dataset
-    and source values are detected from the joined source columns before cleanup.
-
-    Args:
-        csv_path: Path to the CSV file to process.
-        scimago_lookup: Scimago lookup table (not pre-deduplicated).
-        openapc_lookup: OpenAPC lookup table (already aggregated per journal).
-        doaj_lookup: DOAJ lookup table (not pre-deduplicated).
-        dataverse_lookup: APC Dataverse lookup table (already aggregated per journal).
-        pci_friendly_set: Set of normalized PCI-friendly journal names.
-        totals: Dict accumulating per-column update counts (mutated in-place).
-        disagreement_rows: List accumulating disagreement report dicts (mutated in-place).
-    """
-    print(f"Processing file: {csv_path}")
+def load_target(csv_path: str) -> pl.DataFrame:
+    """Load a data_extracted CSV with all FINAL_COLUMNS, formatted ISSNs and normalized journal names."""
     target_df = load_csv(csv_path, ignore_errors=True)
 
     # Ensure all FINAL_COLUMNS exist (adds missing columns as nulls, e.g. e-ISSN, p-ISSN, ISSN-L)
     target_df = ensure_columns(target_df)
 
-    # Use the canonical FINAL_COLUMNS as the set of output columns
-    original_cols = FINAL_COLUMNS
-
     # Normalize ISSN columns before key computation (format_issn is idempotent)
-    target_df = target_df.with_columns([
-        pl.col("e-ISSN").map_elements(format_issn, return_dtype=pl.Utf8).alias("e-ISSN"),
-        pl.col("p-ISSN").map_elements(format_issn, return_dtype=pl.Utf8).alias("p-ISSN"),
-        pl.col("ISSN-L").map_elements(format_issn, return_dtype=pl.Utf8).alias("ISSN-L"),
-    ])
+    target_df = target_df.with_columns([format_issn_expr(c).alias(c) for c in ["e-ISSN", "p-ISSN", "ISSN-L"]])
 
     # Add normalized journal names for key computation
-    target_df = target_df.with_columns([
-        pl.col("Journal").map_elements(norm_name, return_dtype=pl.Utf8).alias("norm_journal"),
-        pl.when(pl.col("Alternative journal name").is_not_null())
-        .then(pl.col("Alternative journal name").map_elements(norm_name, return_dtype=pl.Utf8))
-        .otherwise(None)
-        .alias("alt_journal_norm"),
+    return target_df.with_columns([
+        norm_name_expr("Journal").alias("norm_journal"),
+        norm_name_expr("Alternative journal name").alias("alt_journal_norm"),
     ])
 
+
+def enrich_target(target_df: pl.DataFrame, source_lookups: list[tuple[str, pl.DataFrame]],
+                  pci_friendly_set: set, totals: dict, disagreement_frames: list,
+                  partition: str | None = None, ledger: pl.DataFrame | None = None,
+                  ledger_frames: list | None = None) -> pl.DataFrame:
+    """Enrich target_df from each source lookup, format it and collect its disagreements.
+
+    For each source, compute_presence_and_keys assigns unique join keys via a key-cascade
+    (norm_journal → alt_journal_norm → ISSN-L → e-ISSN → p-ISSN), then join_and_enrich
+    does a single left join and applies enrichment rules. Disagreements between dataset
+    and source values are detected from the joined source columns before cleanup.
+
+    Args:
+        target_df: DataFrame returned by load_target (or a batch of them, see partition).
+        source_lookups: (source name, lookup table) pairs, in enrichment order.
+        pci_friendly_set: Set of normalized PCI-friendly journal names.
+        totals: Dict accumulating per-column update counts (mutated in-place).
+        disagreement_frames: List accumulating disagreement report frames (mutated in-place).
+        partition: Column naming the file of each row when target_df is a batch of files.
+        ledger: Ledger of the previous run on this file, to reuse its cascade outcomes, or None.
+        ledger_frames: List accumulating the ledger rows of this run (mutated in-place), with ledger.
+
+    Returns:
+        The enriched DataFrame, helper and source columns included.
+    """
     # For each source: compute presence + unique join keys, then do the enrichment join
-    source_lookups = [
-        ("scimago", scimago_lookup),
-        ("openapc", openapc_lookup),
-        ("doaj", doaj_lookup),
-        ("dataverse", dataverse_lookup),
-    ]
     updated_df = target_df
     for source, lookup_df in source_lookups:
         presence_col = SOURCE_PRESENCE_COL.get(source)
-        updated_df, augmented_lookup = compute_presence_and_keys(updated_df, lookup_df, source, presence_col)
+        updated_df, augmented_lookup = compute_presence_and_keys(updated_df, lookup_df, source, presence_col,
+                                                                 partition, ledger, ledger_frames)
         updated_df = join_and_enrich(updated_df, augmented_lookup, source, totals)
 
     # Apply formatting and normalization (format_table also re-formats ISSNs idempotently)
@@ -1083,75 +1352,239 @@ def process_csv_file(csv_path: str, scimago_lookup: pl.DataFrame, openapc_lookup
     # Mark PCI friendly journals
     updated_df = mark_pci_friendly(updated_df, pci_friendly_set)
 
-    # Compute disagreements from enriched values and the source columns still present
+    # Compute disagreements from enriched values and the source columns still present, file by
+    # file for a batch so the report rows come in the same order as with one file at a time
     type_map = build_publisher_type_map()
-    new_rows = compute_disagreements(updated_df, type_map)
-    if new_rows:
-        print(f"  External disagreements found: {len(new_rows)}")
-    disagreement_rows.extend(new_rows)
-
-    # Compute internal Publisher type disagreements (dataset vs country_formatting.json)
-    pt_rows = compute_publisher_type_disagreements(updated_df, type_map)
-    if pt_rows:
-        print(f"  Publisher type disagreements found: {len(pt_rows)}")
-    disagreement_rows.extend(pt_rows)
-
+    for file_df in (updated_df.partition_by(partition, maintain_order=True) if partition else [updated_df]):
+        new_rows = compute_disagreements(file_df, type_map)
+        if new_rows.height:
+            print(f"  External disagreements found: {new_rows.height}")
+        disagreement_frames.append(new_rows)
+
+        # Compute internal Publisher type disagreements (dataset vs country_formatting.json)
+        pt_rows = compute_publisher_type_disagreements(file_df)
+        if pt_rows.height:
+            print(f"  Publisher type disagreements found: {pt_rows.height}")
+        disagreement_frames.append(pt_rows)
+    return updated_df
+
+
+def write_target(updated_df: pl.DataFrame, csv_path: str) -> None:
+    """Write the FINAL_COLUMNS of an enriched DataFrame back to csv_path."""
     # Select original columns only — drops all helper columns (norm_journal, left_key_*, source cols, etc.)
-    final_df = updated_df.select(original_cols)
+    final_df = updated_df.select(FINAL_COLUMNS)
     check_consistency(final_df)
     final_df.write_csv(csv_path)
     print(f"Successfully updated and saved {csv_path}\n")
 
 
+def process_csv_file(csv_path: str, source_lookups: list[tuple[str, pl.DataFrame]],
+                     pci_friendly_set: set, totals: dict, disagreement_frames: list,
+                     incremental: bool = False) -> None:
+    """Process a single CSV file: enrich with external sources, then write back.
+
+    Args:
+        csv_path: Path to the CSV file to process.
+        source_lookups: (source name, lookup table) pairs, see enrich_target.
+        pci_friendly_set: Set of normalized PCI-friendly journal names.
+        totals: Dict accumulating per-column update counts (mutated in-place).
+        disagreement_frames: List accumulating disagreement report frames (mutated in-place).
+        incremental: Reuse the cascade outcomes of the previous run on unchanged rows
+            (see split_by_ledger), and write the ledger of this run.
+    """
+    print(f"Processing file: {csv_path}")
+    ledger = load_ledger(csv_path) if incremental else None
+    ledger_frames = []
+    updated_df = enrich_target(load_target(csv_path), source_lookups, pci_friendly_set, totals, disagreement_frames,
+                               ledger=ledger, ledger_frames=ledger_frames)
+    write_target(updated_df, csv_path)
+    if incremental:
+        save_ledger(ledger_frames, csv_path)
+
+
+def process_csv_files(csv_paths: list[str], source_lookups: list[tuple[str, pl.DataFrame]],
+                      pci_friendly_set: set, totals: dict, disagreement_frames: list) -> None:
+    """Process all CSV files as one batch: the key cascade and each enrichment join run once.
+
+    The files are stacked with a _source_file column, so lookup-side work (counting key
+    values, joining) is done once for the batch instead of once per file. Keys are still
+    matched per file (see partition_candidate_keys), so presence, enrichment, update totals
+    and disagreement rows are the same as with process_csv_file on each file in turn. Each
+    file is then written back from its own rows, in their original order.
+
+    Rows are not deduplicated on their match inputs. The outcome of a row depends on the
+    other rows of its file, not only on its own keys: a key value is only used when it is
+    unique within the file, and a lookup row claimed by one row cannot be claimed by another
+    row of the same file. Two rows with the same keys thus match differently in two files
+    (one may be "Ambiguous" because of a third row of its file), and two such rows in one
+    file make each other "Ambiguous". Collapsing them would change presence and enrichment,
+    so the batch keeps every row and scopes the keys to their file instead.
+
+    Args:
+        csv_paths: Paths of the CSV files to process.
+        source_lookups: (source name, lookup table) pairs, see enrich_target.
+        pci_friendly_set: Set of normalized PCI-friendly journal names.
+        totals: Dict accumulating per-column update counts (mutated in-place).
+        disagreement_frames: List accumulating disagreement report frames (mutated in-place).
+    """
+    targets = []
+    for csv_path in csv_paths:
+        print(f"Processing file: {csv_path}")
+        targets.append(load_target(csv_path).with_columns(pl.lit(csv_path).alias("_source_file")))
+
+    # Columns inferred with different types in different files are stacked as strings
+    # rather than cast to a common supertype (e.g. Int64 values written back as floats)
+    dtypes = defaultdict(set)
+    for df in targets:
+        for col, dtype in df.schema.items():
+            if dtype != pl.Null:
+                dtypes[col].add(dtype)
+    mixed = [col for col, types in dtypes.items() if len(types) > 1]
+    if mixed:
+        print(f"  Columns with mixed types across files, stacked as strings: {mixed}")
+    batch_df = pl.concat([df.with_columns([pl.col(c).cast(pl.Utf8) for c in mixed if c in df.columns])
+                          for df in targets], how="diagonal_relaxed")
+    print(f"  Batch of {len(csv_paths)} files: {batch_df.height} rows")
+
+    updated_df = enrich_target(batch_df, source_lookups, pci_friendly_set, totals, disagreement_frames,
+                               partition="_source_file")
+    for csv_path in csv_paths:
+        write_target(updated_df.filter(pl.col("_source_file") == csv_path), csv_path)
+
+
+# Lookup tables and PCI-friendly set of an enrichment worker process (see init_enrich_worker)
+_worker_state: dict = {}
+
+
+def init_enrich_worker(lookup_paths: dict[str, Path], pci_friendly_set: set) -> None:
+    """Pool initializer of enrich_csv_file_worker: memory-map the cached SOURCE_LOOKUPS tables once per worker."""
+    _worker_state["source_lookups"] = [(source, pl.read_ipc(lookup_paths[name]))
+                                       for source, name in SOURCE_LOOKUPS.items()]
+    _worker_state["pci_friendly_set"] = pci_friendly_set
+
+
+def enrich_csv_file_worker(csv_path: str, incremental: bool) -> tuple[str, dict, list[bytes], dict]:
+    """Worker entry point of process_csv_file.
+
+    Returns:
+        The captured log, the update totals of the file, its disagreement frames as Arrow IPC
+        and the memo_updates of the worker.
+    """
+    totals = {col: 0 for col in COLUMNS_TO_UPDATE}
+    disagreement_frames = []
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        process_csv_file(csv_path, _worker_state["source_lookups"], _worker_state["pci_friendly_set"],
+                         totals, disagreement_frames, incremental)
+    return log.getvalue(), totals, [df.write_ipc(None).getvalue() for df in disagreement_frames], memo_updates()
+
+
+def process_csv_files_in_pool(csv_paths: list[str], pci_friendly_set: set, totals: dict,
+                              disagreement_frames: list, jobs: int, incremental: bool = False) -> None:
+    """Run process_csv_file on each of csv_paths in jobs worker processes.
+
+    The lookup tables must already be in their Arrow IPC cache (see load_lookups): each worker
+    memory-maps them instead of receiving a copy. Worker logs, update totals, disagreement frames
+    and memos are reduced in csv_paths order, so the output is the same as a serial run.
+
+    Args:
+        csv_paths: Paths of the CSV files to process.
+        pci_friendly_set: Set of normalized PCI-friendly journal names.
+        totals: Dict accumulating per-column update counts (mutated in-place).
+        disagreement_frames: List accumulating disagreement report frames (mutated in-place).
+        jobs: Number of worker processes.
+        incremental: see process_csv_file.
+    """
+    lookup_paths = {name: lookup_cache_path(name, files + LOOKUP_CODE_FILES, *extra)
+                    for name, (_, _, files, extra) in LOOKUPS.items()}
+    assert all(path.exists() for path in lookup_paths.values()), "Lookup tables must be cached before enriching"
+    # spawn, not fork: forking after Polars started its thread pool can deadlock
+    with ProcessPoolExecutor(max_workers=min(jobs, len(csv_paths)),
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=init_enrich_worker, initargs=(lookup_paths, pci_friendly_set)) as pool:
+        futures = [pool.submit(enrich_csv_file_worker, csv_path, incremental) for csv_path in csv_paths]
+        for future in futures:
+            log, file_totals, frames, updates = future.result()
+            print(log, end="")
+            merge_memo_updates(updates)
+            for col, count in file_totals.items():
+                totals[col] += count
+            disagreement_frames.extend(pl.read_ipc(io.BytesIO(frame)) for frame in frames)
+
+
 def main():
     """Main function to update Scimago and OpenAPC information in CSV files."""
-    print("Starting script to update Scimago, OpenAPC, and DOAJ info...")
-
-    # Load lookup tables
-    pci_friendly_set = load_pci_friendly_set()
-    scimago_lookup = load_scimago_lookup()
-    print(f"Successfully loaded and processed Scimago data from {SCIMAGO_FILE}")
+    parser = argparse.ArgumentParser(description="Enrich data_extracted/ with Scimago, OpenAPC, DOAJ and Dataverse.")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Number of processes used to build the source lookup tables and, unless --batched, "
+             "to enrich the CSV files (default: 1).",
+    )
+    parser.add_argument(
+        "--batched", action="store_true",
+        help="Match and enrich all CSV files as one batch instead of file by file.",
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Only run the key cascade on rows whose keys changed since the previous run, and on the rows "
+             f"they could affect; the other rows reuse the outcomes recorded in {LEDGER_DIR}/.",
+    )
+    args = parser.parse_args()
+    if args.incremental and args.batched:
+        parser.error("--incremental matches files one by one and cannot be combined with --batched")
 
-    openapc_lookup = load_openapc_lookup()
-    print(f"Successfully loaded and processed OpenAPC data from {OPENAPC_FILE}")
+    print("Starting script to update Scimago, OpenAPC, and DOAJ info...")
+    print(f"Columns to update: {COLUMNS_TO_UPDATE}")
 
-    doaj_lookup = load_doaj_lookup()
-    print(f"Successfully loaded and processed DOAJ data from {DOAJ_FILE}")
+    # Before any worker process loads a memo
+    evict_stale_memos()
 
-    dataverse_lookup = load_dataverse_lookup()
-    print(f"Successfully loaded and processed Dataverse data from {DATAVERSE_FILE}")
+    # Load lookup tables
+    pci_friendly_set = build_pci_friendly_set(sources.pci_friendly())
+    # Processed lookups are cached under the hash of their source, ISSN type and code files
+    lookups = load_lookups(args.jobs)
+    source_lookups = [(source, lookups[name]) for source, name in SOURCE_LOOKUPS.items()]
 
     # Initialize totals for tracking updates
     totals = {col: 0 for col in COLUMNS_TO_UPDATE}
-    disagreement_rows: list[dict] = []
+    disagreement_frames: list[pl.DataFrame] = []
 
     # Process each CSV file in the data_extracted directory
+    csv_paths = []
     for csv_path in sorted(glob(os.path.join(DATA_EXTRACTED_DIR, "*.csv"))):
         filename = os.path.basename(csv_path)
         if filename in FILES_TO_SKIP:
             print(f"Skipping file: {filename}")
             continue
-
-        process_csv_file(csv_path, scimago_lookup, openapc_lookup, doaj_lookup, dataverse_lookup,
-                         pci_friendly_set, totals, disagreement_rows)
+        csv_paths.append(csv_path)
+    if args.incremental:
+        prune_ledgers(csv_paths)
+
+    if args.batched:
+        process_csv_files(csv_paths, source_lookups, pci_friendly_set, totals, disagreement_frames)
+    elif args.jobs > 1 and len(csv_paths) > 1:
+        process_csv_files_in_pool(csv_paths, pci_friendly_set, totals, disagreement_frames, args.jobs,
+                                  args.incremental)
+    else:
+        for csv_path in csv_paths:
+            process_csv_file(csv_path, source_lookups, pci_friendly_set, totals, disagreement_frames,
+                             args.incremental)
 
     # Write disagreement report
     os.makedirs("logs", exist_ok=True)
     report_path = os.path.join("logs", "disagreements.csv")
-    if disagreement_rows:
-        report_df = pl.DataFrame(disagreement_rows, schema=REPORT_SCHEMA)
-    else:
-        report_df = pl.DataFrame(schema=REPORT_SCHEMA)
+    report_df = pl.concat([pl.DataFrame(schema=REPORT_SCHEMA)] + disagreement_frames)
     assert report_df.columns == list(REPORT_SCHEMA.keys()), f"Disagreement col mismatch: {report_df.columns}"
     # Sort by priority (Utmost priority first), then by column, then by journal
     report_df = report_df.with_columns(
-        pl.col("priority").map_elements(
-            lambda p: {"Utmost priority": 0, "Highest": 1, "High": 2, "Medium": 3, "Low": 4}.get(p, 5),
-            return_dtype=pl.Int64
-        ).alias("_ps")
-    ).sort(["_ps", "column", "journal"]).drop("_ps")
+        pl.col("priority").replace_strict(REPORT_PRIORITY_ORDER, default=len(REPORT_PRIORITY_ORDER),
+                                          return_dtype=pl.Int64).alias("_ps")
+    ).sort(["_ps", "column", "journal"], maintain_order=True).drop("_ps")
     report_df.write_csv(report_path)
-    print(f"\nDisagreement report written to {report_path} ({len(disagreement_rows)} rows).")
+    print(f"\nDisagreement report written to {report_path} ({report_df.height} rows).")
+
+    # Persist normalizer results for the next run
+    save_normalizer_memos()
 
     # Print summary
     print("\nScript finished.")